@@ -54,51 +54,104 @@ while read -r file; do
     fi
 done < ./tmp_import_analysis/files_with_imports.txt
 
-# Détection des cycles avec Python
-cat > ./tmp_import_analysis/find_cycles.py << EOF
-import sys
-from collections import defaultdict
+# Outils de graphe partagés par les scripts Python
+cat > ./tmp_import_analysis/graph.py << EOF
+"""
+Outils de graphe partagés par find_cycles.py et generate_report.py.
+"""
 
-def find_cycles(graph):
-    """Trouve les cycles dans un graphe dirigé."""
-    visited = set()
-    path = []
-    path_set = set()
-    cycles = []
+def sccs(graph):
+    """Calcule les composantes fortement connexes (Tarjan itératif, sans récursion)."""
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
     
-    def dfs(node):
-        if node in path_set:
-            # Cycle trouvé
-            cycle_start = path.index(node)
-            cycles.append(path[cycle_start:] + [node])
-            return
-        
-        if node in visited:
-            return
-        
-        visited.add(node)
-        path.append(node)
-        path_set.add(node)
+    for root in graph:
+        if root in index:
+            continue
         
-        for neighbor in graph.get(node, []):
-            dfs(neighbor)
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
         
-        path.pop()
-        path_set.remove(node)
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    # Descendre dans le voisin, reprendre ce nœud ensuite
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                # Tous les voisins traités
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
     
+    return components
+EOF
+
+# Détection des cycles avec Python
+cat > ./tmp_import_analysis/find_cycles.py << EOF
+import sys
+
+from graph import sccs
+
+def cycle_in_component(graph, component):
+    """Retourne le plus court cycle passant par la racine d'une composante."""
+    start = component[-1]
+    members = set(component)
+    previous = {start: None}
+    queue = [start]
+    for node in queue:
+        for neighbor in graph.get(node, ()):
+            if neighbor == start:
+                path = [node]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])
+                path.reverse()
+                return path + [start]
+            if neighbor in members and neighbor not in previous:
+                previous[neighbor] = node
+                queue.append(neighbor)
+    return None
+
+def find_cycles(graph_file):
+    """Trouve les cycles dans le graphe d'imports décrit par un fichier."""
     # Construire le graphe à partir du fichier
-    adj_list = defaultdict(list)
-    with open(sys.argv[1], 'r') as f:
+    graph = {}
+    with open(graph_file, 'r', buffering=1 << 20) as f:
         for line in f:
-            line = line.strip()
-            if ' -> ' in line:
-                source, target = line.split(' -> ')
-                adj_list[source].append(target)
+            source, sep, target = line.strip().partition(' -> ')
+            if sep:
+                graph.setdefault(source, []).append(target)
     
-    # Rechercher les cycles à partir de chaque nœud
-    for node in adj_list:
-        if node not in visited:
-            dfs(node)
+    # Un cycle par composante de plusieurs modules, ou par module qui s'importe lui-même
+    cycles = []
+    for component in sccs(graph):
+        if len(component) > 1 or component[0] in graph.get(component[0], ()):
+            cycles.append(cycle_in_component(graph, component))
     
     return cycles
 
@@ -128,65 +181,69 @@ echo "📊 Génération du rapport détaillé..."
 cat > ./tmp_import_analysis/generate_report.py << EOF
 import os
 import sys
-from collections import defaultdict
+
+from graph import sccs
 
 def generate_report():
     """Génère un rapport détaillé des imports."""
     
     # Construire le graphe à partir du fichier
-    graph = defaultdict(list)
-    reverse_graph = defaultdict(list)
+    graph = {}
+    reverse_graph = {}
     
-    with open("./tmp_import_analysis/import_graph.txt", 'r') as f:
+    # Graphes direct et inverse construits en un seul passage
+    with open("./tmp_import_analysis/import_graph.txt", 'r', buffering=1 << 20) as f:
         for line in f:
-            line = line.strip()
-            if ' -> ' in line:
-                source, target = line.split(' -> ')
-                graph[source].append(target)
-                reverse_graph[target].append(source)
+            source, sep, target = line.strip().partition(' -> ')
+            if sep:
+                graph.setdefault(source, []).append(target)
+                reverse_graph.setdefault(target, []).append(source)
     
-    # Identifier les modules problématiques
-    problematic_modules = set()
-    for source in graph:
-        for target in graph[source]:
-            if source in reverse_graph.get(target, []):
-                problematic_modules.add(source)
-                problematic_modules.add(target)
+    # Identifier les modules problématiques: ceux qui appartiennent à un cycle
+    # (composante fortement connexe de plusieurs modules, ou import de soi-même)
+    problematic_modules = {
+        module
+        for component in sccs(graph)
+        if len(component) > 1 or component[0] in graph.get(component[0], ())
+        for module in component
+    }
     
-    # Générer le rapport
-    with open("import_cycles_report.md", 'w') as f:
-        f.write("# Analyse des Cycles d'Imports\n\n")
-        
-        if not problematic_modules:
-            f.write("📊 **Aucun cycle d'import détecté !** 🎉\n")
-            return
-        
-        f.write(f"## Modules problématiques ({len(problematic_modules)})\n\n")
+    # Générer le rapport en mémoire, puis l'écrire en une fois
+    lines = ["# Analyse des Cycles d'Imports", ""]
+    
+    if not problematic_modules:
+        lines.append("📊 **Aucun cycle d'import détecté !** 🎉")
+    else:
+        lines += [f"## Modules problématiques ({len(problematic_modules)})", ""]
         
         for module in sorted(problematic_modules):
-            f.write(f"### {module}\n\n")
-            f.write("#### Importe:\n")
-            for target in sorted(graph.get(module, [])):
-                if target in problematic_modules:
-                    f.write(f"- **{target}** ⚠️\n")
-                else:
-                    f.write(f"- {target}\n")
+            lines += [f"### {module}", "", "#### Importe:"]
+            lines.extend(
+                f"- **{target}** ⚠️" if target in problematic_modules else f"- {target}"
+                for target in sorted(graph.get(module, []))
+            )
             
-            f.write("\n#### Importé par:\n")
-            for source in sorted(reverse_graph.get(module, [])):
-                if source in problematic_modules:
-                    f.write(f"- **{source}** ⚠️\n")
-                else:
-                    f.write(f"- {source}\n")
+            lines += ["", "#### Importé par:"]
+            lines.extend(
+                f"- **{source}** ⚠️" if source in problematic_modules else f"- {source}"
+                for source in sorted(reverse_graph.get(module, []))
+            )
             
-            f.write("\n")
+            lines.append("")
         
-        f.write("## Recommandations\n\n")
-        f.write("Pour résoudre les cycles d'imports:\n\n")
-        f.write("1. Utiliser l'import tardif (lazy import) dans les méthodes plutôt qu'au niveau du module\n")
-        f.write("2. Restructurer en déplaçant certaines fonctionnalités vers des modules intermédiaires\n")
-        f.write("3. Implémenter un pattern d'injection de dépendances\n")
-        f.write("4. Utiliser des interfaces abstraites\n")
+        lines += [
+            "## Recommandations",
+            "",
+            "Pour résoudre les cycles d'imports:",
+            "",
+            "1. Utiliser l'import tardif (lazy import) dans les méthodes plutôt qu'au niveau du module",
+            "2. Restructurer en déplaçant certaines fonctionnalités vers des modules intermédiaires",
+            "3. Implémenter un pattern d'injection de dépendances",
+            "4. Utiliser des interfaces abstraites",
+        ]
+    
+    with open("import_cycles_report.md", 'w') as f:
+        f.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     generate_report()
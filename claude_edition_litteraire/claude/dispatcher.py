@@ -4,12 +4,13 @@ import logging
 import functools
 from datetime import datetime
 
+logger = logging.getLogger("claude_dispatcher")
+
 def trace_call(func):
     """Décorateur simple pour tracer les appels de fonction."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         start_time = datetime.now()
-        logger = logging.getLogger("claude_dispatcher")
         logger.info(f"DÉBUT: {func.__name__}")
         
         try:
@@ -2,8 +2,9 @@
 Gestionnaire principal pour l'interaction avec Claude.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -45,3 +46,58 @@ class ClaudeManager:
         except Exception as e:
             logger.error(f"Erreur lors de l'analyse de contenu: {e}")
             return f"Erreur: {str(e)}"
+    
+    def _aspect_conversations(self, content: str, instructions: List[str]) -> List[List[Dict[str, Any]]]:
+        """Construit une conversation par axe d'analyse."""
+        return [
+            [
+                {"role": "system", "content": instruction},
+                {"role": "user", "content": content}
+            ]
+            for instruction in instructions
+        ]
+    
+    async def aanalyze_content_aspects(self, content: str, instructions: List[str]) -> List[str]:
+        """
+        Analyse un contenu selon plusieurs axes indépendants, en parallèle.
+        
+        Chaque instruction fait l'objet d'une requête séparée plutôt que
+        d'un prompt unique énumérant tous les axes.
+        
+        Args:
+            content: Contenu à analyser
+            instructions: Une instruction par axe d'analyse
+            
+        Returns:
+            Résultat de chaque analyse, dans l'ordre des instructions
+        """
+        return await self.project.llm.achat_many(self._aspect_conversations(content, instructions))
+    
+    def analyze_content_aspects(self, content: str, instructions: List[str]) -> List[str]:
+        """
+        Version synchrone de aanalyze_content_aspects.
+        
+        Depuis une boucle asyncio déjà active (application asynchrone, Jupyter),
+        les axes sont analysés l'un après l'autre avec chat; utiliser plutôt
+        aanalyze_content_aspects dans ce cas.
+        
+        Args:
+            content: Contenu à analyser
+            instructions: Une instruction par axe d'analyse
+            
+        Returns:
+            Résultat de chaque analyse, dans l'ordre des instructions
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aanalyze_content_aspects(content, instructions))
+        
+        logger.warning(
+            "Boucle asyncio active: analyse séquentielle. "
+            "Utilisez aanalyze_content_aspects pour des requêtes parallèles."
+        )
+        return [
+            self.project.llm.chat(messages)
+            for messages in self._aspect_conversations(content, instructions)
+        ]
@@ -7,5 +7,6 @@ APIs de modèles de langage, comme Claude, LMStudio, etc.
 """
 
 from .unified_llm import UnifiedLLM
+from .response_cache import ResponseCache
 
-__all__ = ["UnifiedLLM"]
\ No newline at end of file
+__all__ = ["UnifiedLLM", "ResponseCache"]
\ No newline at end of file
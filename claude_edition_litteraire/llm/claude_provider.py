@@ -47,6 +47,7 @@ class ClaudeProvider(LLMProvider):
             )
         
         self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
         self.default_model = default_model or CLAUDE_MODELS["default"]
         logger.info(f"ClaudeProvider initialisé avec le modèle par défaut: {self.default_model}")
     
@@ -166,6 +167,49 @@ class ClaudeProvider(LLMProvider):
             # Si c'est déjà le modèle par défaut ou une autre erreur, la propager
             raise
     
+    async def achat(self, messages: List[Dict[str, Any]], 
+                    max_tokens: int = 1000, 
+                    temperature: float = 0.7,
+                    model_name: Optional[str] = None) -> str:
+        """
+        Envoie une conversation à Claude via le client asynchrone.
+        
+        Args:
+            messages: Liste de messages de la conversation
+            max_tokens: Nombre maximum de tokens pour la réponse
+            temperature: Température pour la génération (0.0-1.0)
+            model_name: Nom du modèle à utiliser (si None, utilise le modèle par défaut)
+            
+        Returns:
+            Texte de réponse
+        """
+        claude_messages = self._convert_messages(messages)
+        actual_model = self._resolve_model_name(model_name)
+        
+        try:
+            response = await self.async_client.messages.create(
+                max_tokens=max_tokens,
+                messages=claude_messages,
+                model=actual_model,
+                temperature=temperature
+            )
+            
+            return response.content[0].text
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de l'appel à l'API Claude avec le modèle {actual_model}: {e}")
+            
+            if "not_found_error" in str(e) and model_name is not None:
+                logger.warning(f"Tentative avec le modèle par défaut: {self.default_model}")
+                return await self.achat(
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    model_name=None
+                )
+            
+            raise
+    
     def embed(self, text: str, model_name: Optional[str] = None) -> List[float]:
         """
         Génère un embedding avec l'API Claude.
@@ -175,6 +175,20 @@ class LMStudioProvider(LLMProvider):
         else:
             return simulated_response
     
+    async def achat(self, messages: List[Dict[str, Any]], 
+                    max_tokens: int = 1000, 
+                    temperature: float = 0.7) -> str:
+        """
+        Version asynchrone de chat.
+        
+        Le SDK lmstudio est synchrone: l'appel réel passe par un thread,
+        la simulation répond directement.
+        """
+        if not self.lmstudio_available:
+            return self._simulated_chat(messages, max_tokens, temperature)
+        
+        return await super().achat(messages, max_tokens=max_tokens, temperature=temperature)
+    
     def embed(self, text: str, model_name: Optional[str] = None) -> List[float]:
         """
         Génère un embedding avec LMStudio.
@@ -3,8 +3,19 @@
 Interface abstraite pour les fournisseurs de LLM.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union, Iterator
+from functools import partial
+from typing import Dict, List, Any, Optional, Union, Iterator, Callable
+
+async def run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Exécute une fonction synchrone dans le pool de threads de la boucle courante.
+    
+    Équivalent de asyncio.to_thread, disponible à partir de Python 3.9 seulement.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
 class LLMProvider(ABC):
     """Interface abstraite pour les fournisseurs de LLM."""
@@ -50,4 +61,38 @@ class LLMProvider(ABC):
         Returns:
             Liste des noms de modèles
         """
-        pass
\ No newline at end of file
+        pass
+    
+    async def achat(self, messages: List[Dict[str, Any]], 
+                    max_tokens: int = 1000, 
+                    temperature: float = 0.7) -> str:
+        """
+        Version asynchrone de chat (sans streaming).
+        
+        Par défaut, exécute chat dans un thread; les fournisseurs disposant
+        d'un client asynchrone redéfinissent cette méthode.
+        
+        Args:
+            messages: Liste de messages de la conversation
+            max_tokens: Nombre maximum de tokens pour la réponse
+            temperature: Température pour la génération (0.0-1.0)
+            
+        Returns:
+            Texte de réponse
+        """
+        return await run_in_thread(
+            self.chat, messages, max_tokens=max_tokens, temperature=temperature
+        )
+    
+    async def aembed(self, text: str, model_name: Optional[str] = None) -> List[float]:
+        """
+        Version asynchrone de embed.
+        
+        Args:
+            text: Texte à encoder
+            model_name: Nom du modèle d'embedding (optionnel)
+            
+        Returns:
+            Liste de valeurs d'embedding
+        """
+        return await run_in_thread(self.embed, text, model_name)
\ No newline at end of file
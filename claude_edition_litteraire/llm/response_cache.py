@@ -0,0 +1,85 @@
+"""
+Cache des réponses des LLMs pour les conversations déjà envoyées.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional
+
+class ResponseCache:
+    """
+    Cache LRU des réponses, indexé par la conversation exacte et les paramètres d'appel.
+    
+    Une conversation identique (après compression du contexte) renvoie la réponse
+    mémorisée sans appeler le fournisseur.
+    """
+    
+    def __init__(self, max_cache_size: int = 1000):
+        """
+        Initialise le cache.
+        
+        Args:
+            max_cache_size: Nombre maximum de réponses conservées
+        """
+        self.max_cache_size = max_cache_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(provider: str, messages: List[Dict[str, Any]], **params: Any) -> str:
+        """
+        Construit la clé d'une requête.
+        
+        Args:
+            provider: Nom du fournisseur
+            messages: Messages envoyés au fournisseur
+            **params: Paramètres de l'appel (max_tokens, temperature, ...)
+            
+        Returns:
+            Clé canonique de la requête
+        """
+        return json.dumps([provider, messages, params], sort_keys=True, ensure_ascii=False, default=str)
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Récupère une réponse mémorisée.
+        
+        Args:
+            key: Clé de la requête
+            
+        Returns:
+            Réponse mémorisée, ou None si absente
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+    
+    def put(self, key: str, response: str) -> None:
+        """
+        Mémorise une réponse, en évinçant la plus ancienne si le cache est plein.
+        
+        Args:
+            key: Clé de la requête
+            response: Réponse du fournisseur
+        """
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_cache_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,52 +4,71 @@ Interface unifiée pour interagir avec différents modèles de langage (LLMs).
 """
 
 import os
+import asyncio
+import inspect
 import logging
-from typing import Dict, List, Any, Optional, Union, Iterator
+from functools import partial
+from typing import Dict, List, Any, Optional, Union, Iterator, Callable
 
-from .provider import LLMProvider
+from .provider import LLMProvider, run_in_thread
 from .claude_provider import ClaudeProvider
 from .lmstudio_provider import LMStudioProvider
 from .context import ContextCompressor
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Table de construction des fournisseurs: nom -> factory(api_key, api_url)
+_PROVIDER_FACTORIES: Dict[str, Callable[[Optional[str], Optional[str]], LLMProvider]] = {
+    "claude": lambda api_key, api_url: ClaudeProvider(api_key),
+    "lmstudio": lambda api_key, api_url: LMStudioProvider(api_url),
+}
+
+# Rôles acceptés par create_message
+_VALID_ROLES = frozenset(("user", "assistant", "system"))
+
 class UnifiedLLM:
     """
     Interface unifiée pour interagir avec différents LLMs.
     Permet de basculer facilement entre différents fournisseurs.
     """
     
-    def __init__(self, provider: str = "auto", api_key: Optional[str] = None):
+    # Cache des réponses (désactivé par défaut)
+    response_cache: Optional[ResponseCache] = None
+    
+    def __init__(self, provider: str = "auto", api_key: Optional[str] = None,
+                 api_url: Optional[str] = None,
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialise le client UnifiedLLM.
         
         Args:
             provider: Le fournisseur à utiliser ('claude', 'lmstudio', 'auto')
             api_key: Clé API pour les fournisseurs cloud (Claude)
+            api_url: URL de l'API pour les fournisseurs locaux (LMStudio)
+            response_cache: Cache des réponses pour les conversations répétées (optionnel)
+        
+        Raises:
+            ValueError: Si le fournisseur est inconnu ou si aucun n'est disponible
         """
+        if provider != "auto" and provider not in _PROVIDER_FACTORIES:
+            raise ValueError(
+                f"Fournisseur inconnu '{provider}'. "
+                f"Disponibles: {list(_PROVIDER_FACTORIES.keys())}"
+            )
+        
         self.providers = {}
         
         # Initialiser les fournisseurs disponibles
-        try:
-            # Essayer d'initialiser Claude
-            if provider in ["claude", "auto"]:
-                self.providers["claude"] = ClaudeProvider(api_key, self.config.get("claude.model", "claude-3-5-sonnet-20241022"))
-        except (ImportError, ValueError) as e:
-            if provider == "claude":
-                logger.error(f"Impossible d'initialiser Claude: {e}")
-                raise
-            logger.warning(f"Claude non disponible: {e}")
-        
-        try:
-            # Essayer d'initialiser LMStudio
-            if provider in ["lmstudio", "auto"]:
-                self.providers["lmstudio"] = LMStudioProvider()
-        except ImportError as e:
-            if provider == "lmstudio":
-                logger.error(f"Impossible d'initialiser LMStudio: {e}")
-                raise
-            logger.warning(f"LMStudio non disponible: {e}")
+        names = list(_PROVIDER_FACTORIES.keys()) if provider == "auto" else [provider]
+        for name in names:
+            try:
+                self.providers[name] = _PROVIDER_FACTORIES[name](api_key, api_url)
+            except (ImportError, ValueError) as e:
+                if provider == name:
+                    logger.error(f"Impossible d'initialiser {name}: {e}")
+                    raise
+                logger.warning(f"{name} non disponible: {e}")
         
         # Vérifier qu'au moins un fournisseur est disponible
         if not self.providers:
@@ -66,15 +85,33 @@ class UnifiedLLM:
             else:
                 self.active_provider = next(iter(self.providers.keys()))
         else:
-            if provider not in self.providers:
-                raise ValueError(f"Fournisseur demandé '{provider}' non disponible")
             self.active_provider = provider
         
         # Initialiser le compresseur de contexte
         self.context_compressor = ContextCompressor()
+        self.response_cache = response_cache
         
         logger.info(f"UnifiedLLM initialisé avec fournisseur: {self.active_provider}")
     
+    @property
+    def active_provider(self) -> str:
+        """Nom du fournisseur actif."""
+        return self._active_provider
+    
+    @active_provider.setter
+    def active_provider(self, provider: str) -> None:
+        # Lier une fois les méthodes du fournisseur pour éviter les recherches
+        # dans self.providers à chaque appel
+        active = self.providers[provider]
+        self._active_provider = provider
+        self._active_chat = active.chat
+        self._active_embed = active.embed
+        # Fournisseurs sans coroutines achat/aembed: chat/embed dans un thread
+        achat = getattr(active, "achat", None)
+        aembed = getattr(active, "aembed", None)
+        self._active_achat = achat if inspect.iscoroutinefunction(achat) else partial(run_in_thread, active.chat)
+        self._active_aembed = aembed if inspect.iscoroutinefunction(aembed) else partial(run_in_thread, active.embed)
+    
     def get_provider(self) -> str:
         """
         Récupère le nom du fournisseur actuellement utilisé.
@@ -123,10 +160,100 @@ class UnifiedLLM:
         Returns:
             Texte de réponse ou itérateur sur les fragments
         """
-        # Récupérer le fournisseur actif
-        provider = self.providers[self.active_provider]
+        messages = self._prepare_messages(messages, compress_context, target_token_limit)
+        
+        # Une conversation déjà envoyée (après compression) réutilise la réponse mémorisée
+        cache_key = None if stream else self._cache_key(messages, max_tokens, temperature)
+        if cache_key is not None:
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+        
+        # Appeler le fournisseur
+        response = self._active_chat(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=stream
+        )
+        
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response)
+        
+        return response
+    
+    async def achat(self, messages: List[Dict[str, Any]], 
+                    max_tokens: int = 1000, 
+                    temperature: float = 0.7,
+                    compress_context: bool = True,
+                    target_token_limit: int = 5000) -> str:
+        """
+        Version asynchrone de chat (sans streaming).
+        
+        Permet de lancer plusieurs conversations en parallèle avec asyncio.gather.
+        
+        Args:
+            messages: Liste de messages de la conversation
+            max_tokens: Nombre maximum de tokens pour la réponse
+            temperature: Température pour la génération (0.0-1.0)
+            compress_context: Si True, compresse le contexte
+            target_token_limit: Limite de tokens pour la compression
+            
+        Returns:
+            Texte de réponse
+        """
+        messages = self._prepare_messages(messages, compress_context, target_token_limit)
+        
+        cache_key = self._cache_key(messages, max_tokens, temperature)
+        if cache_key is not None:
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+        
+        response = await self._active_achat(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response)
+        
+        return response
+    
+    async def achat_many(self, conversations: List[List[Dict[str, Any]]],
+                         **kwargs: Any) -> List[str]:
+        """
+        Envoie plusieurs conversations indépendantes en parallèle.
         
-        # Compresser le contexte si demandé
+        Des questions indépendantes posées séparément sont décodées en même
+        temps: la latence totale est celle de la plus longue réponse.
+        
+        Args:
+            conversations: Liste de conversations (listes de messages)
+            **kwargs: Paramètres transmis à achat (max_tokens, temperature...)
+            
+        Returns:
+            Réponses, dans l'ordre des conversations
+        """
+        return list(await asyncio.gather(
+            *(self.achat(messages, **kwargs) for messages in conversations)
+        ))
+    
+    def _prepare_messages(self, messages: List[Dict[str, Any]],
+                          compress_context: bool,
+                          target_token_limit: int) -> List[Dict[str, Any]]:
+        """
+        Compresse le contexte de la conversation si demandé.
+        
+        Args:
+            messages: Liste de messages de la conversation
+            compress_context: Si True, compresse le contexte
+            target_token_limit: Limite de tokens pour la compression
+            
+        Returns:
+            Liste de messages à envoyer au fournisseur
+        """
         if compress_context and len(messages) > 3:
             # On considère le dernier message comme la requête courante
             current_query = messages[-1].get("content", "") if messages[-1].get("role") == "user" else ""
@@ -139,12 +266,19 @@ class UnifiedLLM:
             if current_query:
                 messages.append({"role": "user", "content": current_query})
         
-        # Appeler le fournisseur
-        return provider.chat(
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            stream=stream
+        return messages
+    
+    def _cache_key(self, messages: List[Dict[str, Any]],
+                   max_tokens: int, temperature: float) -> Optional[str]:
+        """
+        Calcule la clé du cache des réponses, ou None si le cache est désactivé.
+        """
+        if self.response_cache is None:
+            return None
+        
+        return ResponseCache.make_key(
+            self.active_provider, messages,
+            max_tokens=max_tokens, temperature=temperature
         )
     
     def embed(self, text: str, model_name: Optional[str] = None) -> List[float]:
@@ -158,8 +292,20 @@ class UnifiedLLM:
         Returns:
             Liste de valeurs d'embedding
         """
-        provider = self.providers[self.active_provider]
-        return provider.embed(text, model_name)
+        return self._active_embed(text, model_name)
+    
+    async def aembed(self, text: str, model_name: Optional[str] = None) -> List[float]:
+        """
+        Version asynchrone de embed.
+        
+        Args:
+            text: Texte à encoder
+            model_name: Nom du modèle d'embedding (optionnel)
+            
+        Returns:
+            Liste de valeurs d'embedding
+        """
+        return await self._active_aembed(text, model_name)
     
     def supported_models(self) -> List[str]:
         """
@@ -182,7 +328,7 @@ class UnifiedLLM:
         Returns:
             Message formaté
         """
-        if role not in ['user', 'assistant', 'system']:
+        if role not in _VALID_ROLES:
             raise ValueError(f"Rôle '{role}' non valide. Utilisez 'user', 'assistant' ou 'system'.")
         
         return {
@@ -190,25 +336,25 @@ class UnifiedLLM:
             "content": content
         }
     
-def optimize_context(self, messages: List[Dict[str, Any]], 
-                   current_query: str, 
-                   strategy: str = "hybrid",
-                   target_token_limit: int = 5000) -> List[Dict[str, Any]]:
-    """
-    Optimise le contexte de conversation selon une stratégie choisie.
+    def optimize_context(self, messages: List[Dict[str, Any]], 
+                         current_query: str, 
+                         strategy: str = "hybrid",
+                         target_token_limit: int = 5000) -> List[Dict[str, Any]]:
+        """
+        Optimise le contexte de conversation selon une stratégie choisie.
     
-    Args:
-        messages: Liste des messages de la conversation
-        current_query: Requête actuelle
-        strategy: Stratégie d'optimisation ('sliding', 'relevance', 'hybrid')
-        target_token_limit: Limite de tokens cible
+        Args:
+            messages: Liste des messages de la conversation
+            current_query: Requête actuelle
+            strategy: Stratégie d'optimisation ('sliding', 'relevance', 'hybrid')
+            target_token_limit: Limite de tokens cible
         
-    Returns:
-        Liste de messages optimisée
-    """
-    return self.context_compressor.compress_by_strategy(
-        messages,
-        current_query,
-        target_token_limit,
-        strategy
-    )
\ No newline at end of file
+        Returns:
+            Liste de messages optimisée
+        """
+        return self.context_compressor.compress_by_strategy(
+            messages,
+            current_query,
+            target_token_limit,
+            strategy
+        )
@@ -8,7 +8,7 @@ les fichiers requis, les liens cassés, etc.
 
 from .validator import validate_structure, validate_templates, validate_frontmatter, check_broken_links
 from .fixer import fix_missing_dirs, fix_missing_files, fix_broken_links, create_missing_file
-from .reporter import generate_structure_report, generate_correction_plan, group_issues_by_pattern
+from .reporter import generate_structure_report, generate_both_reports, generate_correction_plan, group_issues_by_pattern
 from .project_structure import ProjectStructure
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
     "fix_broken_links",
     "create_missing_file",
     "generate_structure_report",
+    "generate_both_reports",
     "generate_correction_plan",
     "group_issues_by_pattern"
 ]
\ No newline at end of file
@@ -6,17 +6,248 @@ Module de correction automatique des problèmes de structure.
 import os
 import re
 import shutil
+import difflib
+import functools
+import string
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Callable, Tuple
+from pathlib import Path, PurePath
+from typing import Dict, List, Optional, Any, Union, Callable, Tuple, Set
 
+from .validator import SKIP_DIRS
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Liens wiki [[cible|texte]] (groupes 1-2) ou markdown [texte](cible) (groupes 3-4)
+_LINK_RE = re.compile(r'\[\[([^\]|]+)(\|[^\]]*)?\]\]|\[([^\]]*)\]\(([^)]+)\)')
+
+# Cible d'un lien cassé dans le message, pour les problèmes sans champ 'link'
+_QUOTE_RE = re.compile(r"'([^']+)'")
+
+# Conversion des tirets en espaces pour dériver un titre du nom de fichier
+_TITLE_TRANS = str.maketrans('-', ' ')
+
+def _title_from_path(path: str) -> str:
+    """
+    Dérive un titre lisible du nom de fichier (ex: 'plan-general.md' -> 'Plan General').
+    
+    Args:
+        path: Chemin relatif du fichier
+        
+    Returns:
+        Titre du document
+    """
+    return PurePath(path).stem.translate(_TITLE_TRANS).title()
+
+def _render_index_template(title: str, directory: str, date: str) -> str:
+    """Template par défaut des fichiers index.md."""
+    return f"""# {title}
+
+## Vue d'ensemble
+Ce document sert d'index pour {directory}.
+
+## Contenu
+<!-- Liste des contenus principaux de cette section -->
+
+## Navigation rapide
+<!-- Liens vers les documents principaux -->
+"""
+
+def _render_default_template(title: str, directory: str, date: str) -> str:
+    """Template par défaut des autres fichiers markdown."""
+    return f"""# {title}
+
+*Document créé automatiquement le {date}*
+
+## Contenu à définir
+Ce document a été créé automatiquement pour corriger la structure du projet.
+Veuillez le compléter avec le contenu approprié.
+"""
+
+# Templates par défaut de fix_missing_files: nom de fichier -> rendu(title, directory, date)
+_DEFAULT_TEMPLATES: Dict[str, Callable[[str, str, str], str]] = {
+    'index.md': _render_index_template,
+    'default.md': _render_default_template,
+}
+
+# Variables disponibles dans les templates
+_TEMPLATE_FIELDS = frozenset(('title', 'directory', 'date'))
+
+def _format_renderer(text: str) -> Callable[[str, str, str], str]:
+    """Rendu par str.format, qui gère (et signale au rendu) les cas non compilés."""
+    def render(title: str, directory: str, date: str) -> str:
+        return text.format(title=title, directory=directory, date=date)
+    return render
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(text: str) -> Callable[[str, str, str], str]:
+    """
+    Prépare un template fourni par l'appelant ({title}, {directory}, {date}).
+    
+    Args:
+        text: Contenu du template
+        
+    Returns:
+        Fonction de rendu (title, directory, date) -> contenu
+    """
+    # Découper une seule fois en segments littéraux et noms de variables
+    segments = []
+    try:
+        parsed = list(string.Formatter().parse(text))
+    except ValueError:
+        # Template mal formé: l'erreur sera signalée au rendu, pour le seul fichier concerné
+        return _format_renderer(text)
+    
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (spec or conversion or field not in _TEMPLATE_FIELDS):
+            # Format avancé ou variable inconnue: laisser str.format gérer (et signaler)
+            return _format_renderer(text)
+        if literal:
+            segments.append((literal, None))
+        if field is not None:
+            segments.append((None, field))
+    segments = tuple(segments)
+    
+    def render(title: str, directory: str, date: str) -> str:
+        values = {'title': title, 'directory': directory, 'date': date}
+        return ''.join(literal if field is None else values[field] for literal, field in segments)
+    
+    return render
+
+@functools.lru_cache(maxsize=64)
+def _load_template(template_path: str, mtime_ns: int) -> str:
+    """
+    Lit un fichier template, mis en cache tant qu'il n'est pas modifié.
+    
+    Args:
+        template_path: Chemin du fichier template
+        mtime_ns: Date de modification du fichier (clé d'invalidation du cache)
+        
+    Returns:
+        Contenu du template
+    """
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _build_file_index(project_path: Union[str, Path]) -> Dict[str, List[str]]:
+    """
+    Indexe les fichiers du projet en un seul parcours de l'arborescence.
+    
+    Args:
+        project_path: Chemin de base du projet
+        
+    Returns:
+        Chemins relatifs des fichiers, par nom de base
+    """
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
+    
+    by_basename = {}
+    for root, dirs, files in os.walk(project_path):
+        # Élaguer .git, export, node_modules, etc. avant d'y descendre
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS]
+        
+        rel_dir = os.path.relpath(root, project_path)
+        for name in files:
+            if name.startswith('.'):
+                continue
+            
+            str_path = name if rel_dir == '.' else os.path.join(rel_dir, name)
+            by_basename.setdefault(name, []).append(str_path)
+    
+    return by_basename
+
+# Nombre maximal de threads pour créer fichiers et répertoires en parallèle
+_MAX_IO_WORKERS = 32
+
+def _create_dir(dir_path: Path) -> int:
+    """
+    Crée un répertoire manquant.
+    
+    Args:
+        dir_path: Chemin complet du répertoire
+        
+    Returns:
+        1 si le répertoire a été créé, 0 sinon
+    """
+    try:
+        os.makedirs(dir_path)
+    except FileExistsError:
+        return 0
+    except Exception as e:
+        logger.error(f"Erreur lors de la création du répertoire {dir_path}: {e}")
+        return 0
+    
+    logger.info(f"Répertoire créé: {dir_path}")
+    return 1
+
+def _write_exclusive(file_path: Union[str, Path], content: str) -> None:
+    """
+    Crée un fichier et y écrit son contenu en UTF-8, sans couche texte ni tampon.
+    
+    Args:
+        file_path: Chemin complet du fichier
+        content: Contenu à écrire
+        
+    Raises:
+        FileExistsError: Si le fichier existe déjà (il n'est jamais écrasé)
+    """
+    write_chunks_exclusive(file_path, [content.encode('utf-8')])
+
+def write_chunks_exclusive(file_path: Union[str, Path], chunks: List[bytes]) -> None:
+    """
+    Crée un fichier et y écrit une suite de blocs d'octets, en un seul appel si possible.
+    
+    Args:
+        file_path: Chemin complet du fichier
+        chunks: Blocs à écrire dans l'ordre
+        
+    Raises:
+        FileExistsError: Si le fichier existe déjà (il n'est jamais écrasé)
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        written = 0
+        if hasattr(os, 'writev') and len(chunks) > 1:
+            # Écriture vectorielle: les blocs ne sont pas concaténés
+            written = os.writev(fd, chunks)
+        
+        # Sans writev (Windows), ou pour terminer une écriture partielle
+        view = memoryview(b''.join(chunks))[written:]
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_new_file(file_path: Path, content: str) -> int:
+    """
+    Écrit le contenu d'un fichier créé par correction automatique.
+    
+    Args:
+        file_path: Chemin complet du fichier
+        content: Contenu à écrire
+        
+    Returns:
+        1 si le fichier a été écrit, 0 sinon
+    """
+    try:
+        _write_exclusive(file_path, content)
+    except FileExistsError:
+        logger.warning(f"Le fichier existe déjà et ne sera pas écrasé: {file_path}")
+        return 0
+    except Exception as e:
+        logger.error(f"Erreur lors de la création du fichier {file_path}: {e}")
+        return 0
+    
+    logger.info(f"Fichier créé: {file_path}")
+    return 1
+
 def fix_missing_dirs(
     project_path: Union[str, Path], 
-    issues: List[Dict[str, Any]]
+    issues: List[Dict[str, Any]],
+    fixed_issues: Optional[List] = None
 ) -> int:
     """
     Crée les répertoires manquants identifiés dans les problèmes.
@@ -24,6 +255,7 @@ def fix_missing_dirs(
     Args:
         project_path: Chemin de base du projet
         issues: Liste des problèmes détectés
+        fixed_issues: Liste pour accumuler les problèmes résolus
         
     Returns:
         Nombre de répertoires créés
@@ -31,25 +263,34 @@ def fix_missing_dirs(
     if not isinstance(project_path, Path):
         project_path = Path(project_path)
     
+    dir_issues = [
+        issue for issue in issues
+        if issue['level'] == 'error' and issue['type'] == 'missing_required' and '.md' not in issue['path']
+    ]
+    dir_paths = {issue['path'] for issue in dir_issues}
+    if not dir_paths:
+        return 0
+    
+    # Regrouper par profondeur pour créer les parents avant leurs sous-dossiers
+    levels = {}
+    for rel_path in dir_paths:
+        levels.setdefault(len(PurePath(rel_path).parts), []).append(project_path / rel_path)
+    
     dirs_created = 0
-    for issue in issues:
-        if issue['level'] == 'error' and issue['type'] == 'missing_required' and '.md' not in issue['path']:
-            try:
-                # C'est un répertoire manquant
-                dir_path = project_path / issue['path']
-                if not dir_path.exists():
-                    os.makedirs(dir_path, exist_ok=True)
-                    logger.info(f"Répertoire créé: {dir_path}")
-                    dirs_created += 1
-            except Exception as e:
-                logger.error(f"Erreur lors de la création du répertoire {issue['path']}: {e}")
+    with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(dir_paths))) as executor:
+        for depth in sorted(levels):
+            dirs_created += sum(executor.map(_create_dir, levels[depth]))
+    
+    if fixed_issues is not None:
+        fixed_issues.extend(issue for issue in dir_issues if (project_path / issue['path']).is_dir())
     
     return dirs_created
 
 def fix_missing_files(
     project_path: Union[str, Path], 
     issues: List[Dict[str, Any]],
-    templates: Optional[Dict[str, str]] = None
+    templates: Optional[Dict[str, str]] = None,
+    fixed_issues: Optional[List] = None
 ) -> int:
     """
     Crée les fichiers manquants identifiés dans les problèmes.
@@ -58,6 +299,7 @@ def fix_missing_files(
         project_path: Chemin de base du projet
         issues: Liste des problèmes détectés
         templates: Dictionnaire des templates à utiliser par type de fichier
+        fixed_issues: Liste pour accumuler les problèmes résolus
         
     Returns:
         Nombre de fichiers créés
@@ -66,65 +308,59 @@ def fix_missing_files(
         project_path = Path(project_path)
     
     if templates is None:
-        templates = {
-            'index.md': """# {title}
-
-## Vue d'ensemble
-Ce document sert d'index pour {directory}.
-
-## Contenu
-<!-- Liste des contenus principaux de cette section -->
-
-## Navigation rapide
-<!-- Liens vers les documents principaux -->
-""",
-            'default.md': """# {title}
-
-*Document créé automatiquement le {date}*
-
-## Contenu à définir
-Ce document a été créé automatiquement pour corriger la structure du projet.
-Veuillez le compléter avec le contenu approprié.
-"""
-        }
+        renderers = _DEFAULT_TEMPLATES
+    else:
+        renderers = {key: _compile_template(text) for key, text in templates.items()}
     
-    files_created = 0
+    # La date est la même pour tous les fichiers créés
+    date = datetime.now().strftime('%Y-%m-%d')
+    
+    # Préparer le contenu de chaque fichier manquant, sans E/S
+    work = []
     for issue in issues:
         if issue['level'] == 'error' and issue['type'] == 'missing_required' and '.md' in issue['path']:
             try:
                 # C'est un fichier manquant
                 file_path = project_path / issue['path']
                 
-                # S'assurer que le répertoire parent existe
-                os.makedirs(file_path.parent, exist_ok=True)
-                
                 # Déterminer le template à utiliser
                 template_key = os.path.basename(issue['path'])
-                if template_key not in templates:
+                if template_key not in renderers:
                     template_key = 'default.md'
                 
                 # Préparer les variables pour le template
-                title = os.path.splitext(os.path.basename(issue['path']))[0].replace('-', ' ').title()
+                title = _title_from_path(issue['path'])
                 directory = os.path.basename(os.path.dirname(issue['path']))
-                date = datetime.now().strftime('%Y-%m-%d')
                 
                 # Créer le contenu avec les variables
-                content = templates[template_key].format(
-                    title=title,
-                    directory=directory,
-                    date=date
-                )
-                
-                # Écrire le fichier
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                logger.info(f"Fichier créé: {file_path}")
-                files_created += 1
+                content = renderers[template_key](title, directory, date)
+                work.append((file_path, content, issue))
             except Exception as e:
                 logger.error(f"Erreur lors de la création du fichier {issue['path']}: {e}")
     
-    return files_created
+    if not work:
+        return 0
+    
+    # S'assurer que les répertoires parents existent (une fois par dossier)
+    for parent_dir in {file_path.parent for file_path, _, _ in work}:
+        try:
+            os.makedirs(parent_dir, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Erreur lors de la création du répertoire {parent_dir}: {e}")
+    
+    # Écrire les fichiers en parallèle
+    file_paths, contents, work_issues = zip(*work)
+    with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(work))) as executor:
+        results = list(executor.map(_write_new_file, file_paths, contents))
+    
+    if fixed_issues is not None:
+        # Un fichier apparu entre-temps résout aussi le problème
+        fixed_issues.extend(
+            issue for issue, file_path, created in zip(work_issues, file_paths, results)
+            if created or file_path.is_file()
+        )
+    
+    return sum(results)
 
 def create_missing_file(
     project_path: Union[str, Path], 
@@ -155,11 +391,6 @@ def create_missing_file(
     # S'assurer que le répertoire parent existe
     os.makedirs(full_path.parent, exist_ok=True)
     
-    # Si le fichier existe déjà, ne pas l'écraser
-    if full_path.exists():
-        logger.warning(f"Le fichier existe déjà et ne sera pas écrasé: {full_path}")
-        return False
-    
     # Obtenir le contenu du template
     content = ""
     
@@ -168,15 +399,15 @@ def create_missing_file(
     elif template_name:
         # Chercher le template dans le dossier templates
         template_path = project_path / "templates" / template_name
-        if template_path.exists():
-            with open(template_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        else:
+        try:
+            mtime_ns = os.stat(template_path).st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"Template non trouvé: {template_path}")
             return False
+        content = _load_template(str(template_path), mtime_ns)
     else:
         # Template par défaut
-        title = os.path.splitext(os.path.basename(file_path))[0].replace('-', ' ').title()
+        title = _title_from_path(file_path)
         content = f"""# {title}
 
 *Document créé automatiquement le {datetime.now().strftime('%Y-%m-%d')}*
@@ -191,19 +422,22 @@ Veuillez le compléter avec le contenu approprié.
         for key, value in variables.items():
             content = content.replace(f"{{{key}}}", value)
     
-    # Écrire le fichier
+    # Écrire le fichier (O_EXCL refuse d'écraser un fichier existant)
     try:
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_exclusive(full_path, content)
         logger.info(f"Fichier créé: {full_path}")
         return True
+    except FileExistsError:
+        logger.warning(f"Le fichier existe déjà et ne sera pas écrasé: {full_path}")
+        return False
     except Exception as e:
         logger.error(f"Erreur lors de la création du fichier {full_path}: {e}")
         return False
 
 def find_similar_files(
     project_path: Union[str, Path], 
-    broken_link: str
+    broken_link: str,
+    index: Optional[Dict[str, List[str]]] = None
 ) -> List[Tuple[str, float]]:
     """
     Recherche des fichiers similaires au lien cassé dans le projet.
@@ -211,6 +445,7 @@ def find_similar_files(
     Args:
         project_path: Chemin de base du projet
         broken_link: Lien cassé à rechercher
+        index: Index des fichiers par nom de base, construit si None
         
     Returns:
         Liste de fichiers similaires trouvés [(chemin, score_similitude)]
@@ -226,21 +461,20 @@ def find_similar_files(
     if '.' not in filename:
         filename += '.md'
     
+    if index is None:
+        index = _build_file_index(project_path)
+    
+    # Parties du lien, communes à tous les candidats
+    link_parts_set = set(link_parts)
+    
     # Rechercher des fichiers avec le même nom dans tout le projet
     similar_files = []
-    for file_path in project_path.glob(f'**/{filename}'):
-        # Ignorer les fichiers dans .git, export, etc.
-        if any(part.startswith('.') for part in file_path.parts) or 'export' in file_path.parts:
-            continue
-        
-        rel_path = file_path.relative_to(project_path)
+    for rel_path in index.get(filename, []):
         # Calculer un score de similarité simple
         similarity = 0.8  # Score de base pour le même nom de fichier
         
         # Bonus pour les parties de chemin correspondantes
-        rel_parts = str(rel_path).split(os.sep)
-        link_parts = broken_link.split('/')
-        common_parts = set(rel_parts) & set(link_parts)
+        common_parts = link_parts_set.intersection(rel_path.split(os.sep))
         if common_parts:
             similarity += 0.1 * len(common_parts)
         
@@ -248,6 +482,23 @@ def find_similar_files(
     
     return sorted(similar_files, key=lambda x: x[1], reverse=True)
 
+def _issue_link(issue: Dict[str, Any]) -> Optional[str]:
+    """
+    Extrait la cible d'un lien cassé à partir d'un problème.
+    
+    Args:
+        issue: Problème signalé par le validateur
+        
+    Returns:
+        Lien cassé, ou None si le problème n'est pas un lien cassé
+    """
+    if issue['type'] != 'broken_link':
+        return None
+    if 'link' in issue:
+        return issue['link']
+    match = _QUOTE_RE.search(issue['message'])
+    return match.group(1) if match else None
+
 def detect_common_path_issues(issues: List[Dict[str, Any]]) -> Dict[str, int]:
     """
     Détecte les problèmes de chemin communs (par exemple, préfixe 'docs/' incorrect).
@@ -258,23 +509,30 @@ def detect_common_path_issues(issues: List[Dict[str, Any]]) -> Dict[str, int]:
     Returns:
         Dictionnaire des motifs de préfixe détectés et leur fréquence
     """
-    prefix_patterns = {}
+    prefixes = (
+        link.partition('/')[0]
+        for link in map(_issue_link, issues)
+        if link and '/' in link
+    )
+    return dict(Counter(prefixes))
+
+@functools.lru_cache(maxsize=16)
+def _root_dirs(project_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Liste les dossiers de premier niveau du projet, hors dossiers cachés.
     
-    for issue in issues:
-        if issue['type'] != 'broken_link':
-            continue
-        
-        path = issue['message'].split("'")[1]  # Extraire le chemin du message
+    Args:
+        project_path: Chemin de base du projet
+        mtime_ns: Date de modification du dossier, pour invalider le cache
         
-        # Détecter les préfixes communs
-        parts = path.split('/')
-        if len(parts) > 1:
-            prefix = parts[0]
-            if prefix not in prefix_patterns:
-                prefix_patterns[prefix] = 0
-            prefix_patterns[prefix] += 1
-    
-    return prefix_patterns
+    Returns:
+        Noms des dossiers triés
+    """
+    with os.scandir(project_path) as entries:
+        return tuple(sorted(
+            entry.name for entry in entries
+            if entry.is_dir() and not entry.name.startswith('.')
+        ))
 
 def suggest_prefix_replacements(
     prefix_patterns: Dict[str, int], 
@@ -296,30 +554,114 @@ def suggest_prefix_replacements(
     suggestions = {}
     
     # Vérifier les dossiers de premier niveau du projet
-    root_dirs = [d.name for d in project_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
+    root_dirs = _root_dirs(str(project_path), project_path.stat().st_mtime_ns)
     
     for prefix, count in prefix_patterns.items():
         if count > 5:  # Seuil arbitraire pour considérer un motif comme significatif
-            # Chercher un dossier similaire
-            best_match = None
-            best_score = 0
-            
-            for dir_name in root_dirs:
-                # Score simple basé sur les caractères communs
-                score = sum(1 for a, b in zip(prefix, dir_name) if a == b) / max(len(prefix), len(dir_name))
-                if score > 0.5 and score > best_score:  # Seuil arbitraire de similarité
-                    best_match = dir_name
-                    best_score = score
-            
-            if best_match:
-                suggestions[prefix] = best_match
+            # Chercher le dossier le plus similaire (seuil arbitraire de similarité)
+            matches = difflib.get_close_matches(prefix, root_dirs, n=1, cutoff=0.5)
+            if matches:
+                suggestions[prefix] = matches[0]
     
     return suggestions
 
+def _parse_selection(selection: str, count: int) -> Set[int]:
+    """
+    Interprète une sélection de la forme '1-20,25,!30' (numéros à partir de 1).
+    
+    Args:
+        selection: Saisie de l'utilisateur
+        count: Nombre d'éléments proposés
+        
+    Returns:
+        Ensemble des indices (à partir de 0) retenus
+    """
+    selection = selection.strip().lower()
+    if not selection or selection in ('y', 'yes', 'oui'):
+        return set(range(count))
+    if selection in ('n', 'no', 'non'):
+        return set()
+    
+    included = set()
+    excluded = set()
+    for token in selection.replace(' ', '').split(','):
+        if not token:
+            continue
+        
+        target = excluded if token.startswith('!') else included
+        start, sep, end = token.lstrip('!').partition('-')
+        try:
+            first = int(start)
+            last = int(end) if sep else first
+        except ValueError:
+            logger.warning(f"Sélection ignorée: '{token}'")
+            continue
+        
+        target.update(i - 1 for i in range(first, last + 1) if 1 <= i <= count)
+    
+    # Une sélection composée uniquement d'exclusions part de la liste complète
+    if excluded and not included:
+        included = set(range(count))
+    
+    return included - excluded
+
+def _batch_confirm(proposals: List[Tuple[str, str, str, float]]) -> Set[int]:
+    """
+    Présente toutes les corrections de liens proposées et demande une seule validation.
+    
+    Args:
+        proposals: Liste de propositions (fichier, lien cassé, correspondance, score)
+        
+    Returns:
+        Ensemble des indices des propositions approuvées
+    """
+    print("\nCorrections de liens proposées:")
+    for i, (rel_path, broken_link, best_match, score) in enumerate(proposals, 1):
+        print(f"  {i:>3}. {rel_path}: '{broken_link}' → '{best_match}' (score: {score:.2f})")
+    
+    selection = input("\nAppliquer ces corrections? [Y/n ou sélection, ex: 1-20,25,!30]: ")
+    return _parse_selection(selection, len(proposals))
+
+def _rewrite_links_in_file(
+    file_path: Path,
+    prefix_replacements: Dict[str, str],
+    link_replacements: Dict[str, str]
+) -> int:
+    """
+    Applique les corrections de liens à un fichier.
+    
+    Args:
+        file_path: Chemin complet du fichier
+        prefix_replacements: Dictionnaire ancien préfixe -> nouveau préfixe
+        link_replacements: Dictionnaire ancien lien -> nouveau lien
+        
+    Returns:
+        1 si le fichier a été modifié, 0 sinon
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        new_content = rewrite_links(content, prefix_replacements, link_replacements)
+        
+        # Sauvegarder les modifications si des liens ont été corrigés
+        if new_content == content:
+            return 0
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+    except Exception as e:
+        logger.error(f"Erreur lors de la correction des liens dans {file_path}: {e}")
+        return 0
+    
+    logger.info(f"Liens corrigés dans {file_path}")
+    return 1
+
 def fix_broken_links(
     project_path: Union[str, Path], 
     issues: List[Dict[str, Any]], 
-    interactive: bool = True
+    interactive: bool = True,
+    fixed_issues: Optional[List] = None
 ) -> int:
     """
     Corrige les liens cassés simples (renommages, changements de casse, etc.)
@@ -327,7 +669,8 @@ def fix_broken_links(
     Args:
         project_path: Chemin de base du projet
         issues: Liste des problèmes détectés
-        interactive: Demander confirmation pour chaque fichier modifié
+        interactive: Demander confirmation des corrections proposées
+        fixed_issues: Liste pour accumuler les problèmes résolus
         
     Returns:
         Nombre de liens corrigés
@@ -335,109 +678,145 @@ def fix_broken_links(
     if not isinstance(project_path, Path):
         project_path = Path(project_path)
     
-    links_fixed = 0
-    
-    # Collecter tous les fichiers markdown existants pour rechercher les correspondances
-    existing_files = {}
-    for md_file in project_path.glob('**/*.md'):
-        if any(part.startswith('.') for part in md_file.parts) or 'export' in md_file.parts:
-            continue
-        
-        relative_path = md_file.relative_to(project_path)
-        str_path = str(relative_path)
-        
-        # Ajouter le chemin complet
-        existing_files[str_path.lower()] = str_path
-        # Ajouter aussi sans extension .md
-        existing_files[str_path[:-3].lower()] = str_path[:-3]
-    
     # Filtrer les problèmes de liens cassés
     broken_link_issues = [issue for issue in issues if issue['type'] == 'broken_link']
     
     if not broken_link_issues:
         return 0
     
+    # Indexer une seule fois les fichiers existants pour rechercher les correspondances
+    files_by_basename = _build_file_index(project_path)
+    
     # Détecter les problèmes de préfixe communs
     prefix_patterns = detect_common_path_issues(broken_link_issues)
     prefix_suggestions = suggest_prefix_replacements(prefix_patterns, project_path)
     
     if prefix_suggestions and interactive:
         print("\nCorrections de préfixe suggérées:")
-        for prefix, suggestion in prefix_suggestions.items():
-            print(f"  '{prefix}/' → '{suggestion}/' ({prefix_patterns[prefix]} occurrences)")
+        for i, (prefix, suggestion) in enumerate(prefix_suggestions.items(), 1):
+            print(f"  {i:>3}. '{prefix}/' → '{suggestion}/' ({prefix_patterns[prefix]} occurrences)")
         
         apply_all = input("\nAppliquer toutes ces corrections de préfixe? [Y/n/s(elect)]: ").strip().lower()
         
         if apply_all == 's' or apply_all == 'select':
-            # Mode sélection individuelle
-            approved_prefixes = {}
-            for prefix, suggestion in prefix_suggestions.items():
-                approval = input(f"  Remplacer '{prefix}/' par '{suggestion}/'? [Y/n]: ").strip().lower()
-                if not approval or approval in ('y', 'yes', 'oui'):
-                    approved_prefixes[prefix] = suggestion
-            prefix_suggestions = approved_prefixes
+            # Mode sélection: une seule saisie pour toutes les suggestions
+            selection = input("  Corrections à appliquer (ex: 1-3,5,!2): ")
+            approved = _parse_selection(selection, len(prefix_suggestions))
+            prefix_suggestions = {
+                prefix: suggestion
+                for i, (prefix, suggestion) in enumerate(prefix_suggestions.items())
+                if i in approved
+            }
         elif apply_all and apply_all not in ('y', 'yes', 'oui'):
             prefix_suggestions = {}  # Annuler toutes les suggestions
     
-    # Traiter chaque fichier contenant des liens cassés
-    processed_files = set()
+    # 1. Proposer une correspondance pour chaque lien non couvert par un préfixe
+    proposals = []
+    seen = set()
     for issue in broken_link_issues:
-        file_path = project_path / issue['path']
+        # Extraire le lien cassé du message
+        broken_link = _issue_link(issue)
+        if not broken_link:
+            continue
         
-        if str(file_path) in processed_files:
+        prefix = broken_link.split('/')[0] if '/' in broken_link else ""
+        if (issue['path'], broken_link) in seen or prefix in prefix_suggestions:
             continue
+        seen.add((issue['path'], broken_link))
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extraire le lien cassé du message
-            broken_link = issue['message'].split("'")[1]
-            
-            # Chercher des fichiers similaires
-            similar_files = find_similar_files(project_path, broken_link)
-            
-            # Appliquer les corrections
-            new_content = content
-            link_fixed = False
-            
-            # 1. Correction par préfixe si applicable
-            prefix = broken_link.split('/')[0] if '/' in broken_link else ""
-            if prefix in prefix_suggestions:
-                replacement = prefix_suggestions[prefix]
-                # Remplacer dans les liens markdown et wiki
-                new_content = replace_prefix_in_links(new_content, prefix, replacement)
-                link_fixed = new_content != content
-            
-            # 2. Correction par similarité si pas de correction par préfixe
-            if not link_fixed and similar_files:
-                best_match = similar_files[0][0]
-                
-                if interactive:
-                    print(f"\nPour le lien '{broken_link}' dans {issue['path']}:")
-                    print(f"  Meilleure correspondance: {best_match} (score: {similar_files[0][1]:.2f})")
-                    approval = input("  Remplacer par cette correspondance? [Y/n]: ").strip().lower()
-                    
-                    if approval and approval not in ('y', 'yes', 'oui'):
-                        continue
-                
-                # Remplacer le lien dans le contenu
-                new_content = replace_link_in_content(new_content, broken_link, best_match)
-                link_fixed = new_content != content
-            
-            # Sauvegarder les modifications si des liens ont été corrigés
-            if link_fixed:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                
-                links_fixed += 1
-                logger.info(f"Liens corrigés dans {file_path}")
-            
-            processed_files.add(str(file_path))
-        except Exception as e:
-            logger.error(f"Erreur lors de la correction des liens dans {file_path}: {e}")
+        similar_files = find_similar_files(project_path, broken_link, files_by_basename)
+        if similar_files:
+            best_match, score = similar_files[0]
+            proposals.append((issue['path'], broken_link, best_match, score))
+    
+    # 2. Faire valider toutes les propositions en une seule fois
+    if interactive and proposals:
+        approved = _batch_confirm(proposals)
+    else:
+        approved = set(range(len(proposals)))
+    
+    # Regrouper les corrections par fichier pour réécrire chaque fichier une seule fois
+    replacements_by_file = {issue['path']: {} for issue in broken_link_issues}
+    for i in approved:
+        rel_path, broken_link, best_match, _ = proposals[i]
+        replacements_by_file[rel_path][broken_link] = best_match
+    
+    # 3. Appliquer les corrections, chaque fichier en une seule passe
+    file_paths = [project_path / rel_path for rel_path in replacements_by_file]
+    with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(file_paths))) as executor:
+        rewritten = dict(zip(replacements_by_file, executor.map(
+            lambda file_path, link_replacements: _rewrite_links_in_file(
+                file_path, prefix_suggestions, link_replacements),
+            file_paths,
+            replacements_by_file.values()
+        )))
+    
+    if fixed_issues is not None:
+        # Un lien est résolu si son fichier a été réécrit avec une correction qui le couvre
+        for issue in broken_link_issues:
+            broken_link = _issue_link(issue)
+            if not broken_link or not rewritten[issue['path']]:
+                continue
+            prefix, sep, _ = broken_link.partition('/')
+            if broken_link in replacements_by_file[issue['path']] or (sep and prefix in prefix_suggestions):
+                fixed_issues.append(issue)
+    
+    return sum(rewritten.values())
+
+def rewrite_links(
+    content: str,
+    prefix_replacements: Optional[Dict[str, str]] = None,
+    link_replacements: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Réécrit les liens markdown et wiki du contenu en une seule passe.
+    
+    Un lien dont le premier segment figure dans prefix_replacements voit ce
+    préfixe remplacé; sinon, le lien complet (avec ou sans extension .md pour
+    les liens markdown) est recherché dans link_replacements.
+    
+    Args:
+        content: Contenu à modifier
+        prefix_replacements: Dictionnaire ancien préfixe -> nouveau préfixe
+        link_replacements: Dictionnaire ancien lien -> nouveau lien
+        
+    Returns:
+        Contenu modifié
+    """
+    prefix_replacements = prefix_replacements or {}
+    link_replacements = link_replacements or {}
+    
+    # Aucun lien concerné dans le contenu: inutile de lancer l'expression régulière
+    if not any(f"{prefix}/" in content for prefix in prefix_replacements) and \
+            not any(link in content for link in link_replacements):
+        return content
+    
+    def replace_target(target: str, is_markdown: bool) -> Optional[str]:
+        prefix, sep, rest = target.partition('/')
+        if sep and prefix in prefix_replacements:
+            return f"{prefix_replacements[prefix]}/{rest}"
+        if target in link_replacements:
+            return link_replacements[target]
+        if is_markdown and target.endswith('.md'):
+            return link_replacements.get(target[:-3])
+        return None
+    
+    def replacer(match):
+        if match.group(1) is not None:
+            # Lien wiki: [[cible|texte]]
+            new_target = replace_target(match.group(1), False)
+            if new_target is None:
+                return match.group(0)
+            pipe_part = match.group(2) if match.group(2) else ''
+            return f'[[{new_target}{pipe_part}]]'
+        
+        # Lien markdown: [texte](cible)
+        new_target = replace_target(match.group(4), True)
+        if new_target is None:
+            return match.group(0)
+        return f'[{match.group(3)}]({new_target})'
     
-    return links_fixed
+    return _LINK_RE.sub(replacer, content)
 
 def replace_prefix_in_links(content: str, old_prefix: str, new_prefix: str) -> str:
     """
@@ -451,17 +830,20 @@ def replace_prefix_in_links(content: str, old_prefix: str, new_prefix: str) -> s
     Returns:
         Contenu modifié
     """
-    # Remplacer dans les liens markdown: [text](old_prefix/...)
-    md_pattern = r'\[.*?\]\((' + re.escape(old_prefix) + r'/[^)]*)\)'
-    content = re.sub(md_pattern, lambda m: m.group(0).replace(
-        m.group(1), m.group(1).replace(old_prefix + '/', new_prefix + '/', 1)), content)
-    
-    # Remplacer dans les liens wiki: [[old_prefix/...|...]]
-    wiki_pattern = r'\[\[(' + re.escape(old_prefix) + r'/[^\]|]*)((?:\|[^\]]*)?)\]\]'
-    content = re.sub(wiki_pattern, lambda m: m.group(0).replace(
-        m.group(1), m.group(1).replace(old_prefix + '/', new_prefix + '/', 1)), content)
+    return rewrite_links(content, prefix_replacements={old_prefix: new_prefix})
+
+def replace_prefixes_in_links(content: str, replacements: Dict[str, str]) -> str:
+    """
+    Remplace plusieurs préfixes dans les liens markdown et wiki en une seule passe.
     
-    return content
+    Args:
+        content: Contenu à modifier
+        replacements: Dictionnaire ancien préfixe -> nouveau préfixe
+        
+    Returns:
+        Contenu modifié
+    """
+    return rewrite_links(content, prefix_replacements=replacements)
 
 def replace_link_in_content(content: str, old_link: str, new_link: str) -> str:
     """
@@ -475,17 +857,4 @@ def replace_link_in_content(content: str, old_link: str, new_link: str) -> str:
     Returns:
         Contenu modifié
     """
-    # Remplacer dans les liens markdown: [text](old_link)
-    md_pattern = r'\[([^\]]*)\]\(' + re.escape(old_link) + r'(?:\.md)?\)'
-    content = re.sub(md_pattern, r'[\1](' + new_link + r')', content)
-    
-    # Remplacer dans les liens wiki: [[old_link|text]]
-    wiki_pattern = r'\[\[' + re.escape(old_link) + r'(\|[^\]]+)?\]\]'
-    
-    def wiki_replacer(match):
-        pipe_part = match.group(1) if match.group(1) else ''
-        return f'[[{new_link}{pipe_part}]]'
-    
-    content = re.sub(wiki_pattern, wiki_replacer, content)
-    
-    return content
+    return rewrite_links(content, link_replacements={old_link: new_link})
@@ -3,20 +3,27 @@ Classe principale pour la gestion de la structure d'un projet littéraire.
 """
 
 import os
+import re
+import sys
+import stat
+import json
 import shutil
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Set
 
 from .validator import (
     validate_structure, validate_templates, 
-    validate_frontmatter, check_broken_links,
+    validate_frontmatter, check_broken_links, build_project_index, ProjectIndex,
     DEFAULT_EXPECTED_STRUCTURE, DEFAULT_EXPECTED_TEMPLATES, DEFAULT_FRONTMATTER_RULES
 )
 from .fixer import (
     fix_missing_dirs, fix_missing_files, fix_broken_links, 
     create_missing_file, find_similar_files, detect_common_path_issues,
-    suggest_prefix_replacements
+    suggest_prefix_replacements, write_chunks_exclusive
 )
 from .reporter import (
     generate_structure_report, generate_correction_plan,
@@ -24,9 +31,442 @@ from .reporter import (
     generate_html_report
 )
 from ..utils.logging import get_logger
+from .. import __version__
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = get_logger(__name__)
 
+# Cache des vérifications de frontmatter par fichier, à la racine du projet
+_STRUCTURE_CACHE_NAME = '.claude_structure_cache.json'
+
+# Version du format du cache, à incrémenter si son contenu change de sens
+_STRUCTURE_CACHE_FORMAT = 1
+
+# Éléments jamais copiés dans les sauvegardes (dossiers non parcourus);
+# le cache est réécrit à chaque validation, il n'a pas sa place dans une sauvegarde
+_BACKUP_IGNORE = frozenset((
+    '.git', '__pycache__', '.DS_Store',
+    _STRUCTURE_CACHE_NAME, _STRUCTURE_CACHE_NAME + '.tmp'
+))
+
+# Nombre maximal de copies de fichiers simultanées lors d'une sauvegarde (travail limité par les E/S)
+_MAX_BACKUP_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Taille maximale demandée à chaque appel de os.copy_file_range
+_COPY_CHUNK_SIZE = 1 << 30
+
+# Registre des sauvegardes (empreinte de l'arborescence -> dossier), à côté des sauvegardes
+_BACKUP_REGISTRY_NAME = '.claude_backups.json'
+
+# Éléments exclus de l'empreinte de l'arborescence (le cache change à chaque validation)
+_FINGERPRINT_IGNORE = _BACKUP_IGNORE
+
+# ioctl FICLONE (Linux): clone un fichier par copie sur écriture (btrfs, XFS...)
+_FICLONE = 0x40049409
+
+def _copy_metadata(dst: str, src_stat: os.stat_result) -> None:
+    """
+    Applique à la copie les droits et dates d'un stat déjà obtenu pour la source.
+    
+    Args:
+        dst: Chemin de la copie
+        src_stat: Résultat de stat de l'original
+    """
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+def _clone_file(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> str:
+    """
+    Copie un fichier pour la sauvegarde, par clonage (reflink) si le système le permet.
+    
+    Le clone partage les blocs de données jusqu'à la première modification: la
+    sauvegarde reste intacte quand les corrections réécrivent le fichier d'origine,
+    contrairement à un lien physique.
+    
+    Args:
+        src: Chemin du fichier source
+        dst: Chemin du fichier de destination
+        src_stat: Résultat de stat de la source s'il est déjà connu
+        
+    Returns:
+        Chemin du fichier de destination
+    """
+    if src_stat is None:
+        src_stat = os.stat(src)
+    
+    copied = False
+    if fcntl is not None or hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            copied = _copy_in_kernel(fsrc.fileno(), fdst.fileno())
+    
+    if not copied:
+        # Système de fichiers ou plateforme sans copie noyau: copie classique
+        shutil.copyfile(src, dst)
+    
+    _copy_metadata(dst, src_stat)
+    return dst
+
+def _copy_in_kernel(src_fd: int, dst_fd: int) -> bool:
+    """
+    Copie le contenu d'un fichier sans passer par l'espace utilisateur.
+    
+    Essaie d'abord un clone (FICLONE), puis os.copy_file_range, qui clone
+    également sur les systèmes de fichiers qui le permettent.
+    
+    Args:
+        src_fd: Descripteur du fichier source
+        dst_fd: Descripteur du fichier de destination
+        
+    Returns:
+        True si la copie a réussi, False s'il faut utiliser une copie classique
+    """
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError:
+            pass
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            # Certains systèmes de fichiers (procfs, FUSE, overlay...) renvoient 0
+            # sans rien copier: ne conclure qu'une fois la taille complète atteinte
+            total = 0
+            while True:
+                copied = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE)
+                if not copied:
+                    break
+                total += copied
+            return total == os.fstat(src_fd).st_size
+        except OSError:
+            pass  # ENOTSUP, EXDEV (noyaux anciens), etc.
+    
+    return False
+
+def _walk_filtered(
+    root: str,
+    skip: frozenset = _BACKUP_IGNORE,
+    rel_path: str = "",
+    ancestors: Optional[Set[Tuple[int, int]]] = None
+):
+    """
+    Parcourt une arborescence avec os.scandir sans descendre dans les dossiers ignorés.
+    
+    Les liens symboliques vers des dossiers sont suivis; un dossier déjà présent
+    parmi ses propres ancêtres (boucle de liens) est signalé puis ignoré.
+    
+    Args:
+        root: Dossier à parcourir
+        skip: Noms des éléments à ignorer
+        rel_path: Chemin relatif de root par rapport à la racine du parcours
+        ancestors: Identifiants (st_dev, st_ino) des dossiers en cours de parcours
+        
+    Yields:
+        Tuples (entrée, chemin relatif), dossier parent avant son contenu
+    """
+    if ancestors is None:
+        root_stat = os.stat(root)
+        ancestors = {(root_stat.st_dev, root_stat.st_ino)}
+    
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name in skip:
+                continue
+            entry_rel_path = os.path.join(rel_path, entry.name)
+            
+            if not entry.is_dir():
+                yield entry, entry_rel_path
+                continue
+            
+            # Stat mis en cache par l'entrée: réutilisé par les appelants
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue  # Dossier supprimé entre-temps
+            dir_key = (entry_stat.st_dev, entry_stat.st_ino)
+            if dir_key in ancestors:
+                logger.warning(f"Boucle de liens symboliques ignorée: {entry.path}")
+                continue
+            
+            yield entry, entry_rel_path
+            ancestors.add(dir_key)
+            try:
+                yield from _walk_filtered(entry.path, skip, entry_rel_path, ancestors)
+            finally:
+                ancestors.discard(dir_key)
+
+def _copy_tree(src: str, dst: str, skip: frozenset = _BACKUP_IGNORE) -> int:
+    """
+    Copie une arborescence: dossiers créés pendant le parcours, fichiers copiés en parallèle.
+    
+    Args:
+        src: Dossier source
+        dst: Dossier de destination (ne doit pas exister)
+        skip: Noms des éléments à ignorer
+        
+    Returns:
+        Nombre de fichiers copiés
+    """
+    os.makedirs(dst)
+    dirs = [(dst, os.stat(src))]
+    files = []
+    
+    # Le stat de chaque entrée, obtenu une seule fois, sert aussi à copier ses métadonnées
+    for entry, rel_path in _walk_filtered(src, skip):
+        target = os.path.join(dst, rel_path)
+        if entry.is_dir():
+            os.mkdir(target)
+            dirs.append((target, entry.stat()))
+        elif entry.is_file():
+            files.append((entry.path, target, entry.stat()))
+        else:
+            logger.warning(f"Élément ignoré lors de la sauvegarde: {entry.path}")
+    
+    if files:
+        with ThreadPoolExecutor(max_workers=min(_MAX_BACKUP_WORKERS, len(files))) as executor:
+            for _ in executor.map(_clone_file, *zip(*files)):
+                pass
+    
+    # Dates des dossiers en dernier: la copie de leur contenu les modifie
+    for dst_dir, dir_stat in reversed(dirs):
+        _copy_metadata(dst_dir, dir_stat)
+    
+    return len(files)
+
+# Templates de base créés par _fix_missing_templates, variables notées {{variable}}
+_BASE_TEMPLATES = {
+    'personnage-avance.md': """---
+nom: {{nom}}
+citation: {{citation}}
+naissance: {{date}}
+tags: personnage
+---
+
+# {{nom}}
+
+*"{{citation}}"*
+
+## Caractéristiques
+- **Âge**: 
+- **Apparence**: 
+- **Traits de caractère**: 
+
+## Contexte
+- **Origine**: 
+- **Famille**: 
+- **Occupation**: 
+
+## Arc narratif
+- **Motivation**: 
+- **Conflit**: 
+- **Évolution**: 
+
+## Apparitions
+<!-- Les liens vers les chapitres où le personnage apparaît -->
+
+## Notes
+""",
+    'chapitre.md': """---
+titre: {{titre}}
+statut: brouillon
+date_creation: {{date}}
+tags: chapitre
+---
+
+# {{titre}}
+
+## Synopsis
+<!-- Brève description du chapitre -->
+
+## Scènes
+<!-- Liste des scènes ou sections -->
+
+## Personnages présents
+<!-- Personnages apparaissant dans ce chapitre -->
+
+## Notes
+<!-- Notes et idées pour ce chapitre -->
+""",
+    'reference.md': """---
+id: {{id}}
+type: {{type}}
+titre: {{titre}}
+date: {{date}}
+tags: reference
+---
+
+# {{titre}}
+
+## Entrée
+- **Type**: {{type}}
+- **Créateur(s)**: 
+- **Date**: 
+- **Source**: 
+
+## Description concise
+<!-- Description en 1-3 phrases -->
+
+## Pertinence pour le projet
+<!-- En quoi cette référence est importante -->
+
+## Éléments clés à retenir
+- 
+- 
+- 
+
+## Connexions internes
+<!-- Liens vers d'autres éléments du projet reliés à cette référence -->
+- 
+- 
+
+## Notes additionnelles
+<!-- Réflexions personnelles, idées d'utilisation, etc. -->
+""",
+    'todo.md': """---
+id: TODO-{{id}}
+titre: {{titre}}
+statut: À faire
+priorite: 3
+date_creation: {{date}}
+date_debut: {{date}}
+date_fin: 
+tags: tâche
+---
+
+# {{titre}} [TODO-{{id}}]
+
+**Statut**: À faire
+**Priorité**: 3/5
+**Période**: {{date}} → 
+
+## Description
+
+## Sous-tâches
+
+- [ ] 
+- [ ] 
+- [ ] 
+
+## Intervenants assignés
+
+- [[]]
+
+## Ressources nécessaires
+
+- 
+- 
+
+## Notes
+"""
+}
+
+def _compile_template_segments(template: str) -> Tuple[Union[bytes, str], ...]:
+    """
+    Découpe un template {{variable}} en segments, une seule fois à l'import.
+    
+    Args:
+        template: Contenu du template
+        
+    Returns:
+        Segments alternés: texte littéral encodé en UTF-8 (indices pairs) et
+        nom de variable (indices impairs)
+    """
+    parts = re.split(r'\{\{(\w+)\}\}', template)
+    return tuple(part if i % 2 else part.encode('utf-8') for i, part in enumerate(parts))
+
+def _render_template_chunks(
+    segments: Tuple[Union[bytes, str], ...],
+    variables: Dict[str, bytes]
+) -> List[bytes]:
+    """
+    Produit les blocs d'octets d'un template précompilé.
+    
+    Args:
+        segments: Segments produits par _compile_template_segments
+        variables: Valeurs des variables, déjà encodées (une variable inconnue est laissée telle quelle)
+        
+    Returns:
+        Blocs à écrire dans l'ordre
+    """
+    return [
+        variables.get(part, b"{{%s}}" % part.encode('utf-8')) if i % 2 else part
+        for i, part in enumerate(segments)
+    ]
+
+# Templates de base précompilés en segments (convertis une seule fois)
+_BASE_TEMPLATE_SEGMENTS = {name: _compile_template_segments(text) for name, text in _BASE_TEMPLATES.items()}
+
+def _issue_key(issue: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Identifie un problème indépendamment de sa priorité et de son regroupement.
+    
+    Args:
+        issue: Problème détecté
+        
+    Returns:
+        Clé (type, chemin, message) du problème
+    """
+    return issue['type'], issue['path'], issue['message']
+
+def _intern_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Interne les clés, le type et le niveau d'un problème relu depuis un cache JSON.
+    
+    Les problèmes produits par le validateur utilisent des littéraux déjà internés;
+    ceux relus depuis le JSON reçoivent des copies, ce qui ralentit les recherches
+    et comparaisons du rapporteur (prioritize_issues, group_issues_by_pattern).
+    
+    Args:
+        issue: Problème relu depuis le cache
+        
+    Returns:
+        Problème aux chaînes internées
+    """
+    interned = {sys.intern(key): value for key, value in issue.items()}
+    interned['type'] = sys.intern(interned['type'])
+    interned['level'] = sys.intern(interned['level'])
+    return interned
+
+def _load_json_file(file_path: str) -> Dict[str, Any]:
+    """
+    Charge un fichier JSON de registre ou de cache.
+    
+    Args:
+        file_path: Chemin du fichier
+        
+    Returns:
+        Contenu du fichier, ou dictionnaire vide s'il est absent ou invalide
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    return data if isinstance(data, dict) else {}
+
+def _save_json_file(file_path: str, data: Dict[str, Any], indent: Optional[int] = None) -> None:
+    """
+    Enregistre un fichier JSON de registre ou de cache (remplacement atomique du fichier).
+    
+    Args:
+        file_path: Chemin du fichier
+        data: Contenu à enregistrer
+        indent: Indentation, format compact si None
+    """
+    tmp_path = file_path + '.tmp'
+    separators = None if indent is not None else (',', ':')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent, separators=separators)
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        logger.warning(f"Impossible d'enregistrer {file_path}: {e}")
+
 class ProjectStructure:
     """
     Classe principale pour la gestion de la structure d'un projet littéraire.
@@ -47,6 +487,20 @@ class ProjectStructure:
         self.path = project.path
         self.config = project.config
         
+        # Chemin sous forme de chaîne pour les chemins construits en boucle (sans objets Path)
+        self._path_str = os.fspath(self.path)
+        
+        # Corrections par type d'étape du plan (voir generate_correction_plan)
+        self._step_handlers = {
+            'dirs_files': self._apply_dirs_files_step,
+            'templates': self._apply_templates_step,
+            'frontmatter': self._apply_frontmatter_step,
+            'links': self._apply_links_step,
+        }
+        
+        # Dernière validation: (empreinte de l'arborescence, problèmes détectés)
+        self._validate_cache: Optional[Tuple[bytes, List[Dict[str, Any]]]] = None
+        
         # Charger les définitions de structure depuis la configuration
         self._load_structure_definitions()
     
@@ -68,31 +522,126 @@ class ProjectStructure:
         """
         logger.info(f"Validation de la structure du projet: {self.path}")
         
-        issues = []
+        # Réutiliser la validation précédente si l'arborescence n'a pas changé
+        tree_hash = self._tree_hash()
+        if self._validate_cache is not None and self._validate_cache[0] == tree_hash:
+            issues = list(self._validate_cache[1])
+            logger.info(f"Projet inchangé depuis la dernière validation: {len(issues)} problèmes.")
+            return issues
+        
+        # Un seul parcours de l'arborescence, partagé par toutes les vérifications
+        index = build_project_index(self.path)
+        
+        # Les vérifications sont indépendantes et limitées par les E/S: les exécuter en parallèle
+        checks = [
+            # 1. Valider la structure des dossiers et fichiers
+            functools.partial(validate_structure, self.path, self.expected_structure, index=index),
+            # 2. Vérifier les templates
+            functools.partial(validate_templates, self.path, self.expected_templates, index=index),
+            # 3. Vérifier les frontmatters (fichiers modifiés seulement)
+            functools.partial(self._validate_frontmatter_incremental, index),
+            # 4. Vérifier les liens internes
+            functools.partial(check_broken_links, self.path, index=index),
+        ]
+        max_workers = self.config.get('validate_workers', len(checks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(check) for check in checks]
+            
+            # Conserver l'ordre des vérifications quel que soit l'ordre de fin
+            issues = []
+            for future in futures:
+                issues.extend(future.result())
         
-        # 1. Valider la structure des dossiers et fichiers
-        structure_issues = validate_structure(self.path, self.expected_structure)
-        issues.extend(structure_issues)
+        # Classer les problèmes par priorité
+        issues = prioritize_issues(issues)
         
-        # 2. Vérifier les templates
-        template_issues = validate_templates(self.path, self.expected_templates)
-        issues.extend(template_issues)
+        logger.info(f"Validation terminée. Trouvé {len(issues)} problèmes.")
         
-        # 3. Vérifier les frontmatters
-        frontmatter_issues = validate_frontmatter(self.path, self.frontmatter_rules)
-        issues.extend(frontmatter_issues)
+        self._validate_cache = (tree_hash, list(issues))
+        return issues
+    
+    def _validate_frontmatter_incremental(self, index: ProjectIndex) -> List[Dict[str, Any]]:
+        """
+        Vérifie les frontmatter en ne relisant que les fichiers modifiés depuis la dernière exécution.
         
-        # 4. Vérifier les liens internes
-        link_issues = check_broken_links(self.path)
-        issues.extend(link_issues)
+        Les problèmes de chaque fichier sont conservés dans un cache à la racine du
+        projet, avec sa date de modification et sa taille.
         
-        # Classer les problèmes par priorité
-        issues = prioritize_issues(issues)
+        Args:
+            index: Inventaire du projet
+            
+        Returns:
+            Liste des problèmes de frontmatter, dans l'ordre des fichiers de l'index
+        """
+        cache_path = os.path.join(self._path_str, _STRUCTURE_CACHE_NAME)
+        cache = _load_json_file(cache_path)
+        
+        # Le cache n'est valable que pour les mêmes règles, avec la même version
+        # du package (le code de vérification ou ses messages ont pu changer)
+        rules_key = hashlib.blake2b(
+            json.dumps(
+                [__version__, _STRUCTURE_CACHE_FORMAT, self.frontmatter_rules],
+                sort_keys=True, default=str
+            ).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        cached_files = cache.get('files', {}) if cache.get('rules') == rules_key else {}
+        
+        # Un stat par fichier pour repérer ceux qui ont changé
+        signatures = {}
+        changed = []
+        for rel_path in index.md_files:
+            try:
+                file_stat = os.stat(os.path.join(self._path_str, rel_path))
+                signatures[rel_path] = [file_stat.st_mtime_ns, file_stat.st_size]
+            except OSError:
+                pass
+            
+            cached = cached_files.get(rel_path)
+            if cached is None or cached[:2] != signatures.get(rel_path):
+                changed.append(rel_path)
         
-        logger.info(f"Validation terminée. Trouvé {len(issues)} problèmes.")
+        fresh_issues = {rel_path: [] for rel_path in changed}
+        if changed:
+            changed_index = index.subset(changed)
+            for issue in validate_frontmatter(self.path, self.frontmatter_rules, index=changed_index):
+                fresh_issues[issue['path']].append(issue)
+        
+        issues = []
+        files = {}
+        for rel_path in index.md_files:
+            if rel_path in fresh_issues:
+                file_issues = fresh_issues[rel_path]
+            else:
+                # Problèmes relus depuis le JSON: chaînes internées comme celles du validateur
+                file_issues = [_intern_issue(issue) for issue in cached_files[rel_path][2]]
+            issues.extend(file_issues)
+            if rel_path in signatures:
+                files[rel_path] = signatures[rel_path] + [file_issues]
+        
+        if changed or len(files) != len(cached_files):
+            _save_json_file(cache_path, {'rules': rules_key, 'files': files})
         
         return issues
     
+    def _tree_hash(self) -> bytes:
+        """
+        Calcule une empreinte de l'arborescence à partir des chemins, dates et tailles.
+        
+        Returns:
+            Empreinte BLAKE2b de l'état du projet
+        """
+        entries = []
+        for entry, rel_path in _walk_filtered(self._path_str, _FINGERPRINT_IGNORE):
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue  # Lien symbolique cassé, fichier supprimé entre-temps
+            entries.append(f"{rel_path}\0{entry_stat.st_mtime_ns}\0{entry_stat.st_size}")
+        
+        entries.sort()
+        return hashlib.blake2b("\n".join(entries).encode('utf-8'), digest_size=16).digest()
+    
     def fix_issues(
         self, 
         issues: Optional[List[Dict[str, Any]]] = None, 
@@ -133,7 +682,7 @@ class ProjectStructure:
         grouped_issues = group_issues_by_pattern(issues)
         
         # Générer un plan de correction
-        correction_plan = generate_correction_plan(issues)
+        correction_plan = generate_correction_plan(issues, grouped_issues)
         
         # Si en mode interactif, présenter le plan et demander confirmation
         execution_plan = {}
@@ -144,10 +693,13 @@ class ProjectStructure:
             execution_plan = {i+1: True for i in range(len(correction_plan))}
         
         # Appliquer les corrections selon le plan d'exécution
-        fixes = self._apply_corrections(grouped_issues, correction_plan, execution_plan)
+        fixed_issues = []
+        fixes = self._apply_corrections(grouped_issues, correction_plan, execution_plan, fixed_issues)
         
-        # Exécuter une nouvelle validation pour voir les problèmes restants
-        remaining_issues = self.validate()
+        # Les problèmes restants sont ceux que les étapes n'ont pas résolus,
+        # sans relancer une validation complète du projet
+        fixed_keys = {_issue_key(issue) for issue in fixed_issues}
+        remaining_issues = [issue for issue in issues if _issue_key(issue) not in fixed_keys]
         
         logger.info(f"Correction terminée. {fixes['total']} problèmes corrigés, {len(remaining_issues)} problèmes restants.")
         
@@ -161,17 +713,32 @@ class ProjectStructure:
             Chemin du dossier de sauvegarde, ou None en cas d'échec
         """
         try:
+            # Réutiliser une sauvegarde existante si le projet n'a pas changé depuis
+            parent_dir, project_name = os.path.split(self._path_str)
+            registry_path = os.path.join(parent_dir, _BACKUP_REGISTRY_NAME)
+            registry = _load_json_file(registry_path)
+            project_backups = registry.setdefault(self._path_str, {})
+            tree_hash = self._tree_hash().hex()
+            
+            existing = project_backups.get(tree_hash)
+            if existing and os.path.isdir(existing):
+                logger.info(f"Projet inchangé depuis la sauvegarde: {existing}")
+                return Path(existing)
+            
             backup_time = datetime.now().strftime("%Y%m%d%H%M%S")
-            backup_dir = self.path.parent / f"{self.path.name}_backup_{backup_time}"
+            backup_dir = os.path.join(parent_dir, f"{project_name}_backup_{backup_time}")
             
             logger.info(f"Création d'une sauvegarde du projet: {backup_dir}")
-            shutil.copytree(
-                self.path, 
-                backup_dir, 
-                ignore=shutil.ignore_patterns('.git', '__pycache__', '.DS_Store')
-            )
+            _copy_tree(self._path_str, backup_dir)
+            
+            # Enregistrer la sauvegarde, en oubliant celles qui ont été supprimées
+            registry[self._path_str] = {
+                h: d for h, d in project_backups.items() if os.path.isdir(d)
+            }
+            registry[self._path_str][tree_hash] = backup_dir
+            _save_json_file(registry_path, registry, indent=2)
             
-            return backup_dir
+            return Path(backup_dir)
         except Exception as e:
             logger.error(f"Erreur lors de la création de la sauvegarde: {e}")
             return None
@@ -180,7 +747,8 @@ class ProjectStructure:
         self,
         grouped_issues: Dict[str, Any],
         correction_plan: List[Dict[str, Any]],
-        execution_plan: Dict[int, bool]
+        execution_plan: Dict[int, bool],
+        fixed_issues: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, int]:
         """
         Applique les corrections selon le plan d'exécution.
@@ -189,10 +757,14 @@ class ProjectStructure:
             grouped_issues: Problèmes groupés par type
             correction_plan: Plan de correction généré
             execution_plan: Plan d'exécution avec les étapes approuvées
+            fixed_issues: Liste pour accumuler les problèmes résolus
             
         Returns:
             Dictionnaire indiquant le nombre de corrections par catégorie
         """
+        if fixed_issues is None:
+            fixed_issues = []
+        
         fixes = {
             "dirs_created": 0,
             "files_created": 0,
@@ -212,218 +784,121 @@ class ProjectStructure:
             logger.info(f"Exécution de l'étape {i}: {step['title']}")
             
             # Appliquer la correction selon le type d'étape
-            if "Créer les dossiers et fichiers" in step['title']:
-                # Étape 1: Correction des dossiers et fichiers manquants
-                dirs_created = fix_missing_dirs(self.path, grouped_issues['missing_dirs'])
-                fixes["dirs_created"] += dirs_created
-                
-                files_created = fix_missing_files(self.path, grouped_issues['missing_files'])
-                fixes["files_created"] += files_created
-                
-                logger.info(f"  {dirs_created} répertoires créés, {files_created} fichiers créés")
-            
-            elif "templates manquants" in step['title']:
-                # Étape 2: Correction des templates manquants
-                templates_fixed = self._fix_missing_templates([item for item in step['items']])
-                fixes["templates_fixed"] += templates_fixed
-                logger.info(f"  {templates_fixed} templates corrigés")
-            
-            elif "problèmes de frontmatter" in step['title']:
-                # Étape 3: Correction des problèmes de frontmatter
-                # Cette correction nécessite souvent une intervention manuelle
-                # À implémenter dans une version future
-                logger.warning("  La correction automatique des problèmes de frontmatter n'est pas encore implémentée")
-            
-            elif "liens cassés" in step['title']:
-                # Étape 4: Correction des liens cassés
-                pattern = step['title'].split("'")[1] if "'" in step['title'] else None
-                
-                if pattern and pattern in grouped_issues['broken_links']:
-                    links_fixed = fix_broken_links(self.path, grouped_issues['broken_links'][pattern], interactive=False)
-                    fixes["links_fixed"] += links_fixed
-                    logger.info(f"  {links_fixed} liens cassés corrigés")
-            
-            # Mettre à jour le total des corrections
-            step_fixes = sum(v for k, v in fixes.items() if k != "total")
-            fixes["total"] = step_fixes
+            handler = self._step_handlers.get(step.get('type'))
+            if handler is not None:
+                # Chaque étape renvoie le nombre de corrections qu'elle a appliquées
+                fixes["total"] += handler(step, grouped_issues, fixes, fixed_issues)
         
         return fixes
     
-    def _fix_missing_templates(self, issues: List[Dict[str, Any]]) -> int:
+    def _apply_dirs_files_step(
+        self, step: Dict[str, Any], grouped_issues: Dict[str, Any], fixes: Dict[str, int],
+        fixed_issues: List[Dict[str, Any]]
+    ) -> int:
+        """Étape 1: Correction des dossiers et fichiers manquants."""
+        dirs_created = fix_missing_dirs(self.path, grouped_issues['missing_dirs'], fixed_issues=fixed_issues)
+        fixes["dirs_created"] += dirs_created
+        
+        files_created = fix_missing_files(self.path, grouped_issues['missing_files'], fixed_issues=fixed_issues)
+        fixes["files_created"] += files_created
+        
+        logger.info(f"  {dirs_created} répertoires créés, {files_created} fichiers créés")
+        return dirs_created + files_created
+    
+    def _apply_templates_step(
+        self, step: Dict[str, Any], grouped_issues: Dict[str, Any], fixes: Dict[str, int],
+        fixed_issues: List[Dict[str, Any]]
+    ) -> int:
+        """Étape 2: Correction des templates manquants."""
+        templates_fixed = self._fix_missing_templates(step['items'], fixed_issues)
+        fixes["templates_fixed"] += templates_fixed
+        logger.info(f"  {templates_fixed} templates corrigés")
+        return templates_fixed
+    
+    def _apply_frontmatter_step(
+        self, step: Dict[str, Any], grouped_issues: Dict[str, Any], fixes: Dict[str, int],
+        fixed_issues: List[Dict[str, Any]]
+    ) -> int:
+        """Étape 3: Correction des problèmes de frontmatter."""
+        # Cette correction nécessite souvent une intervention manuelle
+        # À implémenter dans une version future
+        logger.warning("  La correction automatique des problèmes de frontmatter n'est pas encore implémentée")
+        return 0
+    
+    def _apply_links_step(
+        self, step: Dict[str, Any], grouped_issues: Dict[str, Any], fixes: Dict[str, int],
+        fixed_issues: List[Dict[str, Any]]
+    ) -> int:
+        """Étape 4: Correction des liens cassés partageant un motif."""
+        pattern = step.get('pattern')
+        
+        if not pattern or pattern not in grouped_issues['broken_links']:
+            return 0
+        
+        links_fixed = fix_broken_links(
+            self.path, grouped_issues['broken_links'][pattern], interactive=False, fixed_issues=fixed_issues
+        )
+        fixes["links_fixed"] += links_fixed
+        logger.info(f"  {links_fixed} liens cassés corrigés")
+        return links_fixed
+    
+    def _fix_missing_templates(
+        self, issues: List[Dict[str, Any]], fixed_issues: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
         """
         Corrige les templates manquants.
         
         Args:
             issues: Liste des problèmes de templates manquants
+            fixed_issues: Liste pour accumuler les problèmes résolus
             
         Returns:
             Nombre de templates corrigés
         """
         templates_fixed = 0
         
-        # Dictionnaire des templates de base
-        base_templates = {
-            'personnage-avance.md': """---
-nom: {{nom}}
-citation: {{citation}}
-naissance: {{date}}
-tags: personnage
----
-
-# {{nom}}
-
-*"{{citation}}"*
-
-## Caractéristiques
-- **Âge**: 
-- **Apparence**: 
-- **Traits de caractère**: 
-
-## Contexte
-- **Origine**: 
-- **Famille**: 
-- **Occupation**: 
-
-## Arc narratif
-- **Motivation**: 
-- **Conflit**: 
-- **Évolution**: 
-
-## Apparitions
-<!-- Les liens vers les chapitres où le personnage apparaît -->
-
-## Notes
-""",
-            'chapitre.md': """---
-titre: {{titre}}
-statut: brouillon
-date_creation: {{date}}
-tags: chapitre
----
-
-# {{titre}}
-
-## Synopsis
-<!-- Brève description du chapitre -->
-
-## Scènes
-<!-- Liste des scènes ou sections -->
-
-## Personnages présents
-<!-- Personnages apparaissant dans ce chapitre -->
-
-## Notes
-<!-- Notes et idées pour ce chapitre -->
-""",
-            'reference.md': """---
-id: {{id}}
-type: {{type}}
-titre: {{titre}}
-date: {{date}}
-tags: reference
----
-
-# {{titre}}
-
-## Entrée
-- **Type**: {{type}}
-- **Créateur(s)**: 
-- **Date**: 
-- **Source**: 
-
-## Description concise
-<!-- Description en 1-3 phrases -->
-
-## Pertinence pour le projet
-<!-- En quoi cette référence est importante -->
-
-## Éléments clés à retenir
-- 
-- 
-- 
-
-## Connexions internes
-<!-- Liens vers d'autres éléments du projet reliés à cette référence -->
-- 
-- 
-
-## Notes additionnelles
-<!-- Réflexions personnelles, idées d'utilisation, etc. -->
-""",
-            'todo.md': """---
-id: TODO-{{id}}
-titre: {{titre}}
-statut: À faire
-priorite: 3
-date_creation: {{date}}
-date_debut: {{date}}
-date_fin: 
-tags: tâche
----
-
-# {{titre}} [TODO-{{id}}]
-
-**Statut**: À faire
-**Priorité**: 3/5
-**Période**: {{date}} → 
-
-## Description
-
-## Sous-tâches
-
-- [ ] 
-- [ ] 
-- [ ] 
-
-## Intervenants assignés
-
-- [[]]
-
-## Ressources nécessaires
-
-- 
-- 
-
-## Notes
-"""
+        # Templates manquants pour lesquels un modèle de base existe
+        template_issues = [
+            (issue, os.path.basename(issue['path'])) for issue in issues
+            if issue['type'] == 'missing_template'
+            and os.path.basename(issue['path']) in _BASE_TEMPLATE_SEGMENTS
+        ]
+        if not template_issues:
+            return 0
+        
+        template_dir = os.path.join(self._path_str, "templates")
+        os.makedirs(template_dir, exist_ok=True)
+        
+        # Préparer les variables (identiques pour tous les templates, encodées une fois)
+        now = datetime.now()
+        variables = {
+            "nom": "Nouveau Personnage",
+            "citation": "Citation caractéristique",
+            "titre": "Nouveau Titre",
+            "id": now.strftime("%Y%m%d"),
+            "type": "livre",
+            "date": now.strftime("%Y-%m-%d")
         }
+        variables = {name: value.encode('utf-8') for name, value in variables.items()}
         
-        for issue in issues:
-            if issue['type'] != 'missing_template':
-                continue
+        for issue, template_name in template_issues:
+            # Créer le template à partir du modèle de base
+            template_path = os.path.join(template_dir, template_name)
+            
+            # Remplacer les variables: seuls les segments variables sont produits à l'exécution
+            chunks = _render_template_chunks(_BASE_TEMPLATE_SEGMENTS[template_name], variables)
             
-            template_name = os.path.basename(issue['path'])
+            # Créer le template (O_EXCL: un template existant n'est jamais écrasé)
+            try:
+                write_chunks_exclusive(template_path, chunks)
+            except FileExistsError:
+                pass  # Template créé entre-temps: le problème est tout de même résolu
+            else:
+                logger.info(f"Template créé: {template_path}")
+                templates_fixed += 1
             
-            if template_name in base_templates:
-                # Créer le template à partir du modèle de base
-                template_dir = self.path / "templates"
-                template_path = template_dir / template_name
-                
-                # Préparer les variables
-                variables = {
-                    "nom": "Nouveau Personnage",
-                    "citation": "Citation caractéristique",
-                    "titre": "Nouveau Titre",
-                    "id": datetime.now().strftime("%Y%m%d%H%M%S")[:8],
-                    "type": "livre",
-                    "date": datetime.now().strftime("%Y-%m-%d")
-                }
-                
-                # Créer le template
-                if not template_path.exists():
-                    os.makedirs(template_dir, exist_ok=True)
-                    
-                    # Remplacer les variables dans le template
-                    content = base_templates[template_name]
-                    for var, value in variables.items():
-                        content = content.replace(f"{{{{{var}}}}}", value)
-                    
-                    # Écrire le fichier
-                    with open(template_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
-                    logger.info(f"Template créé: {template_path}")
-                    templates_fixed += 1
+            if fixed_issues is not None:
+                fixed_issues.append(issue)
         
         return templates_fixed
     
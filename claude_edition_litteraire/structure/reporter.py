@@ -3,14 +3,196 @@ Module pour générer des rapports sur la structure du projet et les problèmes
 """
 
 import os
-from datetime import datetime
+import re
+import sys
+import time
+import html
+import heapq
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, starmap
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Texte suivant la première apostrophe d'un message (lien cassé cité par le validateur)
+_QUOTED_RE = re.compile(r"'([^']*)")
+
+# Tampon d'écriture des rapports: les morceaux sont écrits au fil de leur production
+_REPORT_BUFFER_SIZE = 1 << 20
+
+# Format de la date en tête des rapports
+_REPORT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Icône et classe CSS par niveau de problème (avertissement par défaut)
+_LEVEL_ICON = {'error': "🔴"}
+_LEVEL_ICON_DEFAULT = "🟠"
+_ICON_CLASS = {'error': "error-icon"}
+_ICON_CLASS_DEFAULT = "warning-icon"
+
+# Parties invariantes du rapport HTML: styles, modèle d'un problème,
+# puis recommandations et script des sections repliables
+_HTML_STYLE = """    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            color: #333;
+            line-height: 1.6;
+        }
+        h1, h2, h3, h4 {
+            color: #2c3e50;
+        }
+        .summary {
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            padding: 15px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .summary-counts {
+            display: flex;
+            gap: 20px;
+        }
+        .count-item {
+            flex: 1;
+            text-align: center;
+            padding: 10px;
+            border-radius: 6px;
+        }
+        .errors {
+            background-color: #fee;
+            border: 1px solid #f99;
+        }
+        .warnings {
+            background-color: #ffd;
+            border: 1px solid #dda;
+        }
+        .total {
+            background-color: #eef;
+            border: 1px solid #aad;
+        }
+        .issue-type {
+            margin-top: 30px;
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            padding: 15px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .issue-type h3 {
+            margin-top: 0;
+            padding-bottom: 10px;
+            border-bottom: 1px solid #ddd;
+        }
+        .issue-list {
+            list-style-type: none;
+            padding-left: 0;
+        }
+        .issue-item {
+            padding: 8px 0;
+            border-bottom: 1px solid #eee;
+        }
+        .error-icon {
+            color: #e74c3c;
+            font-weight: bold;
+        }
+        .warning-icon {
+            color: #f39c12;
+            font-weight: bold;
+        }
+        .path {
+            font-family: monospace;
+            background-color: #f5f5f5;
+            padding: 2px 4px;
+            border-radius: 4px;
+        }
+        .plan-step {
+            background-color: #e8f4f8;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 15px 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .collapsible {
+            cursor: pointer;
+            padding: 10px;
+            width: 100%;
+            border: none;
+            text-align: left;
+            outline: none;
+            font-size: 16px;
+            background-color: #f1f1f1;
+            border-radius: 4px;
+        }
+        .active, .collapsible:hover {
+            background-color: #ddd;
+        }
+        .content {
+            padding: 0 18px;
+            max-height: 0;
+            overflow: hidden;
+            transition: max-height 0.2s ease-out;
+            background-color: #f9f9f9;
+        }
+    </style>
+</head>
+<body>
+"""
+
+_HTML_ISSUE_ITEM = """
+            <li class="issue-item">
+                <span class="{}">{}</span>
+                <span class="path">{}</span>: {}
+            </li>"""
+
+_HTML_FOOTER = """
+    <h2>Recommandations</h2>
+    <ol>
+        <li>Corriger d'abord les erreurs critiques liées à la structure de base du projet</li>
+        <li>Résoudre ensuite les problèmes de frontmatter dans les fichiers spécifiques</li>
+        <li>Vérifier et corriger les liens internes cassés</li>
+        <li>Exécuter à nouveau une vérification pour confirmer que tous les problèmes ont été résolus</li>
+    </ol>
+    
+    <script>
+    var coll = document.getElementsByClassName("collapsible");
+    var i;
+    
+    for (i = 0; i < coll.length; i++) {
+        coll[i].addEventListener("click", function() {
+            this.classList.toggle("active");
+            var content = this.nextElementSibling;
+            if (content.style.maxHeight) {
+                content.style.maxHeight = null;
+            } else {
+                content.style.maxHeight = content.scrollHeight + "px";
+            }
+        });
+    }
+    </script>
+</body>
+</html>
+"""
+
+# Poids de priorité pour chaque type de problème (voir prioritize_issues)
+_PRIORITY_WEIGHTS = {
+    'missing_required': 100,    # Éléments requis manquants (plus haute priorité)
+    'missing_template': 90,     # Templates manquants
+    'type_mismatch': 80,        # Type incorrect (fichier vs dossier)
+    'frontmatter_parsing_error': 70,  # Erreurs de parsing YAML
+    'missing_required_field': 60,     # Champs requis manquants
+    'broken_link': 50,          # Liens cassés
+    'invalid_tags': 40,         # Tags invalides
+    'missing_recommended_field': 30,  # Champs recommandés manquants
+    'missing_optional': 20,     # Éléments optionnels manquants (priorité plus basse)
+    'default': 10               # Valeur par défaut pour les autres types
+}
+
 def group_issues_by_file(issues: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """
     Groupe les problèmes par fichier.
@@ -48,26 +230,32 @@ def group_issues_by_pattern(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
         'other_issues': []
     }
     
+    # Références locales: une seule recherche par groupe pour toute la boucle
+    missing_dirs = groups['missing_dirs']
+    missing_files = groups['missing_files']
+    broken_links = groups['broken_links']
+    frontmatter_issues = groups['frontmatter_issues']
+    other_issues = groups['other_issues']
+    
     # Regrouper les liens cassés par motif de chemin
     for issue in issues:
-        if issue['type'] == 'missing_required' and '.md' not in issue['path']:
-            groups['missing_dirs'].append(issue)
-        elif issue['type'] == 'missing_required' and '.md' in issue['path']:
-            groups['missing_files'].append(issue)
-        elif issue['type'] == 'broken_link':
-            # Extraire le lien cassé
-            link = issue['message'].split("'")[1]
+        issue_type = issue['type']
+        if issue_type == 'missing_required':
+            # Un seul test d'extension pour choisir entre fichier et dossier
+            (missing_files if '.md' in issue['path'] else missing_dirs).append(issue)
+        elif issue_type == 'broken_link':
+            # Lien cassé fourni par le validateur (repli sur le message)
+            link = issue.get('link')
+            if not link:
+                match = _QUOTED_RE.search(issue['message'])
+                link = match.group(1) if match else ''
             
             # Déterminer le motif (par ex: docs/, personnages/, etc.)
-            pattern = 'autres'
-            parts = link.split('/')
-            if len(parts) > 1:
-                pattern = parts[0]
+            prefix, sep, _ = link.partition('/')
+            pattern = prefix if sep else 'autres'
             
-            if pattern not in groups['broken_links']:
-                groups['broken_links'][pattern] = []
-            groups['broken_links'][pattern].append(issue)
-        elif 'frontmatter' in issue['type']:
+            broken_links.setdefault(pattern, []).append(issue)
+        elif 'frontmatter' in issue_type:
             # Regrouper par type de fichier
             file_type = 'autres'
             path = issue['path']
@@ -78,42 +266,82 @@ def group_issues_by_pattern(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
                 file_type = 'chapitres'
             # etc.
             
-            if file_type not in groups['frontmatter_issues']:
-                groups['frontmatter_issues'][file_type] = []
-            groups['frontmatter_issues'][file_type].append(issue)
+            frontmatter_issues.setdefault(file_type, []).append(issue)
         else:
-            groups['other_issues'].append(issue)
+            other_issues.append(issue)
     
     return groups
 
-def generate_structure_report(
-    project_path: Union[str, Path], 
-    issues: List[Dict[str, Any]], 
-    output_file: Optional[str] = "structure-report.md"
-) -> str:
+def _count_and_group_by_type(
+    issues: List[Dict[str, Any]]
+) -> Tuple[int, int, Dict[str, List[Dict[str, Any]]]]:
     """
-    Crée un rapport au format Markdown des problèmes de structure détectés.
+    Compte les problèmes par niveau et les regroupe par type en un seul parcours.
     
     Args:
-        project_path: Chemin de base du projet
         issues: Liste des problèmes détectés
-        output_file: Nom du fichier de sortie (facultatif)
         
     Returns:
-        Chemin du fichier de rapport créé
+        Tuple (nombre d'erreurs, nombre d'avertissements, problèmes groupés par type)
     """
-    if not isinstance(project_path, Path):
-        project_path = Path(project_path)
+    error_count = 0
+    warning_count = 0
+    issues_by_type = defaultdict(list)
     
-    # Compter les problèmes par niveau
-    error_count = sum(1 for issue in issues if issue['level'] == 'error')
-    warning_count = sum(1 for issue in issues if issue['level'] == 'warning')
+    for issue in issues:
+        level = issue['level']
+        error_count += level == 'error'
+        warning_count += level == 'warning'
+        issues_by_type[issue['type']].append(issue)
+    
+    return error_count, warning_count, issues_by_type
+
+def _sort_by_path(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Trie les problèmes par chemin, ceux sans chemin en tête.
+    
+    Args:
+        issues: Liste des problèmes d'un même type
+        
+    Returns:
+        Nouvelle liste triée
+    """
+    with_path = [issue for issue in issues if 'path' in issue]
+    with_path.sort(key=itemgetter('path'))
+    if len(with_path) == len(issues):
+        return with_path
     
-    # Créer le contenu du rapport
-    report_content = f"""# Rapport de vérification de structure
+    # Les problèmes sans chemin gardent leur ordre d'origine, avant les autres
+    return [issue for issue in issues if 'path' not in issue] + with_path
+
+def _iter_structure_report_chunks(
+    project_path: Path, 
+    issues: List[Dict[str, Any]],
+    summary: Optional[Tuple[int, int, Dict[str, List[Dict[str, Any]]]]] = None,
+    plan: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[str]:
+    """
+    Produit le rapport Markdown morceau par morceau.
+    
+    Args:
+        project_path: Chemin de base du projet
+        issues: Liste des problèmes détectés
+        summary: Résultat de _count_and_group_by_type déjà calculé (facultatif)
+        plan: Plan de correction déjà généré (facultatif)
+        
+    Yields:
+        Morceaux successifs du rapport
+    """
+    # Compter les problèmes par niveau et les regrouper par type en un seul parcours
+    if summary is None:
+        summary = _count_and_group_by_type(issues)
+    error_count, warning_count, issues_by_type = summary
+    
+    # En-tête et résumé
+    yield f"""# Rapport de vérification de structure
 
 Projet: {project_path}
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Date: {time.strftime(_REPORT_DATE_FORMAT)}
 
 ## Résumé
 
@@ -125,30 +353,21 @@ Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 """
     
-    # Regrouper les problèmes par type
-    issues_by_type = {}
-    for issue in issues:
-        issue_type = issue['type']
-        if issue_type not in issues_by_type:
-            issues_by_type[issue_type] = []
-        issues_by_type[issue_type].append(issue)
-    
     # Ajouter les problèmes au rapport, regroupés par type
     for issue_type, type_issues in sorted(issues_by_type.items()):
-        report_content += f"### {issue_type.replace('_', ' ').title()} ({len(type_issues)})\n\n"
+        yield f"### {issue_type.replace('_', ' ').title()} ({len(type_issues)})\n\n"
         
-        for issue in sorted(type_issues, key=lambda x: x.get('path', '')):
-            level_icon = "🔴" if issue['level'] == 'error' else "🟠"
-            path = issue.get('path', 'N/A')
-            report_content += f"- {level_icon} **{path}**: {issue['message']}\n"
-        
-        report_content += "\n"
+        # Un seul morceau par type, suivi d'une ligne vide
+        yield "".join([
+            f"- {_LEVEL_ICON.get(issue['level'], _LEVEL_ICON_DEFAULT)} **{issue.get('path', 'N/A')}**: {issue['message']}\n"
+            for issue in _sort_by_path(type_issues)
+        ]) + "\n"
     
     # Générer un plan de correction
-    report_content += generate_correction_plan_markdown(issues)
+    yield generate_correction_plan_markdown(issues, plan)
     
     # Ajouter les recommandations
-    report_content += """
+    yield """
 ## Recommandations
 
 1. Corriger d'abord les erreurs critiques liées à la structure de base du projet
@@ -157,38 +376,80 @@ Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 4. Exécuter à nouveau une vérification pour confirmer que tous les problèmes ont été résolus
 
 """
+
+def _write_report(output_path: Path, chunks: Iterator[str]) -> str:
+    """
+    Écrit un rapport dans un fichier au fil de la production de ses morceaux.
+    
+    Args:
+        output_path: Chemin du fichier de sortie
+        chunks: Morceaux successifs du rapport
+        
+    Returns:
+        Chemin du fichier de rapport créé
+    """
+    with open(output_path, 'w', encoding='utf-8', buffering=_REPORT_BUFFER_SIZE) as f:
+        f.writelines(chunks)
+    
+    return str(output_path)
+
+def generate_structure_report(
+    project_path: Union[str, Path], 
+    issues: List[Dict[str, Any]], 
+    output_file: Optional[str] = "structure-report.md"
+) -> str:
+    """
+    Crée un rapport au format Markdown des problèmes de structure détectés.
     
-    # Écrire le rapport dans un fichier si un nom est spécifié
+    Args:
+        project_path: Chemin de base du projet
+        issues: Liste des problèmes détectés
+        output_file: Nom du fichier de sortie (facultatif)
+        
+    Returns:
+        Chemin du fichier de rapport créé
+    """
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
+    
+    # Écrire le rapport dans un fichier si un nom est spécifié, au fil de sa production
     if output_file:
         output_path = project_path / output_file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        _write_report(output_path, _iter_structure_report_chunks(project_path, issues))
         
         logger.info(f"Rapport de structure créé: {output_path}")
         return str(output_path)
     
-    return report_content
+    return "".join(_iter_structure_report_chunks(project_path, issues))
 
 def generate_correction_plan(
-    issues: List[Dict[str, Any]]
+    issues: List[Dict[str, Any]],
+    groups: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     """
     Génère un plan de correction étape par étape basé sur les problèmes détectés.
     
     Args:
         issues: Liste des problèmes détectés
+        groups: Problèmes déjà groupés par group_issues_by_pattern (facultatif)
         
     Returns:
         Plan d'actions recommandées
     """
-    # Grouper les problèmes par type
-    groups = group_issues_by_pattern(issues)
+    # Projet sans problème: aucun regroupement nécessaire
+    if not issues:
+        return []
+    
+    # Grouper les problèmes par type, sauf si l'appelant l'a déjà fait
+    if groups is None:
+        groups = group_issues_by_pattern(issues)
     
     plan = []
     
     # Étape 1: Corriger la structure de base (dossiers et fichiers requis)
     if groups['missing_dirs'] or groups['missing_files']:
         plan.append({
+            'type': 'dirs_files',
             'title': "Créer les dossiers et fichiers de structure manquants",
             'description': "Ces éléments sont requis pour la structure de base du projet.",
             'count': len(groups['missing_dirs']) + len(groups['missing_files']),
@@ -196,9 +457,11 @@ def generate_correction_plan(
         })
     
     # Étape 2: Corriger les templates manquants
-    missing_templates = [i for i in issues if i['type'] == 'missing_template']
+    # (classés parmi les autres problèmes par group_issues_by_pattern: inutile de tout reparcourir)
+    missing_templates = [i for i in groups['other_issues'] if i['type'] == 'missing_template']
     if missing_templates:
         plan.append({
+            'type': 'templates',
             'title': "Ajouter les templates manquants",
             'description': "Les templates sont essentiels pour maintenir la cohérence du projet.",
             'count': len(missing_templates),
@@ -209,6 +472,7 @@ def generate_correction_plan(
     for file_type, frontmatter_issues in groups['frontmatter_issues'].items():
         if frontmatter_issues:
             plan.append({
+                'type': 'frontmatter',
                 'title': f"Corriger les problèmes de frontmatter dans les fichiers {file_type}",
                 'description': "Les métadonnées frontmatter sont essentielles pour les fonctionnalités d'Obsidian.",
                 'count': len(frontmatter_issues),
@@ -219,6 +483,8 @@ def generate_correction_plan(
     for pattern, link_issues in groups['broken_links'].items():
         if link_issues:
             plan.append({
+                'type': 'links',
+                'pattern': pattern,
                 'title': f"Corriger les liens cassés avec le motif '{pattern}/'",
                 'description': f"Ces liens cassés partagent un motif commun et peuvent être traités ensemble.",
                 'count': len(link_issues),
@@ -228,6 +494,7 @@ def generate_correction_plan(
     # Étape 5: Autres problèmes
     if groups['other_issues']:
         plan.append({
+            'type': 'other',
             'title': "Corriger les autres problèmes",
             'description': "Problèmes divers qui nécessitent une attention particulière.",
             'count': len(groups['other_issues']),
@@ -236,94 +503,113 @@ def generate_correction_plan(
     
     return plan
 
-def generate_correction_plan_markdown(issues: List[Dict[str, Any]]) -> str:
+def generate_correction_plan_markdown(
+    issues: List[Dict[str, Any]],
+    plan: Optional[List[Dict[str, Any]]] = None
+) -> str:
     """
     Génère un plan de correction au format Markdown.
     
     Args:
         issues: Liste des problèmes détectés
+        plan: Plan de correction déjà généré (facultatif)
         
     Returns:
         Contenu Markdown du plan de correction
     """
-    plan = generate_correction_plan(issues)
+    if plan is None:
+        plan = generate_correction_plan(issues)
     
     if not plan:
         return ""
     
-    markdown = """
+    parts = ["""
 ## Plan de correction
 
 Voici les étapes recommandées pour résoudre les problèmes détectés:
 
-"""
+"""]
     
     for i, step in enumerate(plan, 1):
-        markdown += f"### Étape {i}: {step['title']} ({step['count']} éléments)\n\n"
-        markdown += f"{step['description']}\n\n"
+        parts.append(f"### Étape {i}: {step['title']} ({step['count']} éléments)\n\n")
+        parts.append(f"{step['description']}\n\n")
         
         # Ajouter quelques exemples
-        markdown += "**Exemples:**\n\n"
-        for item in step['items'][:3]:  # Limiter à 3 exemples
+        parts.append("**Exemples:**\n\n")
+        for item in islice(step['items'], 3):  # Limiter à 3 exemples
             path = item.get('path', 'N/A')
             message = item.get('message', 'N/A')
-            markdown += f"- `{path}`: {message}\n"
+            parts.append(f"- `{path}`: {message}\n")
         
         if len(step['items']) > 3:
-            markdown += f"\n... et {len(step['items']) - 3} autres éléments\n\n"
+            parts.append(f"\n... et {len(step['items']) - 3} autres éléments\n\n")
         
-        markdown += "\n"
+        parts.append("\n")
     
-    return markdown
+    return "".join(parts)
 
-def prioritize_issues(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def prioritize_issues(
+    issues: List[Dict[str, Any]],
+    top_k: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Classe les problèmes par ordre de priorité pour une résolution efficace.
     
     Args:
         issues: Liste des problèmes détectés
+        top_k: Ne renvoyer que les top_k problèmes les plus prioritaires (facultatif)
         
     Returns:
         Liste des problèmes classés par priorité
     """
-    # Définir les poids de priorité pour chaque type de problème
-    priority_weights = {
-        'missing_required': 100,    # Éléments requis manquants (plus haute priorité)
-        'missing_template': 90,     # Templates manquants
-        'type_mismatch': 80,        # Type incorrect (fichier vs dossier)
-        'frontmatter_parsing_error': 70,  # Erreurs de parsing YAML
-        'missing_required_field': 60,     # Champs requis manquants
-        'broken_link': 50,          # Liens cassés
-        'invalid_tags': 40,         # Tags invalides
-        'missing_recommended_field': 30,  # Champs recommandés manquants
-        'missing_optional': 20,     # Éléments optionnels manquants (priorité plus basse)
-        'default': 10               # Valeur par défaut pour les autres types
-    }
+    get_weight = _PRIORITY_WEIGHTS.get
+    default_weight = _PRIORITY_WEIGHTS['default']
     
-    # Fonction de calcul du score de priorité
-    def get_priority_score(issue):
+    # Calculer le score de chaque problème une seule fois, sans appel de fonction par problème
+    decorated = []
+    for index, issue in enumerate(issues):
         # Score de base selon le type d'issue
-        base_score = priority_weights.get(issue['type'], priority_weights['default'])
+        base_score = get_weight(issue['type'], default_weight)
         
         # Ajustements basés sur le niveau de sévérité
         level_multiplier = 2 if issue['level'] == 'error' else 1
         
         # Ajustements basés sur le chemin (les fichiers de structure ont une priorité plus élevée)
         path_bonus = 0
-        if 'path' in issue:
-            if 'structure/' in issue['path']:
-                path_bonus += 20
-            elif 'templates/' in issue['path']:
-                path_bonus += 15
-            elif 'index.md' in issue['path']:
-                path_bonus += 10
+        path = issue.get('path')
+        if path is not None:
+            if 'structure/' in path:
+                path_bonus = 20
+            elif 'templates/' in path:
+                path_bonus = 15
+            elif 'index.md' in path:
+                path_bonus = 10
         
-        return base_score * level_multiplier + path_bonus
+        # Score négatif et indice d'origine: tri croissant stable, par score décroissant
+        decorated.append((-(base_score * level_multiplier + path_bonus), index, issue))
+    
+    # Sélection partielle par tas si seuls les premiers problèmes sont demandés
+    if top_k is not None and top_k < len(decorated):
+        return [issue for _, _, issue in heapq.nsmallest(top_k, decorated)]
     
     # Trier les problèmes selon le score de priorité
-    prioritized_issues = sorted(issues, key=get_priority_score, reverse=True)
+    decorated.sort()
     
-    return prioritized_issues
+    return [issue for _, _, issue in decorated]
+
+def _format_plan_item(item: Dict[str, Any]) -> str:
+    """
+    Formate un élément d'étape du plan pour l'affichage console.
+    
+    Args:
+        item: Problème de l'étape
+        
+    Returns:
+        Ligne à afficher
+    """
+    if 'path' in item:
+        return f"   - {item['path']}: {item['message']}"
+    return f"   - {item['message']}"
 
 def present_correction_plan(
     plan: List[Dict[str, Any]], 
@@ -339,198 +625,87 @@ def present_correction_plan(
     Returns:
         Dictionnaire indiquant quelles étapes ont été approuvées pour exécution
     """
+    # Sans interaction, toutes les étapes sont approuvées: rien à afficher
+    if not interactive:
+        return dict.fromkeys(range(1, len(plan) + 1), True)
+    
     execution_plan = {}
     
-    print("\n=== PLAN DE CORRECTION ===\n")
+    # Chaque étape est affichée en une seule écriture, avant la question
+    lines = ["\n=== PLAN DE CORRECTION ===\n"]
     
     for i, step in enumerate(plan, 1):
-        print(f"{i}. {step['title']} ({step['count']} éléments)")
-        print(f"   {step['description']}")
+        lines.append(f"{i}. {step['title']} ({step['count']} éléments)")
+        lines.append(f"   {step['description']}")
         
         # Afficher quelques exemples
-        print("\n   Exemples:")
-        for item in step['items'][:3]:  # Limiter à 3 exemples
-            if 'path' in item:
-                print(f"   - {item['path']}: {item['message']}")
-            else:
-                print(f"   - {item['message']}")
+        lines.append("\n   Exemples:")
+        lines.extend(map(_format_plan_item, islice(step['items'], 3)))  # Limiter à 3 exemples
         
         if len(step['items']) > 3:
-            print(f"   ... et {len(step['items']) - 3} autres éléments")
+            lines.append(f"   ... et {len(step['items']) - 3} autres éléments")
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines = []
         
-        if interactive:
-            action = input(f"Exécuter l'étape {i}? [Y/n/v(voir plus)]: ").strip().lower()
-            
-            if action == 'v':
-                # Afficher plus de détails
-                print("\n   Détails complets:")
-                for item in step['items']:
-                    if 'path' in item:
-                        print(f"   - {item['path']}: {item['message']}")
-                    else:
-                        print(f"   - {item['message']}")
-                print()
-                
-                action = input(f"Exécuter l'étape {i}? [Y/n]: ").strip().lower()
+        action = input(f"Exécuter l'étape {i}? [Y/n/v(voir plus)]: ").strip().lower()
+        
+        if action == 'v':
+            # Afficher plus de détails
+            details = ["\n   Détails complets:"]
+            details.extend(map(_format_plan_item, step['items']))
+            details.append("")
+            sys.stdout.write("\n".join(details) + "\n")
             
-            execution_plan[i] = not action or action in ('y', 'yes', 'oui')
-        else:
-            execution_plan[i] = True
+            action = input(f"Exécuter l'étape {i}? [Y/n]: ").strip().lower()
+        
+        execution_plan[i] = not action or action in ('y', 'yes', 'oui')
+    
+    # Plan vide: afficher tout de même l'en-tête
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     return execution_plan
 
-def generate_html_report(
-    project_path: Union[str, Path], 
-    issues: List[Dict[str, Any]], 
-    output_file: Optional[str] = "structure-report.html"
-) -> str:
+def _iter_html_report_chunks(
+    project_path: Path, 
+    issues: List[Dict[str, Any]],
+    summary: Optional[Tuple[int, int, Dict[str, List[Dict[str, Any]]]]] = None,
+    plan: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[str]:
     """
-    Crée un rapport au format HTML des problèmes de structure détectés,
-    avec fonctionnalités interactives.
+    Produit le rapport HTML morceau par morceau.
     
     Args:
         project_path: Chemin de base du projet
         issues: Liste des problèmes détectés
-        output_file: Nom du fichier de sortie (facultatif)
+        summary: Résultat de _count_and_group_by_type déjà calculé (facultatif)
+        plan: Plan de correction déjà généré (facultatif)
         
-    Returns:
-        Chemin du fichier de rapport créé
+    Yields:
+        Morceaux successifs du rapport
     """
-    if not isinstance(project_path, Path):
-        project_path = Path(project_path)
-    
-    # Compter les problèmes par niveau
-    error_count = sum(1 for issue in issues if issue['level'] == 'error')
-    warning_count = sum(1 for issue in issues if issue['level'] == 'warning')
-    
-    # Regrouper les problèmes par type
-    issues_by_type = {}
-    for issue in issues:
-        issue_type = issue['type']
-        if issue_type not in issues_by_type:
-            issues_by_type[issue_type] = []
-        issues_by_type[issue_type].append(issue)
+    # Compter les problèmes par niveau et les regrouper par type en un seul parcours
+    if summary is None:
+        summary = _count_and_group_by_type(issues)
+    error_count, warning_count, issues_by_type = summary
     
     # Générer le plan de correction
-    correction_plan = generate_correction_plan(issues)
+    if plan is None:
+        plan = generate_correction_plan(issues)
     
-    # Créer le contenu HTML
-    html_content = f"""<!DOCTYPE html>
+    # En-tête, styles et résumé
+    yield f"""<!DOCTYPE html>
 <html lang="fr">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Rapport de structure - {project_path.name}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            color: #333;
-            line-height: 1.6;
-        }}
-        h1, h2, h3, h4 {{
-            color: #2c3e50;
-        }}
-        .summary {{
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .summary-counts {{
-            display: flex;
-            gap: 20px;
-        }}
-        .count-item {{
-            flex: 1;
-            text-align: center;
-            padding: 10px;
-            border-radius: 6px;
-        }}
-        .errors {{
-            background-color: #fee;
-            border: 1px solid #f99;
-        }}
-        .warnings {{
-            background-color: #ffd;
-            border: 1px solid #dda;
-        }}
-        .total {{
-            background-color: #eef;
-            border: 1px solid #aad;
-        }}
-        .issue-type {{
-            margin-top: 30px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            padding: 15px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .issue-type h3 {{
-            margin-top: 0;
-            padding-bottom: 10px;
-            border-bottom: 1px solid #ddd;
-        }}
-        .issue-list {{
-            list-style-type: none;
-            padding-left: 0;
-        }}
-        .issue-item {{
-            padding: 8px 0;
-            border-bottom: 1px solid #eee;
-        }}
-        .error-icon {{
-            color: #e74c3c;
-            font-weight: bold;
-        }}
-        .warning-icon {{
-            color: #f39c12;
-            font-weight: bold;
-        }}
-        .path {{
-            font-family: monospace;
-            background-color: #f5f5f5;
-            padding: 2px 4px;
-            border-radius: 4px;
-        }}
-        .plan-step {{
-            background-color: #e8f4f8;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 15px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .collapsible {{
-            cursor: pointer;
-            padding: 10px;
-            width: 100%;
-            border: none;
-            text-align: left;
-            outline: none;
-            font-size: 16px;
-            background-color: #f1f1f1;
-            border-radius: 4px;
-        }}
-        .active, .collapsible:hover {{
-            background-color: #ddd;
-        }}
-        .content {{
-            padding: 0 18px;
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.2s ease-out;
-            background-color: #f9f9f9;
-        }}
-    </style>
-</head>
-<body>
-    <h1>Rapport de vérification de structure</h1>
-    <p>Projet: {project_path}<br>Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+    <title>Rapport de structure - {html.escape(project_path.name, quote=False)}</title>
+"""
+    yield _HTML_STYLE
+    yield f"""    <h1>Rapport de vérification de structure</h1>
+    <p>Projet: {html.escape(str(project_path), quote=False)}<br>Date: {time.strftime(_REPORT_DATE_FORMAT)}</p>
     
     <div class="summary">
         <h2>Résumé</h2>
@@ -555,96 +730,131 @@ def generate_html_report(
     
     # Ajouter les problèmes au rapport, regroupés par type
     for issue_type, type_issues in sorted(issues_by_type.items()):
-        html_content += f"""
+        yield f"""
     <div class="issue-type">
         <h3>{issue_type.replace('_', ' ').title()} ({len(type_issues)})</h3>
         <ul class="issue-list">
 """
         
-        for issue in sorted(type_issues, key=lambda x: x.get('path', '')):
-            level_icon = "🔴" if issue['level'] == 'error' else "🟠"
-            icon_class = "error-icon" if issue['level'] == 'error' else "warning-icon"
-            path = issue.get('path', 'N/A')
-            html_content += f"""
-            <li class="issue-item">
-                <span class="{icon_class}">{level_icon}</span>
-                <span class="path">{path}</span>: {issue['message']}
-            </li>"""
+        # Préparer les lignes (classe, icône, chemin et message échappés) avant l'émission
+        rows = []
+        for issue in _sort_by_path(type_issues):
+            level = issue['level']
+            rows.append((
+                _ICON_CLASS.get(level, _ICON_CLASS_DEFAULT), _LEVEL_ICON.get(level, _LEVEL_ICON_DEFAULT),
+                html.escape(issue.get('path', 'N/A'), quote=False),
+                html.escape(issue['message'], quote=False)
+            ))
+        
+        yield "".join(starmap(_HTML_ISSUE_ITEM.format, rows))
         
-        html_content += """
+        yield """
         </ul>
     </div>
 """
     
     # Ajouter le plan de correction
-    html_content += """
+    yield """
     <h2>Plan de correction</h2>
     <p>Voici les étapes recommandées pour résoudre les problèmes détectés:</p>
 """
     
-    for i, step in enumerate(correction_plan, 1):
-        html_content += f"""
+    for i, step in enumerate(plan, 1):
+        yield f"""
     <div class="plan-step">
-        <button class="collapsible">Étape {i}: {step['title']} ({step['count']} éléments)</button>
+        <button class="collapsible">Étape {i}: {html.escape(step['title'], quote=False)} ({step['count']} éléments)</button>
         <div class="content">
             <p>{step['description']}</p>
             <h4>Exemples:</h4>
             <ul>
 """
         
-        for item in step['items'][:5]:  # Limiter à 5 exemples
-            path = item.get('path', 'N/A')
-            message = item.get('message', 'N/A')
-            html_content += f"""
+        for item in islice(step['items'], 5):  # Limiter à 5 exemples
+            path = html.escape(item.get('path', 'N/A'), quote=False)
+            message = html.escape(item.get('message', 'N/A'), quote=False)
+            yield f"""
                 <li><code>{path}</code>: {message}</li>"""
         
         if len(step['items']) > 5:
-            html_content += f"""
+            yield f"""
                 <li>... et {len(step['items']) - 5} autres éléments</li>"""
         
-        html_content += """
+        yield """
             </ul>
         </div>
     </div>
 """
     
     # Ajouter les recommandations et le script JavaScript pour les éléments collapsibles
-    html_content += """
-    <h2>Recommandations</h2>
-    <ol>
-        <li>Corriger d'abord les erreurs critiques liées à la structure de base du projet</li>
-        <li>Résoudre ensuite les problèmes de frontmatter dans les fichiers spécifiques</li>
-        <li>Vérifier et corriger les liens internes cassés</li>
-        <li>Exécuter à nouveau une vérification pour confirmer que tous les problèmes ont été résolus</li>
-    </ol>
-    
-    <script>
-    var coll = document.getElementsByClassName("collapsible");
-    var i;
+    yield _HTML_FOOTER
+
+def generate_html_report(
+    project_path: Union[str, Path], 
+    issues: List[Dict[str, Any]], 
+    output_file: Optional[str] = "structure-report.html"
+) -> str:
+    """
+    Crée un rapport au format HTML des problèmes de structure détectés,
+    avec fonctionnalités interactives.
     
-    for (i = 0; i < coll.length; i++) {
-        coll[i].addEventListener("click", function() {
-            this.classList.toggle("active");
-            var content = this.nextElementSibling;
-            if (content.style.maxHeight) {
-                content.style.maxHeight = null;
-            } else {
-                content.style.maxHeight = content.scrollHeight + "px";
-            }
-        });
-    }
-    </script>
-</body>
-</html>
-"""
+    Args:
+        project_path: Chemin de base du projet
+        issues: Liste des problèmes détectés
+        output_file: Nom du fichier de sortie (facultatif)
+        
+    Returns:
+        Chemin du fichier de rapport créé
+    """
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
     
-    # Écrire le rapport dans un fichier si un nom est spécifié
+    # Écrire le rapport dans un fichier si un nom est spécifié, au fil de sa production
     if output_file:
         output_path = project_path / output_file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        _write_report(output_path, _iter_html_report_chunks(project_path, issues))
         
         logger.info(f"Rapport HTML de structure créé: {output_path}")
         return str(output_path)
     
-    return html_content
\ No newline at end of file
+    return "".join(_iter_html_report_chunks(project_path, issues))
+
+def generate_both_reports(
+    project_path: Union[str, Path], 
+    issues: List[Dict[str, Any]], 
+    markdown_file: str = "structure-report.md",
+    html_file: str = "structure-report.html"
+) -> Tuple[str, str]:
+    """
+    Crée les rapports Markdown et HTML en partageant le travail commun.
+    
+    Le comptage, le regroupement et le plan de correction ne sont calculés
+    qu'une fois; les deux fichiers sont ensuite écrits en parallèle.
+    
+    Args:
+        project_path: Chemin de base du projet
+        issues: Liste des problèmes détectés
+        markdown_file: Nom du fichier de sortie Markdown
+        html_file: Nom du fichier de sortie HTML
+        
+    Returns:
+        Tuple (chemin du rapport Markdown, chemin du rapport HTML)
+    """
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
+    
+    summary = _count_and_group_by_type(issues)
+    plan = generate_correction_plan(issues)
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        markdown_future = executor.submit(
+            _write_report, project_path / markdown_file,
+            _iter_structure_report_chunks(project_path, issues, summary, plan)
+        )
+        html_future = executor.submit(
+            _write_report, project_path / html_file,
+            _iter_html_report_chunks(project_path, issues, summary, plan)
+        )
+        markdown_path, html_path = markdown_future.result(), html_future.result()
+    
+    logger.info(f"Rapports de structure créés: {markdown_path}, {html_path}")
+    return markdown_path, html_path
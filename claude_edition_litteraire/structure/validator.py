@@ -2,14 +2,24 @@
 Module pour la validation de structure d'un projet littéraire.
 """
 
+import codecs
 import os
 import re
+import stat
+import threading
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Set, Tuple
 
 from ..utils.logging import get_logger
 
+# Chargeur YAML en C (libyaml) si disponible, sinon le chargeur Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = get_logger(__name__)
 
 # Structure attendue du projet basée sur le guide complet
@@ -125,40 +135,349 @@ DEFAULT_FRONTMATTER_RULES = {
     }
 }
 
+# Dossiers dont le contenu n'est jamais parcouru (exports, dépendances, caches)
+SKIP_DIRS = frozenset(('export', 'node_modules', '__pycache__', 'venv'))
+
+# Nombre maximal de threads pour lire et analyser les fichiers en parallèle
+_MAX_IO_WORKERS = 32
+
+# Expressions compilées une fois pour toutes les vérifications
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+# Ligne « clé: valeur » d'un frontmatter plat (voir _parse_flat_frontmatter)
+_FLAT_FRONTMATTER_LINE_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?\Z')
+# Mots que YAML convertit en booléen ou en null
+_YAML_SPECIAL_WORDS = frozenset(
+    word for base in ('yes', 'no', 'true', 'false', 'on', 'off', 'null')
+    for word in (base, base.capitalize(), base.upper())
+)
+# Liens wiki [[lien|alias]] (groupe 1) ou markdown [texte](lien) (groupe 2), en un seul balayage
+_LINK_RE = re.compile(r'\[\[(.*?)(?:\|.*?)?\]\]|\[.*?\]\((.*?)\)')
+
+# Séparateur / natif: les liens simples peuvent être joints sans os.path.normpath
+_POSIX_PATHS = os.sep == '/'
+
+# Ouverture en binaire (sans conversion des fins de ligne par Windows)
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+# Lecture du frontmatter seul: par blocs, jusqu'à une limite au-delà de laquelle tout est lu
+_FRONTMATTER_CHUNK_SIZE = 8192
+_FRONTMATTER_MAX_PARTIAL = 65536
+
+def _normalize_newlines(content: str) -> str:
+    """
+    Normalise les fins de ligne comme open() en mode texte.
+    
+    Args:
+        content: Texte décodé
+        
+    Returns:
+        Texte aux fins de ligne normalisées
+    """
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def _read_text(file_path: Union[str, Path]) -> str:
+    """
+    Lit un fichier texte UTF-8 en un seul appel read dimensionné par fstat.
+    
+    Les fins de ligne sont normalisées comme par open() en mode texte.
+    
+    Args:
+        file_path: Chemin du fichier
+        
+    Returns:
+        Contenu du fichier
+    """
+    fd = os.open(file_path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Lecture incomplète possible sur certains systèmes de fichiers
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    
+    return _normalize_newlines(data.decode('utf-8'))
+
+def _read_frontmatter_text(file_path: Union[str, Path]) -> str:
+    """
+    Lit le début d'un fichier markdown, juste assez pour en extraire le frontmatter.
+    
+    Le fichier est lu par blocs jusqu'à ce que le frontmatter soit complet, ou que
+    le texte lu ne puisse plus en contenir. Au-delà de _FRONTMATTER_MAX_PARTIAL
+    octets, le reste du fichier est lu en entier.
+    
+    Args:
+        file_path: Chemin du fichier
+        
+    Returns:
+        Début du contenu, qui contient le frontmatter s'il existe
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    text = ""
+    read_size = 0
+    fd = os.open(file_path, _READ_FLAGS)
+    try:
+        while True:
+            chunk_size = _FRONTMATTER_CHUNK_SIZE if read_size < _FRONTMATTER_MAX_PARTIAL else 1 << 20
+            chunk = os.read(fd, chunk_size)
+            read_size += len(chunk)
+            text += decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                break
+            
+            if read_size <= _FRONTMATTER_MAX_PARTIAL:
+                content = _normalize_newlines(text)
+                # Pas de frontmatter possible, ou frontmatter déjà complet
+                if (len(content) >= 3 and not content.startswith('---')) or _FRONTMATTER_RE.match(content):
+                    return content
+    finally:
+        os.close(fd)
+    
+    return _normalize_newlines(text)
+
+class ProjectIndex:
+    """
+    Inventaire d'un projet obtenu en un seul parcours de l'arborescence.
+    
+    Les dossiers cachés ne sont pas parcourus, et le contenu des dossiers export
+    et des dossiers d'outils (SKIP_DIRS) n'est pas inventorié (les vérifications
+    ne les examinent pas).
+    
+    Le contenu des fichiers markdown lus via read() est conservé pour la durée de
+    vie de l'inventaire, afin que chaque vérification ne relise pas les mêmes fichiers.
+    
+    Attributes:
+        entries: Type de chaque élément par chemin relatif (True pour un dossier)
+        md_files: Chemins relatifs des fichiers markdown à vérifier
+        root: Chemin de base du projet
+    """
+    
+    def __init__(self, entries: Dict[str, bool], md_files: List[str], root: Union[str, Path]):
+        self.entries = entries
+        self.md_files = md_files
+        self.root = os.fspath(root)
+        self._contents = {}
+        self._read_locks = {}
+        self._lock = threading.Lock()
+    
+    def read(self, rel_path: str) -> str:
+        """
+        Lit un fichier du projet, une seule fois même depuis plusieurs threads.
+        
+        Args:
+            rel_path: Chemin relatif du fichier
+            
+        Returns:
+            Contenu du fichier
+        """
+        content = self._contents.get(rel_path)
+        if content is not None:
+            return content
+        
+        with self._lock:
+            read_lock = self._read_locks.setdefault(rel_path, threading.Lock())
+        
+        # Un thread qui demande un fichier en cours de lecture attend le résultat
+        with read_lock:
+            content = self._contents.get(rel_path)
+            if content is None:
+                content = _read_text(os.path.join(self.root, rel_path))
+                self._contents[rel_path] = content
+        
+        return content
+    
+    def read_frontmatter(self, rel_path: str) -> str:
+        """
+        Lit le début d'un fichier, juste assez pour en extraire le frontmatter.
+        
+        Le contenu complet est réutilisé s'il a déjà été lu par read().
+        
+        Args:
+            rel_path: Chemin relatif du fichier
+            
+        Returns:
+            Début du contenu, qui contient le frontmatter s'il existe
+        """
+        content = self._contents.get(rel_path)
+        if content is not None:
+            return content
+        return _read_frontmatter_text(os.path.join(self.root, rel_path))
+    
+    def subset(self, md_files: List[str]) -> 'ProjectIndex':
+        """
+        Restreint l'inventaire à certains fichiers markdown, en partageant les contenus lus.
+        
+        Args:
+            md_files: Chemins relatifs des fichiers markdown à conserver
+            
+        Returns:
+            Inventaire restreint
+        """
+        index = ProjectIndex(self.entries, md_files, self.root)
+        index._contents = self._contents
+        index._read_locks = self._read_locks
+        index._lock = self._lock
+        return index
+
+def build_project_index(project_path: Union[str, Path]) -> ProjectIndex:
+    """
+    Parcourt le projet une seule fois pour alimenter toutes les vérifications.
+    
+    Args:
+        project_path: Chemin de base du projet
+        
+    Returns:
+        Inventaire du projet
+    """
+    root = os.fspath(project_path)
+    entries = {}
+    md_files = []
+    
+    for dirpath, dirs, files in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        if rel_dir == os.curdir:
+            rel_dir = ""
+        
+        for name in dirs:
+            entries[os.path.join(rel_dir, name)] = True
+        for name in files:
+            rel_path = os.path.join(rel_dir, name)
+            entries[rel_path] = False
+            if name.endswith('.md') and not name.startswith('.'):
+                md_files.append(rel_path)
+        
+        # Ne pas descendre dans les dossiers cachés, les exports ni les dossiers d'outils
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS]
+    
+    # Un seul tri à la fin (et non par dossier) pour un ordre des problèmes reproductible
+    md_files.sort()
+    
+    return ProjectIndex(entries, md_files, root)
+
+def _flatten_structure(structure: Dict, prefix: str = "") -> List[tuple]:
+    """
+    Aplatit une structure attendue en liste parcourue dans l'ordre en profondeur.
+    
+    Args:
+        structure: Structure attendue (dictionnaire imbriqué)
+        prefix: Chemin relatif du niveau courant
+        
+    Returns:
+        Liste de tuples (chemin relatif, type attendu, requis, nombre de descendants)
+    """
+    flat = []
+    for name, details in structure.items():
+        current_path = os.path.join(prefix, name)
+        children = _flatten_structure(details['children'], current_path) if 'children' in details else []
+        flat.append((current_path, details['type'], details.get('required', False), len(children)))
+        flat.extend(children)
+    return flat
+
+# Structure par défaut aplatie une fois pour toutes au chargement du module
+_FLAT_DEFAULT_STRUCTURE = _flatten_structure(DEFAULT_EXPECTED_STRUCTURE)
+
+def _list_directory(dir_path: str) -> Optional[Dict[str, os.DirEntry]]:
+    """
+    Liste un dossier en un seul appel à scandir.
+    
+    Args:
+        dir_path: Chemin du dossier
+        
+    Returns:
+        Entrées du dossier par nom, ou None si le dossier est illisible
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+def _probe_path(root: str, current_path: str, listings: Dict[str, Optional[Dict[str, os.DirEntry]]]) -> Optional[bool]:
+    """
+    Détermine si un élément attendu existe et s'il s'agit d'un dossier.
+    
+    Chaque dossier parent n'est listé qu'une fois ; un stat n'est fait que pour
+    les liens symboliques et les noms absents du listing (systèmes de fichiers
+    insensibles à la casse).
+    
+    Args:
+        root: Chemin de base du projet
+        current_path: Chemin relatif de l'élément
+        listings: Listings des dossiers parents déjà lus
+        
+    Returns:
+        True pour un dossier, False pour un fichier, None si l'élément n'existe pas
+    """
+    parent, name = os.path.split(current_path)
+    if parent not in listings:
+        listings[parent] = _list_directory(os.path.join(root, parent))
+    listing = listings[parent]
+    
+    entry = listing.get(name) if listing is not None else None
+    if entry is not None and not entry.is_symlink():
+        return entry.is_dir()
+    
+    try:
+        return stat.S_ISDIR(os.stat(os.path.join(root, current_path)).st_mode)
+    except OSError:
+        return None
+
 def validate_structure(
     project_path: Union[str, Path], 
     expected_structure: Optional[Dict] = None, 
     path: str = "", 
-    issues: Optional[List] = None
+    issues: Optional[List] = None,
+    index: Optional[ProjectIndex] = None
 ) -> List[Dict[str, Any]]:
     """
-    Valide récursivement la structure du projet selon la définition attendue.
+    Valide la structure du projet selon la définition attendue.
+    
+    La structure est parcourue à plat, dans le même ordre que le parcours récursif :
+    les descendants d'un élément manquant ou de type incorrect sont sautés.
     
     Args:
         project_path: Chemin de base du projet
         expected_structure: Structure attendue pour ce niveau, utilise la structure par défaut si None
-        path: Chemin relatif actuel (pour le logging)
+        path: Chemin relatif du niveau validé
         issues: Liste pour accumuler les problèmes détectés
+        index: Inventaire du projet déjà construit, sinon le disque est interrogé
         
     Returns:
         Liste des problèmes détectés
     """
-    if not isinstance(project_path, Path):
-        project_path = Path(project_path)
+    # Une seule conversion: les sondes travaillent sur des chemins str
+    root = os.fspath(project_path)
     
-    if expected_structure is None:
-        expected_structure = DEFAULT_EXPECTED_STRUCTURE
+    if expected_structure is None and not path:
+        flat_structure = _FLAT_DEFAULT_STRUCTURE
+    else:
+        flat_structure = _flatten_structure(
+            DEFAULT_EXPECTED_STRUCTURE if expected_structure is None else expected_structure, path
+        )
     
     if issues is None:
         issues = []
     
-    for name, details in expected_structure.items():
-        current_path = os.path.join(path, name)
-        full_path = project_path / current_path
+    listings = {}
+    i = 0
+    count = len(flat_structure)
+    while i < count:
+        current_path, expected_type, required, descendants = flat_structure[i]
+        i += 1
         
         # Vérifier l'existence de l'élément
-        if not full_path.exists():
-            if details.get('required', False):
+        if index is not None:
+            is_dir = index.entries.get(current_path)
+        else:
+            is_dir = _probe_path(root, current_path, listings)
+        
+        if is_dir is None:
+            if required:
                 issues.append({
                     'level': 'error',
                     'type': 'missing_required',
@@ -172,11 +491,10 @@ def validate_structure(
                     'path': current_path,
                     'message': f"Élément recommandé manquant: {current_path}"
                 })
+            i += descendants
             continue
         
         # Vérifier le type (fichier/dossier)
-        expected_type = details['type']
-        is_dir = full_path.is_dir()
         actual_type = 'dir' if is_dir else 'file'
         
         if expected_type != actual_type:
@@ -186,18 +504,20 @@ def validate_structure(
                 'path': current_path,
                 'message': f"Type incorrect pour {current_path}: attendu {expected_type}, trouvé {actual_type}"
             })
+            i += descendants
             continue
         
-        # Si c'est un dossier avec une structure interne définie, vérifier récursivement
-        if is_dir and 'children' in details:
-            validate_structure(project_path, details['children'], current_path, issues)
+        # La structure interne n'est vérifiée que pour un dossier
+        if not is_dir:
+            i += descendants
     
     return issues
 
 def validate_templates(
     project_path: Union[str, Path], 
     expected_templates: Optional[Dict] = None,
-    issues: Optional[List] = None
+    issues: Optional[List] = None,
+    index: Optional[ProjectIndex] = None
 ) -> List[Dict[str, Any]]:
     """
     Vérifie l'existence des templates requis.
@@ -206,6 +526,7 @@ def validate_templates(
         project_path: Chemin de base du projet
         expected_templates: Dictionnaire des templates attendus, utilise la liste par défaut si None
         issues: Liste pour accumuler les problèmes détectés
+        index: Inventaire du projet déjà construit, sinon le disque est interrogé
         
     Returns:
         Liste des problèmes détectés
@@ -220,7 +541,12 @@ def validate_templates(
         issues = []
     
     templates_dir = project_path / 'templates'
-    if not templates_dir.exists() or not templates_dir.is_dir():
+    if index is not None:
+        has_templates_dir = index.entries.get('templates') is True
+    else:
+        has_templates_dir = templates_dir.is_dir()
+    
+    if not has_templates_dir:
         issues.append({
             'level': 'error',
             'type': 'missing_templates_dir',
@@ -230,8 +556,12 @@ def validate_templates(
         return issues
     
     for template_name, details in expected_templates.items():
-        template_path = templates_dir / template_name
-        if not template_path.exists():
+        if index is not None:
+            exists = os.path.join('templates', template_name) in index.entries
+        else:
+            exists = (templates_dir / template_name).exists()
+        
+        if not exists:
             level = 'error' if details.get('required', False) else 'warning'
             issues.append({
                 'level': level,
@@ -252,31 +582,220 @@ def extract_frontmatter(file_path: Union[str, Path]) -> tuple:
     Returns:
         tuple: (frontmatter_dict, content_str) ou (None, content_str) si pas de frontmatter
     """
-    if not isinstance(file_path, Path):
-        file_path = Path(file_path)
+    return _parse_frontmatter(_read_text(file_path))
+
+def _parse_flat_frontmatter(frontmatter_str: str) -> Optional[Dict[str, Any]]:
+    """
+    Analyse sans YAML un frontmatter fait uniquement de lignes « clé: texte ».
+    
+    Seules les lignes dont YAML ferait à coup sûr une chaîne sont acceptées: valeur
+    commençant par une lettre, sans « : », « # » ni tabulation, et qui n'est pas un
+    booléen ou null YAML. Dans tous les autres cas, le YAML complet est nécessaire.
+    
+    Args:
+        frontmatter_str: Texte du frontmatter, sans les délimiteurs
+        
+    Returns:
+        Dictionnaire du frontmatter, ou None s'il faut passer par l'analyseur YAML
+    """
+    result = {}
+    for line in frontmatter_str.split('\n'):
+        if not line:
+            continue
+        match = _FLAT_FRONTMATTER_LINE_RE.match(line)
+        if match is None:
+            return None
+        key, value = match.groups()
+        if key in _YAML_SPECIAL_WORDS:
+            return None
+        if value:
+            value = value.rstrip(' ')
+        if value:
+            if (not value[0].isalpha() or value in _YAML_SPECIAL_WORDS or not value.isprintable()
+                    or ':' in value or '#' in value):
+                return None
+            result[key] = value
+        else:
+            result[key] = None
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Document vide: laisser YAML décider (None)
+    return result or None
+
+def _parse_frontmatter(content: str) -> tuple:
+    """
+    Sépare et analyse le frontmatter YAML d'un contenu markdown.
     
+    Args:
+        content: Contenu du fichier
+        
+    Returns:
+        tuple: (frontmatter_dict, content_str) ou (None, content_str) si pas de frontmatter
+        
+    Raises:
+        ValueError: Si le YAML du frontmatter est invalide
+    """
     # Rechercher le frontmatter délimité par ---
-    frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+    frontmatter_match = _FRONTMATTER_RE.match(content)
     if not frontmatter_match:
         return None, content
     
     frontmatter_str = frontmatter_match.group(1)
     remaining_content = content[frontmatter_match.end():]
     
+    # Frontmatter plat « clé: texte »: pas besoin de l'analyseur YAML complet
+    frontmatter_dict = _parse_flat_frontmatter(frontmatter_str)
+    if frontmatter_dict is not None:
+        return frontmatter_dict, remaining_content
+    
     try:
-        frontmatter_dict = yaml.safe_load(frontmatter_str)
+        frontmatter_dict = yaml.load(frontmatter_str, Loader=_YamlLoader)
         return frontmatter_dict, remaining_content
     except yaml.YAMLError:
         # En cas d'erreur de parsing, retourner l'erreur
         raise ValueError(f"YAML invalide dans le frontmatter: {frontmatter_str}")
 
+def _check_file_frontmatter(
+    index: ProjectIndex, 
+    str_path: str, 
+    matching_rules: List['_FrontmatterRule']
+) -> List[Dict[str, Any]]:
+    """
+    Vérifie le frontmatter d'un fichier markdown selon les règles qui le concernent.
+    
+    Args:
+        index: Inventaire du projet (pour la lecture du fichier)
+        str_path: Chemin relatif du fichier
+        matching_rules: Règles de frontmatter applicables à ce fichier
+        
+    Returns:
+        Liste des problèmes détectés dans ce fichier
+    """
+    issues = []
+    
+    # Extraire le frontmatter
+    try:
+        frontmatter, _ = _parse_frontmatter(index.read_frontmatter(str_path))
+        
+        if frontmatter is None:
+            issues.append({
+                'level': 'warning',
+                'type': 'missing_frontmatter',
+                'path': str_path,
+                'message': f"Frontmatter YAML manquant dans {str_path}"
+            })
+            return issues
+        
+        # Vérifier les champs requis et recommandés selon les règles
+        for rule in matching_rules:
+            for field in rule.required_fields:
+                if field not in frontmatter:
+                    issues.append({
+                        'level': 'error',
+                        'type': 'missing_required_field',
+                        'path': str_path,
+                        'message': f"Champ requis manquant dans {str_path}: {field}"
+                    })
+            
+            for field in rule.recommended_fields:
+                if field not in frontmatter:
+                    issues.append({
+                        'level': 'warning',
+                        'type': 'missing_recommended_field',
+                        'path': str_path,
+                        'message': f"Champ recommandé manquant dans {str_path}: {field}"
+                    })
+            
+            # Vérifier les tags si définis
+            if 'tags' in frontmatter and rule.valid_tags is not None:
+                tags = frontmatter['tags']
+                if isinstance(tags, str):
+                    # Certains fichiers pourraient avoir les tags comme une chaîne
+                    tags = [tag.strip() for tag in tags.split(',')]
+                
+                valid_tags = rule.valid_tags_list
+                try:
+                    has_valid_tag = not rule.valid_tags.isdisjoint(tags)
+                except TypeError:
+                    # Tag non hachable (liste, dictionnaire...): comparaison un à un
+                    has_valid_tag = any(tag in valid_tags for tag in tags)
+                if not has_valid_tag:
+                    issues.append({
+                        'level': 'warning',
+                        'type': 'invalid_tags',
+                        'path': str_path,
+                        'message': f"Aucun tag valide trouvé dans {str_path}. Tags attendus: {', '.join(valid_tags)}"
+                    })
+    
+    except Exception as e:
+        issues.append({
+            'level': 'error',
+            'type': 'frontmatter_parsing_error',
+            'path': str_path,
+            'message': f"Erreur lors de l'analyse du frontmatter dans {str_path}: {str(e)}"
+        })
+    
+    return issues
+
+class _FrontmatterRule:
+    """
+    Règle de frontmatter préparée une fois pour toutes les vérifications.
+    
+    Attributes:
+        pattern: Motif compilé du chemin des fichiers concernés
+        required_fields: Champs requis
+        recommended_fields: Champs recommandés
+        valid_tags: Tags valides (ensemble), ou None si les tags ne sont pas vérifiés
+        valid_tags_list: Tags valides dans l'ordre de la configuration (pour les messages)
+    """
+    
+    def __init__(self, pattern: str, rules: Dict[str, Any]):
+        self.pattern = re.compile(pattern)
+        self.required_fields = tuple(rules.get('required_fields', ()))
+        self.recommended_fields = tuple(rules.get('recommended_fields', ()))
+        if 'valid_tags' in rules:
+            self.valid_tags_list = rules['valid_tags']
+            self.valid_tags = frozenset(self.valid_tags_list)
+        else:
+            self.valid_tags_list = None
+            self.valid_tags = None
+
+def _compile_frontmatter_rules(frontmatter_rules: Dict) -> Tuple[Dict[str, List[_FrontmatterRule]], List[_FrontmatterRule]]:
+    """
+    Compile les motifs des règles de frontmatter et les répartit par dossier racine.
+    
+    Un motif qui commence par un nom de dossier littéral suivi de / ne peut
+    s'appliquer qu'aux fichiers de ce dossier. Les autres motifs sont essayés
+    pour tous les fichiers. L'ordre des règles est conservé dans chaque liste.
+    
+    Args:
+        frontmatter_rules: Règles par motif de chemin
+        
+    Returns:
+        tuple: (règles applicables par dossier racine, règles sans dossier racine)
+    """
+    compiled = []
+    for pattern, rules in frontmatter_rules.items():
+        top, sep, _ = pattern.partition('/')
+        # Préfixe utilisable seulement s'il est littéral et sans alternative
+        if not sep or '|' in pattern or re.escape(top) != top:
+            top = None
+        compiled.append((top, _FrontmatterRule(pattern, rules)))
+    
+    unprefixed_rules = [rule for top, rule in compiled if top is None]
+    rules_by_top = {}
+    for top in {top for top, _ in compiled if top is not None}:
+        rules_by_top[top] = [rule for rule_top, rule in compiled if rule_top in (top, None)]
+    
+    return rules_by_top, unprefixed_rules
+
+# Règles par défaut préparées au chargement du module
+_DEFAULT_COMPILED_RULES = _compile_frontmatter_rules(DEFAULT_FRONTMATTER_RULES)
+
 def validate_frontmatter(
     project_path: Union[str, Path], 
     frontmatter_rules: Optional[Dict] = None,
-    issues: Optional[List] = None
+    issues: Optional[List] = None,
+    index: Optional[ProjectIndex] = None
 ) -> List[Dict[str, Any]]:
     """
     Vérifie les frontmatter YAML des fichiers markdown selon les règles définies.
@@ -285,6 +804,7 @@ def validate_frontmatter(
         project_path: Chemin de base du projet
         frontmatter_rules: Règles pour les frontmatter, utilise les règles par défaut si None
         issues: Liste pour accumuler les problèmes détectés
+        index: Inventaire du projet déjà construit, sinon le projet est parcouru
         
     Returns:
         Liste des problèmes détectés
@@ -298,86 +818,107 @@ def validate_frontmatter(
     if issues is None:
         issues = []
     
-    # Parcourir tous les fichiers markdown du projet
-    for md_file in project_path.glob('**/*.md'):
-        # Ignorer les fichiers dans .git, export, etc.
-        if any(part.startswith('.') for part in md_file.parts) or 'export' in md_file.parts:
-            continue
-        
-        relative_path = md_file.relative_to(project_path)
-        str_path = str(relative_path)
-        
-        # Vérifier si ce fichier correspond à une règle de frontmatter
-        matching_rules = []
-        for pattern, rules in frontmatter_rules.items():
-            if re.match(pattern, str_path):
-                matching_rules.append(rules)
+    if index is None:
+        index = build_project_index(project_path)
+    
+    # Compiler les motifs des règles une seule fois, et non pour chaque fichier
+    if frontmatter_rules is DEFAULT_FRONTMATTER_RULES:
+        rules_by_top, unprefixed_rules = _DEFAULT_COMPILED_RULES
+    else:
+        rules_by_top, unprefixed_rules = _compile_frontmatter_rules(frontmatter_rules)
+    
+    # Parcourir tous les fichiers markdown du projet (hors .git, export, etc.)
+    work = []
+    for str_path in index.md_files:
+        # Vérifier si ce fichier correspond à une règle de frontmatter (celles de son dossier racine)
+        candidate_rules = rules_by_top.get(str_path.partition('/')[0], unprefixed_rules)
+        matching_rules = [rule for rule in candidate_rules if rule.pattern.match(str_path)]
         
         if not matching_rules:
             continue  # Aucune règle spécifique pour ce fichier
         
-        # Extraire le frontmatter
-        try:
-            frontmatter, _ = extract_frontmatter(md_file)
-            
-            if frontmatter is None:
-                issues.append({
-                    'level': 'warning',
-                    'type': 'missing_frontmatter',
-                    'path': str_path,
-                    'message': f"Frontmatter YAML manquant dans {str_path}"
-                })
-                continue
-            
-            # Vérifier les champs requis et recommandés selon les règles
-            for rules in matching_rules:
-                for field in rules.get('required_fields', []):
-                    if field not in frontmatter:
-                        issues.append({
-                            'level': 'error',
-                            'type': 'missing_required_field',
-                            'path': str_path,
-                            'message': f"Champ requis manquant dans {str_path}: {field}"
-                        })
-                
-                for field in rules.get('recommended_fields', []):
-                    if field not in frontmatter:
-                        issues.append({
-                            'level': 'warning',
-                            'type': 'missing_recommended_field',
-                            'path': str_path,
-                            'message': f"Champ recommandé manquant dans {str_path}: {field}"
-                        })
-                
-                # Vérifier les tags si définis
-                if 'tags' in frontmatter and 'valid_tags' in rules:
-                    tags = frontmatter['tags']
-                    if isinstance(tags, str):
-                        # Certains fichiers pourraient avoir les tags comme une chaîne
-                        tags = [tag.strip() for tag in tags.split(',')]
-                    
-                    valid_tags = rules['valid_tags']
-                    if not any(tag in valid_tags for tag in tags):
-                        issues.append({
-                            'level': 'warning',
-                            'type': 'invalid_tags',
-                            'path': str_path,
-                            'message': f"Aucun tag valide trouvé dans {str_path}. Tags attendus: {', '.join(valid_tags)}"
-                        })
-        
-        except Exception as e:
+        work.append((index, str_path, matching_rules))
+    
+    # Lire et analyser les fichiers en parallèle (l'ordre des problèmes est conservé)
+    if work:
+        with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(work))) as executor:
+            for file_issues in executor.map(_check_file_frontmatter, *zip(*work)):
+                issues.extend(file_issues)
+    
+    return issues
+
+def _find_broken_links(
+    index: ProjectIndex, 
+    str_path: str, 
+    existing_files: Set[str]
+) -> List[Dict[str, Any]]:
+    """
+    Recherche les liens internes cassés d'un fichier markdown.
+    
+    Args:
+        index: Inventaire du projet (pour la lecture du fichier)
+        str_path: Chemin relatif du fichier (pour les messages et les liens relatifs)
+        existing_files: Chemins relatifs des fichiers markdown existants
+        
+    Returns:
+        Liste des liens cassés détectés dans ce fichier
+    """
+    issues = []
+    
+    content = index.read(str_path)
+    
+    # Rechercher les liens wiki [[lien]] et markdown [texte](lien) en un seul parcours
+    wiki_links = []
+    md_links = []
+    for match in _LINK_RE.finditer(content):
+        if match.lastindex == 1:
+            wiki_links.append(match.group(1))
+        else:
+            md_links.append(match.group(2))
+    
+    # Dossier du fichier, base des liens relatifs
+    current_dir = os.path.dirname(str_path)
+    dir_prefix = current_dir + '/' if current_dir else ''
+    
+    # Vérifier tous les liens (liens wiki d'abord)
+    all_links = wiki_links + md_links
+    for link in all_links:
+        # Ignorer les liens externes et les ancres
+        if link.startswith(('http://', 'https://', '#')):
+            continue
+        
+        # Normaliser le lien
+        link = link.partition('#')[0]  # Enlever les ancres
+        
+        # Si le lien est relatif au dossier courant du fichier
+        if not link.startswith('/'):
+            if _POSIX_PATHS and link and './' not in link and '//' not in link and not link.endswith(('/', '.')):
+                # Cas courant: aucun composant . ou .. ni séparateur superflu, normpath serait sans effet
+                link = dir_prefix + link
+            else:
+                link = os.path.normpath(os.path.join(current_dir, link))
+        else:
+            # Enlever le / initial pour les chemins absolus dans le projet
+            link = link.lstrip('/')
+        
+        # Vérifier si le fichier cible existe
+        # (un lien peut omettre l'extension .md, y compris vers un fichier « x.md.md »)
+        if (link and link not in existing_files and link + '.md' not in existing_files
+                and link + '.md.md' not in existing_files):
             issues.append({
-                'level': 'error',
-                'type': 'frontmatter_parsing_error',
+                'level': 'warning',
+                'type': 'broken_link',
                 'path': str_path,
-                'message': f"Erreur lors de l'analyse du frontmatter dans {str_path}: {str(e)}"
+                'link': link,
+                'message': f"Lien cassé dans {str_path}: '{link}'"
             })
     
     return issues
 
 def check_broken_links(
     project_path: Union[str, Path], 
-    issues: Optional[List] = None
+    issues: Optional[List] = None,
+    index: Optional[ProjectIndex] = None
 ) -> List[Dict[str, Any]]:
     """
     Vérifie les liens internes cassés dans les fichiers markdown.
@@ -385,6 +926,7 @@ def check_broken_links(
     Args:
         project_path: Chemin de base du projet
         issues: Liste pour accumuler les problèmes détectés
+        index: Inventaire du projet déjà construit, sinon le projet est parcouru
         
     Returns:
         Liste des problèmes détectés
@@ -395,59 +937,20 @@ def check_broken_links(
     if issues is None:
         issues = []
     
-    # Collecter tous les fichiers markdown existants
-    existing_files = set()
-    for md_file in project_path.glob('**/*.md'):
-        if any(part.startswith('.') for part in md_file.parts) or 'export' in md_file.parts:
-            continue
-        
-        relative_path = md_file.relative_to(project_path)
-        existing_files.add(str(relative_path))
-        # Ajouter aussi sans extension .md
-        existing_files.add(str(relative_path)[:-3])
+    if index is None:
+        index = build_project_index(project_path)
     
-    # Vérifier les liens dans chaque fichier
-    for md_file in project_path.glob('**/*.md'):
-        if any(part.startswith('.') for part in md_file.parts) or 'export' in md_file.parts:
-            continue
-        
-        relative_path = md_file.relative_to(project_path)
-        str_path = str(relative_path)
-        
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Rechercher les liens wiki [[lien]]
-        wiki_links = re.findall(r'\[\[(.*?)(?:\|.*?)?\]\]', content)
-        
-        # Rechercher les liens markdown [texte](lien)
-        md_links = re.findall(r'\[.*?\]\((.*?)\)', content)
-        
-        # Vérifier tous les liens
-        all_links = wiki_links + md_links
-        for link in all_links:
-            # Ignorer les liens externes et les ancres
-            if link.startswith(('http://', 'https://', '#')):
-                continue
-            
-            # Normaliser le lien
-            link = link.split('#')[0]  # Enlever les ancres
-            
-            # Si le lien est relatif au dossier courant du fichier
-            if not link.startswith('/'):
-                current_dir = os.path.dirname(str_path)
-                link = os.path.normpath(os.path.join(current_dir, link))
-            else:
-                # Enlever le / initial pour les chemins absolus dans le projet
-                link = link.lstrip('/')
-            
-            # Vérifier si le fichier cible existe
-            if link and link not in existing_files and link + '.md' not in existing_files:
-                issues.append({
-                    'level': 'warning',
-                    'type': 'broken_link',
-                    'path': str_path,
-                    'message': f"Lien cassé dans {str_path}: '{link}'"
-                })
+    # Collecter tous les fichiers markdown existants (les formes sans .md sont testées à la recherche)
+    existing_files = set(index.md_files)
+    
+    # Vérifier les liens de chaque fichier en parallèle (l'ordre des problèmes est conservé)
+    md_files = index.md_files
+    if md_files:
+        with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(md_files))) as executor:
+            for file_issues in executor.map(
+                lambda str_path: _find_broken_links(index, str_path, existing_files),
+                md_files
+            ):
+                issues.extend(file_issues)
     
     return issues
\ No newline at end of file
@@ -2,6 +2,7 @@
 Module de gestion de configuration pour la bibliothèque.
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
@@ -9,6 +10,12 @@ from typing import Dict, Any, Optional, Union
 
 from .logging import get_logger
 
+# Chargeur et émetteur YAML en C (libyaml) si disponibles
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = get_logger(__name__)
 
 # Configuration par défaut
@@ -42,6 +49,9 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Marqueur des clés absentes dans le cache de get()
+_MISSING = object()
+
 class ConfigManager:
     """
     Gestionnaire de configuration pour le projet littéraire.
@@ -59,7 +69,10 @@ class ConfigManager:
             project_path = Path(project_path)
         
         self.project_path = project_path
-        self.config = DEFAULT_CONFIG.copy()
+        # Copie profonde: set() ne doit pas modifier les valeurs par défaut partagées
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
+        # Valeurs déjà résolues par get(), vidé à chaque modification
+        self._get_cache = {}
         
         # Charger la configuration
         if config_path:
@@ -87,10 +100,11 @@ class ConfigManager:
         """
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                user_config = yaml.safe_load(f)
+                user_config = yaml.load(f, Loader=_YamlLoader)
             
             # Fusionner avec la configuration par défaut
             self._merge_configs(self.config, user_config)
+            self._get_cache.clear()
             
             logger.info(f"Configuration chargée depuis {self.config_path}")
         except Exception as e:
@@ -98,19 +112,23 @@ class ConfigManager:
     
     def _merge_configs(self, base: Dict[str, Any], update: Dict[str, Any]):
         """
-        Fusionne deux dictionnaires de configuration de manière récursive.
+        Fusionne deux dictionnaires de configuration, sous-dictionnaires compris.
         
         Args:
             base: Dictionnaire de base à mettre à jour
             update: Dictionnaire contenant les mises à jour
         """
-        for key, value in update.items():
-            if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-                # Fusion récursive pour les sous-dictionnaires
-                self._merge_configs(base[key], value)
-            else:
-                # Remplacement direct pour les autres valeurs
-                base[key] = value
+        # Parcours itératif des niveaux imbriqués, avec une pile explicite
+        stack = [(base, update)]
+        while stack:
+            base_level, update_level = stack.pop()
+            for key, value in update_level.items():
+                if isinstance(value, dict) and isinstance(base_level.get(key), dict):
+                    # Fusion des sous-dictionnaires
+                    stack.append((base_level[key], value))
+                else:
+                    # Remplacement direct pour les autres valeurs
+                    base_level[key] = value
     
     def save(self):
         """
@@ -121,7 +139,7 @@ class ConfigManager:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                yaml.dump(self.config, f, Dumper=_YamlDumper, default_flow_style=False)
             
             logger.info(f"Configuration sauvegardée dans {self.config_path}")
             return True
@@ -140,6 +158,23 @@ class ConfigManager:
         Returns:
             Valeur de configuration
         """
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._lookup(key)
+        
+        return default if value is _MISSING else value
+    
+    def _lookup(self, key: str) -> Any:
+        """
+        Recherche une valeur de configuration dans le dictionnaire.
+        
+        Args:
+            key: Clé de configuration (peut être un chemin avec des points)
+            
+        Returns:
+            Valeur de configuration, ou _MISSING si la clé n'existe pas
+        """
         # Gestion des clés hiérarchiques (par exemple "export.pdf.engine")
         if '.' in key:
             parts = key.split('.')
@@ -149,11 +184,11 @@ class ConfigManager:
                 if part in value:
                     value = value[part]
                 else:
-                    return default
+                    return _MISSING
             
             return value
         else:
-            return self.config.get(key, default)
+            return self.config.get(key, _MISSING)
     
     def set(self, key: str, value: Any):
         """
@@ -163,6 +198,8 @@ class ConfigManager:
             key: Clé de configuration (peut être un chemin avec des points)
             value: Valeur à définir
         """
+        self._get_cache.clear()
+        
         # Gestion des clés hiérarchiques
         if '.' in key:
             parts = key.split('.')
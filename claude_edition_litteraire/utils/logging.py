@@ -4,35 +4,29 @@ Module de journalisation pour la bibliothèque.
 
 import os
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
 
-def get_logger(name, level=logging.INFO):
+# Logger racine du paquet: les loggers des modules lui transmettent leurs messages
+_PACKAGE_LOGGER = logging.getLogger(__name__.split('.')[0])
+_configure_lock = threading.Lock()
+_configured_names = set()
+
+def _configure_package_logger():
     """
-    Retourne un logger configuré pour le module spécifié.
+    Attache les gestionnaires console et fichier au logger du paquet, une seule fois par processus.
     
-    Args:
-        name: Nom du module
-        level: Niveau de journalisation
-        
     Returns:
-        Instance de logger configurée
+        Liste des gestionnaires partagés
     """
-    # Si le logger existe déjà, on le retourne
-    if name in logging.Logger.manager.loggerDict:
-        return logging.getLogger(name)
-    
-    # Créer un nouveau logger
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
     # Formateur pour les messages
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     
     # Gestionnaire de console
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    _PACKAGE_LOGGER.addHandler(console_handler)
     
     # Gestionnaire de fichier
     try:
@@ -44,9 +38,37 @@ def get_logger(name, level=logging.INFO):
         log_file = logs_dir / f"claude_edition_{datetime.now().strftime('%Y%m%d')}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        _PACKAGE_LOGGER.addHandler(file_handler)
     except Exception as e:
         # En cas d'erreur, on utilise seulement la console
-        logger.warning(f"Impossible de créer le fichier de log: {e}")
+        _PACKAGE_LOGGER.warning(f"Impossible de créer le fichier de log: {e}")
+    
+    return list(_PACKAGE_LOGGER.handlers)
+
+_SHARED_HANDLERS = _configure_package_logger()
+
+def get_logger(name, level=logging.INFO):
+    """
+    Retourne un logger configuré pour le module spécifié.
+    
+    Args:
+        name: Nom du module
+        level: Niveau de journalisation
+        
+    Returns:
+        Instance de logger configurée
+    """
+    logger = logging.getLogger(name)
+    
+    with _configure_lock:
+        # Le niveau n'est fixé qu'au premier appel pour ce nom
+        if name not in _configured_names:
+            _configured_names.add(name)
+            logger.setLevel(level)
+            
+            # Hors du paquet (par exemple __main__), les messages ne remontent pas au logger du paquet
+            if name != _PACKAGE_LOGGER.name and not name.startswith(_PACKAGE_LOGGER.name + '.'):
+                for handler in _SHARED_HANDLERS:
+                    logger.addHandler(handler)
     
     return logger
@@ -5,7 +5,10 @@ Script pour tester les différents modèles Claude configurés.
 
 import os
 import sys
+import asyncio
 import logging
+import argparse
+from itertools import groupby
 from typing import List, Dict, Any
 
 # Configurer le logging
@@ -21,8 +24,57 @@ except ImportError:
     logger.error("Module claude_provider.py non trouvé. Exécutez ce script depuis la racine du projet.")
     sys.exit(1)
 
-def test_claude_models():
-    """Teste tous les modèles Claude configurés."""
+async def _probe_models(provider, messages: List[Dict[str, Any]], names: List[str]) -> List[Any]:
+    """
+    Interroge les modèles en parallèle via le client asynchrone du provider.
+    
+    Returns:
+        Réponse ou exception de chaque modèle, dans l'ordre des noms
+    """
+    async def _probe(name):
+        logger.info(f"Test du modèle {name} ({CLAUDE_MODELS[name]})...")
+        return await provider.achat(messages, max_tokens=10, model_name=name)
+    
+    return await asyncio.gather(*(_probe(name) for name in names), return_exceptions=True)
+
+# Gammes de modèles, de la moins chère à la plus chère
+_COST_TIERS = ("haiku", "sonnet", "opus")
+
+def _cost_tier(model_id: str) -> int:
+    """Rang de coût d'un modèle d'après son identifiant (inconnu: le plus cher)."""
+    return next((rank for rank, tier in enumerate(_COST_TIERS) if tier in model_id), len(_COST_TIERS))
+
+async def _probe_by_tier(provider, messages: List[Dict[str, Any]], tiers: List[List[str]],
+                         quick: bool = False) -> Dict[str, Any]:
+    """
+    Interroge les gammes de modèles de la moins chère à la plus chère.
+    
+    Les modèles d'une même gamme sont interrogés en parallèle; une gamme plus
+    chère n'est testée que si toute la gamme précédente a répondu.
+    
+    Returns:
+        Réponse ou exception de chaque modèle testé
+    """
+    responses = {}
+    for names in tiers:
+        tier_responses = await _probe_models(provider, messages, names)
+        responses.update(zip(names, tier_responses))
+        
+        if quick:
+            break
+        if any(isinstance(response, Exception) for response in tier_responses):
+            logger.warning("Échec dans une gamme de modèles: gammes supérieures non testées.")
+            break
+    
+    return responses
+
+def test_claude_models(quick: bool = False):
+    """
+    Teste les modèles Claude configurés, du moins cher au plus cher.
+    
+    Args:
+        quick: Si True, ne teste que la gamme la moins chère
+    """
     
     # Vérifier que la clé API est définie
     api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -44,24 +96,29 @@ def test_claude_models():
     
     results = {}
     
-    # Tester chaque modèle complet (pas les alias)
-    for name, model in CLAUDE_MODELS.items():
-        if name == "default":
-            continue  # Sauter l'alias "default" car il pointe vers un autre modèle
-            
-        logger.info(f"Test du modèle {name} ({model})...")
-        try:
-            response = provider.chat(messages, max_tokens=10, model_name=name)
+    # Tester chaque modèle complet (pas l'alias "default", qui pointe vers un autre modèle)
+    names = sorted(
+        (name for name in CLAUDE_MODELS if name != "default"),
+        key=lambda name: _cost_tier(CLAUDE_MODELS[name])
+    )
+    tiers = [list(group) for _, group in groupby(names, key=lambda name: _cost_tier(CLAUDE_MODELS[name]))]
+    
+    # Une gamme à la fois, ses modèles en parallèle
+    responses = asyncio.run(_probe_by_tier(provider, messages, tiers, quick))
+    
+    for name, response in responses.items():
+        if isinstance(response, Exception):
+            logger.error(f"❌ Modèle {name}: {str(response)}")
+            results[name] = {"status": "error", "error": str(response)}
+        else:
             logger.info(f"✅ Modèle {name}: {response}")
             results[name] = {"status": "success", "response": response}
-        except Exception as e:
-            logger.error(f"❌ Modèle {name}: {str(e)}")
-            results[name] = {"status": "error", "error": str(e)}
     
     # Afficher le récapitulatif
     print("\n====== RÉCAPITULATIF DES TESTS ======")
     successful = sum(1 for r in results.values() if r["status"] == "success")
     print(f"Modèles testés: {len(results)}")
+    print(f"Modèles non testés: {len(names) - len(results)}")
     print(f"Modèles fonctionnels: {successful}")
     print(f"Modèles en erreur: {len(results) - successful}")
     
@@ -80,4 +137,9 @@ def test_claude_models():
             print(f'2. Ou définissez une variable d\'environnement: export CLAUDE_DEFAULT_MODEL="{CLAUDE_MODELS[suggested_default]}"')
 
 if __name__ == "__main__":
-    test_claude_models()
+    parser = argparse.ArgumentParser(description="Teste les modèles Claude configurés.")
+    parser.add_argument("--quick", action="store_true",
+                        help="Ne tester que la gamme de modèles la moins chère (haiku)")
+    args = parser.parse_args()
+    
+    test_claude_models(quick=args.quick)
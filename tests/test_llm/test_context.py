@@ -1,9 +1,4 @@
 import pytest
-import sys
-import os
-
-# Ajouter une méthode d'importation plus sûre
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import direct sans passer par le package principal
 from claude_edition_litteraire.llm.context import ContextCompressor
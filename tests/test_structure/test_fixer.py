@@ -0,0 +1,131 @@
+import pytest
+import os
+
+from claude_edition_litteraire.structure.fixer import (
+    _compile_template, _parse_selection, fix_missing_files, detect_common_path_issues, find_similar_files, fix_broken_links, replace_prefix_in_links, replace_link_in_content
+)
+
+def test_find_similar_files(tmp_path):
+    """Teste la recherche de fichiers portant le même nom que le lien cassé."""
+    (tmp_path / "personnages").mkdir()
+    (tmp_path / "personnages" / "alice.md").write_text("# Alice", encoding="utf-8")
+    (tmp_path / "export").mkdir()
+    (tmp_path / "export" / "alice.md").write_text("# Alice", encoding="utf-8")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "alice.md").write_text("# Alice", encoding="utf-8")
+    
+    result = find_similar_files(tmp_path, "docs/personnages/alice")
+    
+    # Seul le fichier hors des dossiers exclus est proposé
+    assert len(result) == 1
+    assert result[0][0] == os.path.join("personnages", "alice.md")
+    assert result[0][1] == pytest.approx(0.9)
+
+def test_parse_selection():
+    """Teste l'interprétation des sélections de corrections par plages."""
+    assert _parse_selection("", 3) == {0, 1, 2}
+    assert _parse_selection("n", 3) == set()
+    assert _parse_selection("1-2, 5", 5) == {0, 1, 4}
+    assert _parse_selection("!2", 3) == {0, 2}
+    assert _parse_selection("1-4,!3,x", 4) == {0, 1, 3}
+
+def test_detect_common_path_issues():
+    """Teste le comptage des préfixes, avec ou sans champ 'link'."""
+    issues = [
+        {'type': 'broken_link', 'path': 'a.md', 'link': 'docs/alice',
+         'message': "Lien cassé dans a.md: 'docs/alice'"},
+        {'type': 'broken_link', 'path': 'b.md',
+         'message': "Lien cassé dans b.md: 'docs/bob'"},
+        {'type': 'broken_link', 'path': 'b.md', 'link': 'bob',
+         'message': "Lien cassé dans b.md: 'bob'"},
+        {'type': 'missing_required', 'path': 'docs', 'message': "Dossier requis 'docs' manquant"},
+    ]
+    
+    assert detect_common_path_issues(issues) == {'docs': 2}
+
+def test_compile_template():
+    """Teste que le rendu précompilé équivaut à str.format."""
+    template = "# {title}\n{{brut}} {directory} - {date} - {title:>6}"
+    render = _compile_template(template)
+    
+    assert render("Titre", "docs", "2025-01-01") == template.format(
+        title="Titre", directory="docs", date="2025-01-01"
+    )
+    assert _compile_template("# {title} ({directory})")("A", "b", "") == "# A (b)"
+
+def test_replace_prefix_in_links():
+    """Teste le remplacement de préfixe dans les liens markdown et wiki."""
+    content = "[A](docs/a) [[docs/b|B]] [[docs/c]] docs/d [E](autres/e)"
+    
+    result = replace_prefix_in_links(content, "docs", "personnages")
+    
+    assert result == (
+        "[A](personnages/a) [[personnages/b|B]] [[personnages/c]] docs/d [E](autres/e)"
+    )
+
+def test_replace_link_in_content():
+    """Teste le remplacement d'un lien précis, avec ou sans extension .md."""
+    content = "[A](docs/a) [B](docs/a.md) [[docs/a|A]] [[docs/ab]]"
+    
+    result = replace_link_in_content(content, "docs/a", "personnages/a.md")
+    
+    assert result == (
+        "[A](personnages/a.md) [B](personnages/a.md) [[personnages/a.md|A]] [[docs/ab]]"
+    )
+
+def test_fix_broken_links_rewrites_all_links_of_a_file(tmp_path):
+    """Teste que tous les liens cassés d'un fichier sont corrigés en une fois."""
+    (tmp_path / "personnages").mkdir()
+    (tmp_path / "personnages" / "alice.md").write_text("# Alice", encoding="utf-8")
+    (tmp_path / "personnages" / "bob.md").write_text("# Bob", encoding="utf-8")
+    chapter = tmp_path / "chapitre.md"
+    chapter.write_text("[Alice](docs/alice) et [[anciens/bob|Bob]]", encoding="utf-8")
+    
+    issues = [
+        {'level': 'warning', 'type': 'broken_link', 'path': 'chapitre.md',
+         'message': "Lien cassé dans chapitre.md: 'docs/alice'"},
+        {'level': 'warning', 'type': 'broken_link', 'path': 'chapitre.md',
+         'message': "Lien cassé dans chapitre.md: 'anciens/bob'"},
+    ]
+    
+    assert fix_broken_links(tmp_path, issues, interactive=False) == 1
+    assert chapter.read_text(encoding="utf-8") == (
+        f"[Alice]({os.path.join('personnages', 'alice.md')}) et "
+        f"[[{os.path.join('personnages', 'bob.md')}|Bob]]"
+    )
+
+def test_fix_broken_links_asks_once(tmp_path, monkeypatch):
+    """Teste que le mode interactif valide toutes les propositions en une seule saisie."""
+    (tmp_path / "personnages").mkdir()
+    (tmp_path / "personnages" / "alice.md").write_text("# Alice", encoding="utf-8")
+    (tmp_path / "personnages" / "bob.md").write_text("# Bob", encoding="utf-8")
+    chapter = tmp_path / "chapitre.md"
+    chapter.write_text("[Alice](docs/alice) et [[anciens/bob|Bob]]", encoding="utf-8")
+    
+    issues = [
+        {'level': 'warning', 'type': 'broken_link', 'path': 'chapitre.md',
+         'message': "Lien cassé dans chapitre.md: 'docs/alice'"},
+        {'level': 'warning', 'type': 'broken_link', 'path': 'chapitre.md',
+         'message': "Lien cassé dans chapitre.md: 'anciens/bob'"},
+    ]
+    answers = iter(["!2"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    
+    assert fix_broken_links(tmp_path, issues, interactive=True) == 1
+    assert chapter.read_text(encoding="utf-8") == (
+        f"[Alice]({os.path.join('personnages', 'alice.md')}) et [[anciens/bob|Bob]]"
+    )
+
+def test_fix_missing_files_bad_template(tmp_path):
+    """Teste qu'un template mal formé n'empêche pas la création des autres fichiers."""
+    issues = [
+        {'level': 'error', 'type': 'missing_required', 'path': os.path.join('chapitres', 'index.md')},
+        {'level': 'error', 'type': 'missing_required', 'path': os.path.join('chapitres', 'chapitre-1.md')},
+    ]
+    templates = {'index.md': '{', 'default.md': '# {title}'}
+    fixed_issues = []
+    
+    assert fix_missing_files(tmp_path, issues, templates, fixed_issues) == 1
+    assert (tmp_path / 'chapitres' / 'chapitre-1.md').read_text(encoding='utf-8') == '# Chapitre 1'
+    assert not (tmp_path / 'chapitres' / 'index.md').exists()
+    assert fixed_issues == [issues[1]]
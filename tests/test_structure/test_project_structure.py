@@ -0,0 +1,182 @@
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+from claude_edition_litteraire.structure.project_structure import ProjectStructure
+from claude_edition_litteraire.structure.reporter import group_issues_by_pattern, generate_correction_plan
+
+@pytest.fixture
+def structure(tmp_path):
+    """Crée une structure de projet minimale."""
+    project_path = tmp_path / "roman"
+    (project_path / "chapitres").mkdir(parents=True)
+    (project_path / "chapitres" / "chapitre-1.md").write_text("# Chapitre 1", encoding="utf-8")
+    (project_path / "index.md").write_text("# Roman", encoding="utf-8")
+    (project_path / ".git" / "objects").mkdir(parents=True)
+    (project_path / "__pycache__").mkdir()
+    (project_path / "__pycache__" / "cache.pyc").write_bytes(b"\0")
+    
+    return ProjectStructure(SimpleNamespace(path=project_path, config={}))
+
+def test_create_backup(structure):
+    """Teste que la sauvegarde copie le projet sans les dossiers ignorés."""
+    os.utime(structure.path / "index.md", ns=(1_000_000_000, 1_000_000_000))
+    backup_dir = structure._create_backup()
+    
+    assert backup_dir is not None
+    assert (backup_dir / "index.md").read_text(encoding="utf-8") == "# Roman"
+    assert (backup_dir / "chapitres" / "chapitre-1.md").read_text(encoding="utf-8") == "# Chapitre 1"
+    assert not (backup_dir / ".git").exists()
+    assert not (backup_dir / "__pycache__").exists()
+    assert (backup_dir / "index.md").stat().st_mtime_ns == 1_000_000_000
+    
+    # La sauvegarde ne doit pas suivre les modifications du projet
+    (structure.path / "index.md").write_text("# Modifié", encoding="utf-8")
+    assert (backup_dir / "index.md").read_text(encoding="utf-8") == "# Roman"
+
+def test_create_backup_symlink_loop(structure):
+    """Teste que la sauvegarde ignore une boucle de liens symboliques."""
+    (structure.path / "chapitres" / "boucle").symlink_to(structure.path, target_is_directory=True)
+    
+    backup_path = structure._create_backup()
+    
+    assert (backup_path / "chapitres" / "chapitre-1.md").exists()
+    assert not (backup_path / "chapitres" / "boucle").exists()
+
+def test_validate(structure):
+    """Teste que la validation regroupe les problèmes des quatre vérifications."""
+    (structure.path / "index.md").write_text("[[chapitres/absent]]", encoding="utf-8")
+    
+    issues = structure.validate()
+    types = {issue['type'] for issue in issues}
+    
+    assert {'missing_required', 'missing_templates_dir', 'broken_link'} <= types
+    assert any(issue['path'] == 'README.md' for issue in issues)
+
+def test_validate_cache(structure):
+    """Teste que la validation est réutilisée tant que le projet n'est pas modifié."""
+    first = structure.validate()
+    assert structure.validate() == first
+    
+    (structure.path / "README.md").write_text("# Lisez-moi", encoding="utf-8")
+    second = structure.validate()
+    assert not any(issue['path'] == 'README.md' for issue in second)
+
+def test_fix_missing_templates(structure):
+    """Teste la création des templates de base avec leurs variables remplacées."""
+    issues = [
+        {'type': 'missing_template', 'path': 'templates/chapitre.md'},
+        {'type': 'missing_template', 'path': 'templates/todo.md'},
+        {'type': 'missing_template', 'path': 'templates/inconnu.md'},
+    ]
+    
+    assert structure._fix_missing_templates(issues) == 2
+    
+    chapitre = (structure.path / "templates" / "chapitre.md").read_text(encoding="utf-8")
+    assert chapitre.startswith("---\ntitre: Nouveau Titre\nstatut: brouillon\n")
+    assert "{{" not in chapitre
+    
+    todo = (structure.path / "templates" / "todo.md").read_text(encoding="utf-8")
+    assert "- [[]]" in todo
+    assert not (structure.path / "templates" / "inconnu.md").exists()
+    
+    # Un template existant n'est pas recréé
+    assert structure._fix_missing_templates(issues) == 0
+
+def test_create_backup_reuses_unchanged(structure):
+    """Teste qu'une sauvegarde existante est réutilisée si le projet n'a pas changé."""
+    first = structure._create_backup()
+    
+    assert first is not None
+    assert structure._create_backup() == first
+
+def test_fix_issues(structure):
+    """Teste l'application non interactive du plan de correction."""
+    (structure.path / "templates").mkdir()
+    fixes = structure.fix_issues(interactive=False, backup=False)
+    
+    assert fixes["dirs_created"] > 0
+    assert fixes["files_created"] > 0
+    assert fixes["templates_fixed"] == 4
+    assert fixes["total"] == fixes["dirs_created"] + fixes["files_created"] + fixes["templates_fixed"]
+    assert (structure.path / "README.md").exists()
+    assert (structure.path / "templates" / "chapitre.md").exists()
+
+def test_fix_issues_tracks_fixed(structure, monkeypatch):
+    """Teste que les problèmes résolus sont déduits des corrections, sans nouvelle validation."""
+    (structure.path / "templates").mkdir()
+    issues = structure.validate()
+    monkeypatch.setattr(structure, "validate", lambda: pytest.fail("validate() relancé"))
+    
+    fixed_issues = []
+    structure._apply_corrections(
+        group_issues_by_pattern(issues), generate_correction_plan(issues),
+        {i: True for i in range(1, 10)}, fixed_issues
+    )
+    fixed_paths = {issue['path'] for issue in fixed_issues}
+    assert {"README.md", "templates/chapitre.md"} <= fixed_paths
+    
+    monkeypatch.undo()
+    remaining = {(issue['type'], issue['path']) for issue in structure.validate()}
+    assert not remaining & {(issue['type'], issue['path']) for issue in fixed_issues}
+
+def test_validate_frontmatter_cache(structure, monkeypatch):
+    """Teste que seuls les fichiers modifiés sont relus lors d'une nouvelle validation."""
+    from claude_edition_litteraire.structure import project_structure
+    
+    alice = structure.path / "personnages" / "alice.md"
+    alice.parent.mkdir()
+    alice.write_text("# Alice", encoding="utf-8")
+    first = structure.validate()
+    assert (structure.path / ".claude_structure_cache.json").exists()
+    
+    checked = []
+    original = project_structure.validate_frontmatter
+    def recording_validate_frontmatter(project_path, rules, index=None):
+        checked.extend(index.md_files)
+        return original(project_path, rules, index=index)
+    monkeypatch.setattr(project_structure, "validate_frontmatter", recording_validate_frontmatter)
+    
+    # Nouvelle instance: pas de cache en mémoire, seul le cache sur disque sert
+    fresh = ProjectStructure(structure.project)
+    cached = fresh.validate()
+    assert cached == first
+    assert checked == []
+    assert all(issue['level'] is sys.intern(issue['level']) for issue in cached)
+    
+    alice.write_text("---\nnom: Alice\ntags: mortel\n---\n# Alice modifiée", encoding="utf-8")
+    issues = fresh.validate()
+    assert checked == [os.path.join("personnages", "alice.md")]
+    assert not any(issue['type'] == 'missing_frontmatter' for issue in issues)
+
+def test_validate_frontmatter_cache_version(structure, monkeypatch):
+    """Teste que le cache est invalidé par un changement de version et exclu des sauvegardes."""
+    from claude_edition_litteraire.structure import project_structure
+    
+    structure.validate()
+    backup_dir = structure._create_backup()
+    assert not (backup_dir / ".claude_structure_cache.json").exists()
+    
+    checked = []
+    original = project_structure.validate_frontmatter
+    def recording_validate_frontmatter(project_path, rules, index=None):
+        checked.extend(index.md_files)
+        return original(project_path, rules, index=index)
+    monkeypatch.setattr(project_structure, "validate_frontmatter", recording_validate_frontmatter)
+    monkeypatch.setattr(project_structure, "__version__", "99.0.0")
+    
+    ProjectStructure(structure.project).validate()
+    assert sorted(checked) == sorted(["index.md", os.path.join("chapitres", "chapitre-1.md")])
+
+def test_create_backup_copy_file_range_returns_zero(structure, monkeypatch):
+    """Teste le repli sur une copie classique quand copy_file_range ne copie rien."""
+    from claude_edition_litteraire.structure import project_structure
+    
+    monkeypatch.setattr(project_structure, "fcntl", None)
+    monkeypatch.setattr(project_structure.os, "copy_file_range", lambda *args: 0, raising=False)
+    
+    backup_dir = structure._create_backup()
+    
+    assert (backup_dir / "index.md").read_text(encoding="utf-8") == "# Roman"
+    assert (backup_dir / "chapitres" / "chapitre-1.md").read_text(encoding="utf-8") == "# Chapitre 1"
@@ -0,0 +1,91 @@
+import re
+
+from claude_edition_litteraire.structure.reporter import (
+    _count_and_group_by_type, generate_both_reports, generate_correction_plan, generate_html_report,
+    generate_structure_report, group_issues_by_pattern,
+    present_correction_plan, prioritize_issues
+)
+
+ISSUES = [
+    {'type': 'missing_required', 'path': 'chapitres', 'level': 'error',
+     'message': "Dossier requis manquant: chapitres"},
+    {'type': 'missing_required', 'path': 'index.md', 'level': 'error',
+     'message': "Fichier requis manquant: index.md"},
+    {'type': 'broken_link', 'path': 'a.md', 'level': 'warning', 'link': 'docs/alice',
+     'message': "Lien cassé dans a.md: 'docs/alice'"},
+    {'type': 'broken_link', 'path': 'b.md', 'level': 'warning',
+     'message': "Lien cassé dans b.md: 'paris'"},
+    {'type': 'frontmatter_parsing_error', 'path': 'personnages/alice.md', 'level': 'warning',
+     'message': "Frontmatter invalide"},
+    {'type': 'invalid_tags', 'path': 'notes.md', 'level': 'info',
+     'message': "Tags invalides"},
+]
+
+def test_group_issues_by_pattern():
+    """Teste le regroupement des problèmes par motif en un seul parcours."""
+    groups = group_issues_by_pattern(ISSUES)
+    
+    assert groups['missing_dirs'] == [ISSUES[0]]
+    assert groups['missing_files'] == [ISSUES[1]]
+    assert groups['broken_links'] == {'docs': [ISSUES[2]], 'autres': [ISSUES[3]]}
+    assert groups['frontmatter_issues'] == {'personnages': [ISSUES[4]]}
+    assert groups['other_issues'] == [ISSUES[5]]
+
+def test_count_and_group_by_type():
+    """Teste le comptage par niveau combiné au regroupement par type."""
+    error_count, warning_count, issues_by_type = _count_and_group_by_type(ISSUES)
+    
+    assert (error_count, warning_count) == (2, 3)
+    assert issues_by_type['broken_link'] == ISSUES[2:4]
+    assert sum(map(len, issues_by_type.values())) == len(ISSUES)
+
+def test_prioritize_issues():
+    """Teste l'ordre de priorité, stable pour les problèmes de même score."""
+    issues = [
+        {'type': 'broken_link', 'path': 'a.md', 'level': 'warning', 'message': "a"},
+        {'type': 'broken_link', 'path': 'b.md', 'level': 'warning', 'message': "b"},
+        {'type': 'missing_required', 'path': 'structure/plan.md', 'level': 'error', 'message': "c"},
+        {'type': 'inconnu', 'level': 'error', 'message': "d"},
+        {'type': 'broken_link', 'path': 'index.md', 'level': 'warning', 'message': "e"},
+    ]
+    
+    ordered = [issue['message'] for issue in prioritize_issues(issues)]
+    
+    assert ordered == ["c", "e", "a", "b", "d"]
+    assert prioritize_issues(issues, top_k=3) == prioritize_issues(issues)[:3]
+
+def test_generate_html_report_escapes():
+    """Teste l'échappement HTML des chemins et messages issus du projet."""
+    issues = [{'type': 'broken_link', 'path': '<b>.md', 'level': 'error',
+               'message': "Lien cassé dans <b>.md: 'a&b/<script>'"}]
+    
+    content = generate_html_report("roman", issues, output_file=None)
+    
+    assert content.count("<script>") == 1  # Seul le script du rapport lui-même
+    assert "&lt;b&gt;.md" in content
+    assert "a&amp;b/&lt;script&gt;" in content
+
+def test_present_correction_plan(capsys, monkeypatch):
+    """Teste l'approbation des étapes, silencieuse en mode non interactif."""
+    plan = generate_correction_plan(ISSUES)
+    
+    assert present_correction_plan(plan, interactive=False) == {i: True for i in range(1, len(plan) + 1)}
+    assert capsys.readouterr().out == ""
+    
+    answers = iter(['n'] + [''] * len(plan))
+    monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+    execution_plan = present_correction_plan(plan)
+    
+    assert execution_plan[1] is False
+    assert all(execution_plan[i] for i in range(2, len(plan) + 1))
+    assert "=== PLAN DE CORRECTION ===" in capsys.readouterr().out
+
+def test_generate_both_reports(tmp_path):
+    """Teste que les deux rapports écrits ensemble sont identiques aux rapports séparés."""
+    without_date = lambda content: re.sub(r"Date: [0-9: -]+", "", content)
+    markdown_path, html_path = generate_both_reports(tmp_path, ISSUES)
+    
+    with open(markdown_path, encoding="utf-8") as f:
+        assert without_date(f.read()) == without_date(generate_structure_report(tmp_path, ISSUES, output_file=None))
+    with open(html_path, encoding="utf-8") as f:
+        assert without_date(f.read()) == without_date(generate_html_report(tmp_path, ISSUES, output_file=None))
@@ -0,0 +1,83 @@
+import os
+
+from claude_edition_litteraire.structure.validator import (
+    check_broken_links, validate_structure, build_project_index, extract_frontmatter
+)
+
+def test_check_broken_links(tmp_path):
+    """Teste la détection des liens wiki et markdown cassés, liens wiki en premier."""
+    (tmp_path / "chapitres").mkdir()
+    (tmp_path / "chapitres" / "ch1.md").write_text("# Chapitre 1", encoding="utf-8")
+    (tmp_path / "index.md").write_text(
+        "[Deux](chapitres/ch2.md) [[chapitres/ch1|Un]] [[absent]] "
+        "[web](https://example.com) [[#ancre]] [Un](chapitres/ch1.md#debut)",
+        encoding="utf-8"
+    )
+    
+    issues = check_broken_links(tmp_path)
+    
+    assert [issue['link'] for issue in issues] == ["absent", os.path.join("chapitres", "ch2.md")]
+    assert all(issue['path'] == "index.md" for issue in issues)
+
+def test_validate_structure_probe(tmp_path):
+    """Teste la validation de structure sur disque, liens symboliques compris."""
+    structure = {
+        'chapitres': {'type': 'dir', 'required': True},
+        'notes.md': {'type': 'file', 'required': True},
+        'references': {
+            'type': 'dir',
+            'required': True,
+            'children': {'index.md': {'type': 'file', 'required': True}}
+        },
+        'lieux': {
+            'type': 'dir',
+            'required': False,
+            'children': {'reels': {'type': 'dir', 'required': False}}
+        }
+    }
+    (tmp_path / "vrai").mkdir()
+    (tmp_path / "chapitres").symlink_to(tmp_path / "vrai")
+    (tmp_path / "notes.md").symlink_to(tmp_path / "absent.md")
+    (tmp_path / "references").write_text("fichier", encoding="utf-8")
+    
+    issues = validate_structure(tmp_path, structure)
+    
+    assert [(issue['type'], issue['path']) for issue in issues] == [
+        ('missing_required', 'notes.md'),
+        ('type_mismatch', 'references'),
+        ('missing_optional', 'lieux')
+    ]
+
+def test_project_index_read_shared(tmp_path):
+    """Teste que le contenu d'un fichier n'est lu qu'une fois par inventaire."""
+    (tmp_path / "index.md").write_text("[[absent]]", encoding="utf-8")
+    index = build_project_index(tmp_path)
+    
+    content = index.read("index.md")
+    (tmp_path / "index.md").write_text("modifié", encoding="utf-8")
+    
+    assert index.subset(["index.md"]).read("index.md") is content
+    assert [issue['link'] for issue in check_broken_links(tmp_path, index=index)] == ["absent"]
+
+def test_extract_frontmatter_flat_and_yaml(tmp_path):
+    """Teste que le frontmatter plat donne le même résultat que l'analyse YAML."""
+    flat = tmp_path / "flat.md"
+    flat.write_text("---\nnom: Alice\ntags: personnage, mortel\ncitation:\n---\nTexte", encoding="utf-8")
+    typed = tmp_path / "typed.md"
+    typed.write_text("---\nnom: Bob\nactif: yes\ntags: 123\n---\n", encoding="utf-8")
+    
+    assert extract_frontmatter(flat) == (
+        {'nom': 'Alice', 'tags': 'personnage, mortel', 'citation': None}, "Texte"
+    )
+    assert extract_frontmatter(typed) == ({'nom': 'Bob', 'actif': True, 'tags': 123}, "")
+
+def test_build_project_index_skips_tool_dirs(tmp_path):
+    """Teste que les dossiers cachés, d'export et d'outils ne sont pas parcourus."""
+    for rel_dir in ("chapitres", ".obsidian", "export", "node_modules/pkg", "venv"):
+        (tmp_path / rel_dir).mkdir(parents=True)
+        (tmp_path / rel_dir / "note.md").write_text("[[absent]]", encoding="utf-8")
+    
+    index = build_project_index(tmp_path)
+    
+    assert index.md_files == [os.path.join("chapitres", "note.md")]
+    assert index.entries["node_modules"] is True
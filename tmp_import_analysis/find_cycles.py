@@ -1,46 +1,41 @@
 import sys
-from collections import defaultdict
 
-def find_cycles(graph):
-    """Trouve les cycles dans un graphe dirigé."""
-    visited = set()
-    path = []
-    path_set = set()
-    cycles = []
-    
-    def dfs(node):
-        if node in path_set:
-            # Cycle trouvé
-            cycle_start = path.index(node)
-            cycles.append(path[cycle_start:] + [node])
-            return
-        
-        if node in visited:
-            return
-        
-        visited.add(node)
-        path.append(node)
-        path_set.add(node)
-        
-        for neighbor in graph.get(node, []):
-            dfs(neighbor)
-        
-        path.pop()
-        path_set.remove(node)
-    
+from graph import sccs
+
+def cycle_in_component(graph, component):
+    """Retourne le plus court cycle passant par la racine d'une composante."""
+    start = component[-1]
+    members = set(component)
+    previous = {start: None}
+    queue = [start]
+    for node in queue:
+        for neighbor in graph.get(node, ()):
+            if neighbor == start:
+                path = [node]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])
+                path.reverse()
+                return path + [start]
+            if neighbor in members and neighbor not in previous:
+                previous[neighbor] = node
+                queue.append(neighbor)
+    return None
+
+def find_cycles(graph_file):
+    """Trouve les cycles dans le graphe d'imports décrit par un fichier."""
     # Construire le graphe à partir du fichier
-    adj_list = defaultdict(list)
-    with open(sys.argv[1], 'r') as f:
+    graph = {}
+    with open(graph_file, 'r', buffering=1 << 20) as f:
         for line in f:
-            line = line.strip()
-            if ' -> ' in line:
-                source, target = line.split(' -> ')
-                adj_list[source].append(target)
+            source, sep, target = line.strip().partition(' -> ')
+            if sep:
+                graph.setdefault(source, []).append(target)
     
-    # Rechercher les cycles à partir de chaque nœud
-    for node in adj_list:
-        if node not in visited:
-            dfs(node)
+    # Un cycle par composante de plusieurs modules, ou par module qui s'importe lui-même
+    cycles = []
+    for component in sccs(graph):
+        if len(component) > 1 or component[0] in graph.get(component[0], ()):
+            cycles.append(cycle_in_component(graph, component))
     
     return cycles
 
@@ -1,64 +1,68 @@
 import os
 import sys
-from collections import defaultdict
+
+from graph import sccs
 
 def generate_report():
     """Génère un rapport détaillé des imports."""
     
     # Construire le graphe à partir du fichier
-    graph = defaultdict(list)
-    reverse_graph = defaultdict(list)
+    graph = {}
+    reverse_graph = {}
     
-    with open("./tmp_import_analysis/import_graph.txt", 'r') as f:
+    # Graphes direct et inverse construits en un seul passage
+    with open("./tmp_import_analysis/import_graph.txt", 'r', buffering=1 << 20) as f:
         for line in f:
-            line = line.strip()
-            if ' -> ' in line:
-                source, target = line.split(' -> ')
-                graph[source].append(target)
-                reverse_graph[target].append(source)
+            source, sep, target = line.strip().partition(' -> ')
+            if sep:
+                graph.setdefault(source, []).append(target)
+                reverse_graph.setdefault(target, []).append(source)
     
-    # Identifier les modules problématiques
-    problematic_modules = set()
-    for source in graph:
-        for target in graph[source]:
-            if source in reverse_graph.get(target, []):
-                problematic_modules.add(source)
-                problematic_modules.add(target)
+    # Identifier les modules problématiques: ceux qui appartiennent à un cycle
+    # (composante fortement connexe de plusieurs modules, ou import de soi-même)
+    problematic_modules = {
+        module
+        for component in sccs(graph)
+        if len(component) > 1 or component[0] in graph.get(component[0], ())
+        for module in component
+    }
     
-    # Générer le rapport
-    with open("import_cycles_report.md", 'w') as f:
-        f.write("# Analyse des Cycles d'Imports\n\n")
-        
-        if not problematic_modules:
-            f.write("📊 **Aucun cycle d'import détecté !** 🎉\n")
-            return
-        
-        f.write(f"## Modules problématiques ({len(problematic_modules)})\n\n")
+    # Générer le rapport en mémoire, puis l'écrire en une fois
+    lines = ["# Analyse des Cycles d'Imports", ""]
+    
+    if not problematic_modules:
+        lines.append("📊 **Aucun cycle d'import détecté !** 🎉")
+    else:
+        lines += [f"## Modules problématiques ({len(problematic_modules)})", ""]
         
         for module in sorted(problematic_modules):
-            f.write(f"### {module}\n\n")
-            f.write("#### Importe:\n")
-            for target in sorted(graph.get(module, [])):
-                if target in problematic_modules:
-                    f.write(f"- **{target}** ⚠️\n")
-                else:
-                    f.write(f"- {target}\n")
+            lines += [f"### {module}", "", "#### Importe:"]
+            lines.extend(
+                f"- **{target}** ⚠️" if target in problematic_modules else f"- {target}"
+                for target in sorted(graph.get(module, []))
+            )
             
-            f.write("\n#### Importé par:\n")
-            for source in sorted(reverse_graph.get(module, [])):
-                if source in problematic_modules:
-                    f.write(f"- **{source}** ⚠️\n")
-                else:
-                    f.write(f"- {source}\n")
+            lines += ["", "#### Importé par:"]
+            lines.extend(
+                f"- **{source}** ⚠️" if source in problematic_modules else f"- {source}"
+                for source in sorted(reverse_graph.get(module, []))
+            )
             
-            f.write("\n")
+            lines.append("")
         
-        f.write("## Recommandations\n\n")
-        f.write("Pour résoudre les cycles d'imports:\n\n")
-        f.write("1. Utiliser l'import tardif (lazy import) dans les méthodes plutôt qu'au niveau du module\n")
-        f.write("2. Restructurer en déplaçant certaines fonctionnalités vers des modules intermédiaires\n")
-        f.write("3. Implémenter un pattern d'injection de dépendances\n")
-        f.write("4. Utiliser des interfaces abstraites\n")
+        lines += [
+            "## Recommandations",
+            "",
+            "Pour résoudre les cycles d'imports:",
+            "",
+            "1. Utiliser l'import tardif (lazy import) dans les méthodes plutôt qu'au niveau du module",
+            "2. Restructurer en déplaçant certaines fonctionnalités vers des modules intermédiaires",
+            "3. Implémenter un pattern d'injection de dépendances",
+            "4. Utiliser des interfaces abstraites",
+        ]
+    
+    with open("import_cycles_report.md", 'w') as f:
+        f.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     generate_report()